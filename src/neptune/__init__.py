@@ -88,6 +88,7 @@ to the `api_token` argument when initializing Neptune.
 
 Learn more in the docs: https://docs.neptune.ai/api/neptune/
 """
+
 __all__ = [
     "ANONYMOUS_API_TOKEN",
     "init_model",
@@ -101,21 +102,56 @@ __all__ = [
     "__version__",
 ]
 
+import importlib
+from typing import TYPE_CHECKING
 
-from neptune.common.patches import apply_patches
 from neptune.constants import ANONYMOUS_API_TOKEN
-from neptune.metadata_containers import (
-    Model,
-    ModelVersion,
-    Project,
-    Run,
-)
 from neptune.version import __version__
 
-# Apply patches of external libraries
-apply_patches()
-
-init_run = Run
-init_model = Model
-init_model_version = ModelVersion
-init_project = Project
+if TYPE_CHECKING:
+    from neptune.metadata_containers import (
+        Model,
+        ModelVersion,
+        Project,
+        Run,
+    )
+
+    init_run = Run
+    init_model = Model
+    init_model_version = ModelVersion
+    init_project = Project
+
+# Metadata containers pull in bravado, the backends and most of the package, so they are imported on first use
+_METADATA_CONTAINERS = {
+    "Run": "Run",
+    "Model": "Model",
+    "ModelVersion": "ModelVersion",
+    "Project": "Project",
+    "init_run": "Run",
+    "init_model": "Model",
+    "init_model_version": "ModelVersion",
+    "init_project": "Project",
+}
+
+
+def __getattr__(name: str):
+    if name in _METADATA_CONTAINERS:
+        import neptune.metadata_containers as metadata_containers
+
+        value = getattr(metadata_containers, _METADATA_CONTAINERS[name])
+        globals()[name] = value
+        return value
+
+    # Subpackages such as `neptune.types` or `neptune.utils` used to be bound by the eager imports
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -31,6 +31,7 @@ __all__ = [
     "StringSeries",
     "StringSet",
     "create_attribute_from_type",
+    "get_attribute_class",
 ]
 
 
@@ -53,4 +54,7 @@ from .series import (
     StringSeries,
 )
 from .sets import StringSet
-from .utils import create_attribute_from_type
+from .utils import (
+    create_attribute_from_type,
+    get_attribute_class,
+)
@@ -21,11 +21,11 @@ from typing import (
 )
 
 from neptune.exceptions import TypeDoesNotSupportAttributeException
-from neptune.internal.backends.neptune_backend import NeptuneBackend
 from neptune.internal.operation import Operation
 from neptune.types.value_copy import ValueCopy
 
 if TYPE_CHECKING:
+    from neptune.internal.backends.neptune_backend import NeptuneBackend
     from neptune.internal.container_type import ContainerType
     from neptune.metadata_containers import MetadataContainer
 
@@ -45,7 +45,7 @@ class Attribute:
         self._container._op_processor.enqueue_operation(operation, wait=wait)
 
     @property
-    def _backend(self) -> NeptuneBackend:
+    def _backend(self) -> "NeptuneBackend":
         return self._container._backend
 
     @property
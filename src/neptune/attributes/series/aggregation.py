@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SeriesAggregator"]
+
+import math
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from neptune.internal.operation import LogSeriesValue
+
+
+class SeriesAggregator:
+    """
+    Aggregates values of a float series over windows of time or steps, so that one point is logged per window.
+
+    Windows are aligned, e.g. with `window=10` a value logged at 12.5 seconds of Unix time belongs to the window
+    [10, 20). A window is closed, and its point returned, when a value of another window arrives, or when the
+    aggregator is flushed. The point has the statistic of the values of the window, and the step and timestamp
+    of the last of them. Only the running statistics of the current window are kept, whatever its size.
+    """
+
+    STATISTICS = ("mean", "min", "max", "last", "count")
+
+    __slots__ = (
+        "statistic",
+        "window",
+        "step_window",
+        "_index",
+        "_count",
+        "_sum",
+        "_min",
+        "_max",
+        "_last_value",
+        "_last_step",
+        "_last_ts",
+    )
+
+    def __init__(self, statistic: str = "mean", *, window: Optional[float] = None, step_window: Optional[float] = None):
+        if statistic not in self.STATISTICS:
+            raise ValueError(f"Unknown statistic '{statistic}', expected one of: {', '.join(self.STATISTICS)}")
+        if (window is None) == (step_window is None):
+            raise ValueError("Exactly one of 'window' and 'step_window' must be given")
+        if (window if window is not None else step_window) <= 0:
+            raise ValueError("Aggregation window must be positive")
+        self.statistic = statistic
+        self.window = window
+        self.step_window = step_window
+        self._index: Optional[int] = None
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._last_value = 0.0
+        self._last_step: Optional[float] = None
+        self._last_ts = 0.0
+
+    def add(self, values: Iterable[Tuple[float, Optional[float], float]]) -> List[LogSeriesValue[float]]:
+        """Adds (value, step, timestamp) tuples and returns the points of the windows they closed."""
+        points = []
+        for value, step, ts in values:
+            if self.window is not None:
+                index = math.floor(ts / self.window)
+            elif step is not None:
+                index = math.floor(step / self.step_window)
+            else:
+                raise ValueError("Aggregation over a step window requires a step for each value")
+            if index != self._index:
+                if self._count:
+                    points.append(self._close())
+                self._index = index
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+            self._last_value, self._last_step, self._last_ts = value, step, ts
+        return points
+
+    def flush(self) -> Optional[LogSeriesValue[float]]:
+        """Closes the current window and returns its point, if it has any value."""
+        self._index = None
+        return self._close()
+
+    def reset(self) -> None:
+        """Drops the values of the current window."""
+        self._index = None
+        self._close()
+
+    def _close(self) -> Optional[LogSeriesValue[float]]:
+        point = None
+        if self._count:
+            point = LogSeriesValue(self._statistic_value(), self._last_step, self._last_ts)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        return point
+
+    def _statistic_value(self) -> float:
+        if self.statistic == "mean":
+            return self._sum / self._count
+        if self.statistic == "min":
+            return self._min
+        if self.statistic == "max":
+            return self._max
+        if self.statistic == "count":
+            return float(self._count)
+        return self._last_value
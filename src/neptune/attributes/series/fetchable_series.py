@@ -13,15 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["FetchableSeries"]
+__all__ = ["FetchableSeries", "fetch_series_values"]
 
 import abc
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
-    Dict,
+    Callable,
     Generic,
     TypeVar,
-    Union,
 )
 
 from neptune.internal.backends.api_model import (
@@ -33,32 +32,80 @@ Row = TypeVar("Row", StringSeriesValues, FloatSeriesValues)
 
 
 class FetchableSeries(Generic[Row]):
+    _FETCH_PAGE_SIZE = 1000
+    _FETCH_MAX_WORKERS = 8
+    # NumPy dtype of the "value" column
+    _fetched_value_dtype = object
+
     @abc.abstractmethod
     def _fetch_values_from_backend(self, offset, limit) -> Row:
         pass
 
     def fetch_values(self, *, include_timestamp=True):
-        import pandas as pd
-
-        limit = 1000
-        val = self._fetch_values_from_backend(0, limit)
-        data = val.values
-        offset = limit
-
-        def make_row(entry: Row) -> Dict[str, Union[str, float, datetime]]:
-            row: Dict[str, Union[str, float, datetime]] = dict()
-            row["step"] = entry.step
-            row["value"] = entry.value
-            if include_timestamp:
-                row["timestamp"] = datetime.fromtimestamp(entry.timestampMillis / 1000)
-            return row
-
-        while offset < val.totalItemCount:
-            batch = self._fetch_values_from_backend(offset, limit)
-            data.extend(batch.values)
-            offset += limit
-
-        rows = dict((n, make_row(entry)) for (n, entry) in enumerate(data))
-
-        df = pd.DataFrame.from_dict(data=rows, orient="index")
-        return df
+        return fetch_series_values(
+            self._fetch_values_from_backend,
+            value_dtype=self._fetched_value_dtype,
+            include_timestamp=include_timestamp,
+            page_size=self._FETCH_PAGE_SIZE,
+            max_workers=self._FETCH_MAX_WORKERS,
+        )
+
+
+def fetch_series_values(
+    fetch_page: Callable[[int, int], Row],
+    *,
+    value_dtype=object,
+    include_timestamp: bool = True,
+    page_size: int = FetchableSeries._FETCH_PAGE_SIZE,
+    max_workers: int = FetchableSeries._FETCH_MAX_WORKERS,
+):
+    """Fetches all values of a series with `fetch_page(offset, limit)` and returns them as a pandas DataFrame"""
+    import numpy as np
+    import pandas as pd
+    from dateutil.tz import tzlocal
+
+    limit = page_size
+    first_page = fetch_page(0, limit)
+    total = first_page.totalItemCount
+
+    steps = np.empty(total, dtype=np.float64)
+    values = np.empty(total, dtype=value_dtype)
+    timestamps = np.empty(total, dtype=np.int64)
+    # the series may shrink while being fetched; the columns end at the first page that comes short
+    page_ends = []
+
+    def fill(offset: int, page: Row) -> None:
+        entries = page.values[: max(total - offset, 0)]
+        end = offset + len(entries)
+        steps[offset:end] = [entry.step for entry in entries]
+        values[offset:end] = [entry.value for entry in entries]
+        timestamps[offset:end] = [entry.timestampMillis for entry in entries]
+        page_ends.append((offset, end))
+
+    def fetch_and_fill(offset: int) -> None:
+        fill(offset, fetch_page(offset, limit))
+
+    fill(0, first_page)
+    # the total is known after the first page, so the remaining ones are fetched concurrently
+    offsets = range(page_ends[0][1], total, limit) if page_ends[0][1] > 0 else []
+    if len(offsets) == 1 or (len(offsets) > 1 and max_workers <= 1):
+        for offset in offsets:
+            fetch_and_fill(offset)
+    elif len(offsets) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(offsets)), thread_name_prefix="NeptuneFetchSeries"
+        ) as executor:
+            list(executor.map(fetch_and_fill, offsets))
+
+    size = total
+    for offset, end in sorted(page_ends):
+        if end < min(offset + limit, total):
+            size = end
+            break
+
+    columns = {"step": steps[:size], "value": values[:size]}
+    if include_timestamp:
+        columns["timestamp"] = (
+            pd.to_datetime(timestamps[:size], unit="ms", utc=True).tz_convert(tzlocal()).tz_localize(None)
+        )
+    return pd.DataFrame(columns)
@@ -24,11 +24,6 @@ from typing import (
     Optional,
 )
 
-from PIL import (
-    Image,
-    UnidentifiedImageError,
-)
-
 from neptune.attributes.series.series import Series
 from neptune.exceptions import (
     FileNotFound,
@@ -42,6 +37,7 @@ from neptune.internal.operation import (
 )
 from neptune.internal.types.file_types import FileType
 from neptune.internal.utils import base64_encode
+from neptune.internal.utils.download_manager import DownloadManager
 from neptune.internal.utils.limits import image_size_exceeds_limit_for_logging
 from neptune.types import File
 from neptune.types.series.file_series import FileSeries as FileSeriesVal
@@ -74,6 +70,11 @@ class FileSeries(Series[Val, Data, LogOperation], max_batch_size=1, operation_cl
 
     @staticmethod
     def _get_base64_image_content(file: File) -> str:
+        from PIL import (
+            Image,
+            UnidentifiedImageError,
+        )
+
         if file.file_type is FileType.LOCAL_FILE:
             if not os.path.exists(file.path):
                 raise FileNotFound(file.path)
@@ -100,10 +101,20 @@ class FileSeries(Series[Val, Data, LogOperation], max_batch_size=1, operation_cl
         item_count = self._backend.get_image_series_values(
             self._container_id, self._container_type, self._path, 0, 1
         ).totalItemCount
-        for i in range(0, item_count):
-            self._backend.download_file_series_by_index(
-                self._container_id, self._container_type, self._path, i, target_dir
-            )
+        # Images are stored as "<index>.<extension>" only once complete, so the ones downloaded
+        # by an interrupted call are not requested again
+        downloaded = {name.split(".")[0] for name in os.listdir(target_dir) if not name.endswith(".part")}
+        indices = [i for i in range(0, item_count) if str(i) not in downloaded]
+        with DownloadManager(total=len(indices)) as downloads:
+            for i in indices:
+                downloads.submit(
+                    self._backend.download_file_series_by_index,
+                    self._container_id,
+                    self._container_type,
+                    self._path,
+                    i,
+                    target_dir,
+                )
 
     def download_last(self, destination: Optional[str]):
         target_dir = self._get_destination(destination)
@@ -15,12 +15,16 @@
 #
 __all__ = ["FloatSeries"]
 
+from itertools import repeat
 from typing import (
+    TYPE_CHECKING,
     Iterable,
+    List,
     Optional,
     Union,
 )
 
+from neptune.attributes.series.aggregation import SeriesAggregator
 from neptune.attributes.series.fetchable_series import FetchableSeries
 from neptune.attributes.series.series import Series
 from neptune.internal.backends.api_model import FloatSeriesValues
@@ -28,11 +32,16 @@ from neptune.internal.operation import (
     ClearFloatLog,
     ConfigFloatSeries,
     LogFloats,
+    LogSeriesColumns,
     Operation,
 )
 from neptune.internal.utils import verify_type
+from neptune.internal.utils.iteration import get_batches
 from neptune.types.series.float_series import FloatSeries as FloatSeriesVal
 
+if TYPE_CHECKING:
+    from neptune.metadata_containers import MetadataContainer
+
 Val = FloatSeriesVal
 Data = Union[float, int]
 LogOperation = LogFloats
@@ -41,22 +50,119 @@ LogOperation = LogFloats
 class FloatSeries(
     Series[Val, Data, LogOperation], FetchableSeries[FloatSeriesValues], max_batch_size=100, operation_cls=LogOperation
 ):
+    _fetched_value_dtype = "float64"
+
+    def __init__(self, container: "MetadataContainer", path: List[str]):
+        super().__init__(container, path)
+        self._aggregator: Optional[SeriesAggregator] = None
+
     def configure(
         self,
         min: Optional[Union[float, int]] = None,
         max: Optional[Union[float, int]] = None,
         unit: Optional[str] = None,
         wait: bool = False,
+        *,
+        aggregate: Optional[str] = None,
+        window: Optional[Union[float, int]] = None,
+        step_window: Optional[Union[float, int]] = None,
     ) -> None:
-        verify_type("min", min, (float, int))
-        verify_type("max", max, (float, int))
-        verify_type("unit", unit, str)
+        # aggregation alone can be configured without changing the range and unit
+        configure_range = aggregate is None or (min, max, unit) != (None, None, None)
+        if configure_range:
+            verify_type("min", min, (float, int))
+            verify_type("max", max, (float, int))
+            verify_type("unit", unit, str)
+        with self._container.lock():
+            if aggregate is not None:
+                self.aggregate(aggregate, window=window, step_window=step_window)
+            if configure_range:
+                self._enqueue_operation(ConfigFloatSeries(self._path, min, max, unit), wait=wait)
+
+    def aggregate(
+        self,
+        statistic: Optional[str] = "mean",
+        *,
+        window: Optional[Union[float, int]] = None,
+        step_window: Optional[Union[float, int]] = None,
+    ) -> None:
+        """Logs one point per window of `window` seconds or `step_window` steps instead of every value.
+
+        The point has the `statistic` ("mean", "min", "max", "last" or "count") of the values logged in the window,
+        and is logged once a value of another window is logged, or on `wait()` and `stop()`.
+        `statistic=None` logs every value again.
+        """
+        verify_type("statistic", statistic, (str, type(None)))
+        verify_type("window", window, (float, int, type(None)))
+        verify_type("step_window", step_window, (float, int, type(None)))
+        aggregator = None
+        if statistic is not None:
+            aggregator = SeriesAggregator(statistic, window=window, step_window=step_window)
+        with self._container.lock():
+            self._flush_aggregation()
+            if self._aggregator is None and aggregator is not None:
+                self._container._aggregated_series.append(self)
+            elif self._aggregator is not None and aggregator is None:
+                self._container._aggregated_series.remove(self)
+            self._aggregator = aggregator
+
+    def assign(self, value, wait: bool = False) -> None:
+        with self._container.lock():
+            if self._aggregator is not None:
+                self._aggregator.reset()
+            super().assign(value, wait=wait)
+
+    def clear(self, *, wait: bool = False) -> None:
+        with self._container.lock():
+            if self._aggregator is not None:
+                self._aggregator.reset()
+            super().clear(wait=wait)
+
+    def _append_value(self, value: Val, wait: bool = False) -> None:
+        if self._aggregator is None:
+            return super()._append_value(value, wait=wait)
         with self._container.lock():
-            self._enqueue_operation(ConfigFloatSeries(self._path, min, max, unit), wait=wait)
+            for op in self._get_append_operations(value):
+                self._enqueue_operation(op, wait=wait)
+
+    def _get_append_operations(self, value: Val) -> List[LogOperation]:
+        """Returns the operations appending `value`; the caller enqueues them holding the container lock."""
+        if self._aggregator is None:
+            return self._get_log_operations_from_value(value)
+        if value.is_columnar:
+            values, steps, timestamps = LogSeriesColumns(value.values, value.steps, value.timestamps).as_lists()
+            points = self._aggregator.add(zip(values, steps if steps is not None else repeat(None), timestamps))
+        else:
+            points = self._aggregator.add(zip(value.values, value.steps, value.timestamps))
+        return [LogFloats(self._path, chunk) for chunk in get_batches(points, batch_size=self.max_batch_size)]
+
+    def _flush_aggregation(self, wait: bool = False) -> None:
+        """Logs the point of the current aggregation window, so that no logged value is left behind."""
+        with self._container.lock():
+            point = self._aggregator.flush() if self._aggregator is not None else None
+            if point is not None:
+                self._enqueue_operation(LogFloats(self._path, [point]), wait=wait)
 
     def _get_clear_operation(self) -> Operation:
         return ClearFloatLog(self._path)
 
+    def _get_log_operations_from_value(self, value: Val) -> List[LogOperation]:
+        if not value.is_columnar:
+            return super()._get_log_operations_from_value(value)
+        # batches are slices of the arrays, so no object is created per value
+        values, steps, timestamps = value.values, value.steps, value.timestamps
+        return [
+            LogFloats(
+                self._path,
+                LogSeriesColumns(
+                    values[start : start + self.max_batch_size],
+                    steps[start : start + self.max_batch_size] if steps is not None else None,
+                    timestamps[start : start + self.max_batch_size],
+                ),
+            )
+            for start in range(0, len(values), self.max_batch_size)
+        ]
+
     def _get_config_operation_from_value(self, value: Val) -> Optional[Operation]:
         return ConfigFloatSeries(self._path, value.min, value.max, value.unit)
 
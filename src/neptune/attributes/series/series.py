@@ -30,6 +30,7 @@ from neptune.attributes.attribute import Attribute
 from neptune.internal.operation import LogOperation
 from neptune.internal.utils import (
     is_collection,
+    is_numeric_array,
     is_stringify_value,
     verify_collection_type,
     verify_type,
@@ -88,7 +89,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         with self._container.lock():
             if config_op:
                 self._enqueue_operation(config_op, wait=False)
-            if not value.values:
+            if len(value.values) == 0:
                 self._enqueue_operation(clear_op, wait=wait)
             else:
                 self._enqueue_operation(clear_op, wait=False)
@@ -124,11 +125,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             timestamps = None if timestamp is None else [timestamp]
             value = self._data_to_value([value], steps=steps, timestamps=timestamps, **kwargs)
 
-        ops = self._get_log_operations_from_value(value)
-
-        with self._container.lock():
-            for op in ops:
-                self._enqueue_operation(op, wait=wait)
+        self._append_value(value, wait=wait)
 
     def extend(
         self,
@@ -139,17 +136,22 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         **kwargs,
     ) -> None:
         if steps is not None:
-            verify_collection_type("steps", steps, (float, int))
+            if not is_numeric_array(steps):
+                verify_collection_type("steps", steps, (float, int))
             if len(steps) != len(values):
                 raise ValueError(f"Number of steps must be equal to number of values ({len(steps)} != {len(values)}")
         if timestamps is not None:
-            verify_collection_type("timestamps", timestamps, (float, int))
+            if not is_numeric_array(timestamps):
+                verify_collection_type("timestamps", timestamps, (float, int))
             if len(timestamps) != len(values):
                 raise ValueError(
                     f"Number of timestamps must be equal to number of values ({len(timestamps)} != {len(values)}"
                 )
 
         value = self._data_to_value(values, steps=steps, timestamps=timestamps, **kwargs)
+        self._append_value(value, wait=wait)
+
+    def _append_value(self, value: ValTV, wait: bool = False) -> None:
         ops = self._get_log_operations_from_value(value)
 
         with self._container.lock():
@@ -13,11 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["create_attribute_from_type"]
+__all__ = ["create_attribute_from_type", "get_attribute_class"]
 
 from typing import (
     TYPE_CHECKING,
     List,
+    Type,
 )
 
 from neptune.attributes import (
@@ -63,15 +64,19 @@ _attribute_type_to_attr_class_map = {
 }
 
 
+def get_attribute_class(attribute_type: AttributeType) -> Type["Attribute"]:
+    try:
+        return _attribute_type_to_attr_class_map[attribute_type]
+    except KeyError:
+        raise InternalClientError(f"Unexpected type: {attribute_type}")
+
+
 def create_attribute_from_type(
     attribute_type: AttributeType,
     container: "MetadataContainer",
     path: List[str],
 ) -> "Attribute":
-    try:
-        return _attribute_type_to_attr_class_map[attribute_type](container, path)
-    except KeyError:
-        raise InternalClientError(f"Unexpected type: {attribute_type}")
+    return get_attribute_class(attribute_type)(container, path)
 
 
 def delayed_():
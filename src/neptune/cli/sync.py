@@ -44,7 +44,10 @@ from neptune.constants import (
     OFFLINE_DIRECTORY,
     OFFLINE_NAME_PREFIX,
 )
-from neptune.envs import NEPTUNE_SYNC_BATCH_TIMEOUT_ENV
+from neptune.envs import (
+    NEPTUNE_SYNC_BATCH_TIMEOUT_ENV,
+    NEPTUNE_SYNC_PREFETCH_DEPTH,
+)
 from neptune.exceptions import CannotSynchronizeOfflineRunsWithoutProject
 from neptune.internal.backends.api_model import (
     ApiExperiment,
@@ -58,9 +61,11 @@ from neptune.internal.id_formats import (
 )
 from neptune.internal.operation import Operation
 from neptune.internal.operation_processors.operation_storage import OperationStorage
+from neptune.internal.threading.prefetcher import Prefetcher
 from neptune.internal.utils.logger import logger
 
 retries_timeout = int(os.getenv(NEPTUNE_SYNC_BATCH_TIMEOUT_ENV, "3600"))
+prefetch_depth = int(os.getenv(NEPTUNE_SYNC_PREFETCH_DEPTH, "1"))
 
 
 class SyncRunner(AbstractBackendRunner):
@@ -88,38 +93,54 @@ class SyncRunner(AbstractBackendRunner):
             from_dict=Operation.from_dict,
             lock=threading.RLock(),
         ) as disk_queue:
+            prefetcher = Prefetcher(
+                lambda: disk_queue.get_batch(1000), depth=prefetch_depth, name="NeptuneSyncPrefetcher"
+            )
+            try:
+                self._sync_batches(prefetcher, disk_queue, container_id, container_type, operation_storage)
+            finally:
+                prefetcher.close()
+
+    def _sync_batches(
+        self,
+        prefetcher: Prefetcher,
+        disk_queue: DiskQueue,
+        container_id: UniqueId,
+        container_type: ContainerType,
+        operation_storage: OperationStorage,
+    ) -> None:
+        while True:
+            batch = prefetcher.get()
+            if not batch:
+                break
+            version = batch[-1].ver
+            batch = [element.obj for element in batch]
+
+            start_time = time.monotonic()
+            expected_count = len(batch)
+            version_to_ack = version - expected_count
             while True:
-                batch = disk_queue.get_batch(1000)
-                if not batch:
-                    break
-                version = batch[-1].ver
-                batch = [element.obj for element in batch]
-
-                start_time = time.monotonic()
-                expected_count = len(batch)
-                version_to_ack = version - expected_count
-                while True:
-                    try:
-                        processed_count, _ = self._backend.execute_operations(
-                            container_id=container_id,
-                            container_type=container_type,
-                            operations=batch,
-                            operation_storage=operation_storage,
-                        )
-                        version_to_ack += processed_count
-                        batch = batch[processed_count:]
-                        disk_queue.ack(version)
-                        if version_to_ack == version:
-                            break
-                    except NeptuneConnectionLostException as ex:
-                        if time.monotonic() - start_time > retries_timeout:
-                            raise ex
-                        logger.warning(
-                            "Experiencing connection interruptions."
-                            " Will try to reestablish communication with Neptune."
-                            " Internal exception was: %s",
-                            ex.cause.__class__.__name__,
-                        )
+                try:
+                    processed_count, _ = self._backend.execute_operations(
+                        container_id=container_id,
+                        container_type=container_type,
+                        operations=batch,
+                        operation_storage=operation_storage,
+                    )
+                    version_to_ack += processed_count
+                    batch = batch[processed_count:]
+                    disk_queue.ack(version)
+                    if version_to_ack == version:
+                        break
+                except NeptuneConnectionLostException as ex:
+                    if time.monotonic() - start_time > retries_timeout:
+                        raise ex
+                    logger.warning(
+                        "Experiencing connection interruptions."
+                        " Will try to reestablish communication with Neptune."
+                        " Internal exception was: %s",
+                        ex.cause.__class__.__name__,
+                    )
 
     def sync_all_registered_containers(self, base_path: Path) -> None:
         async_path = base_path / ASYNC_DIRECTORY
@@ -19,51 +19,140 @@ import re
 
 
 class CGroupFilesystemReader(object):
-    def __init__(self):
-        cgroup_memory_dir = self.__cgroup_mount_dir(subsystem="memory")
-        self.__memory_usage_file = os.path.join(cgroup_memory_dir, "memory.usage_in_bytes")
-        self.__memory_limit_file = os.path.join(cgroup_memory_dir, "memory.limit_in_bytes")
+    """
+    Reads resource usage and limits of the cgroup of the process from the cgroup v1 hierarchy, or from the unified
+    cgroup v2 one if no v1 memory and cpu controllers are mounted.
 
-        cgroup_cpu_dir = self.__cgroup_mount_dir(subsystem="cpu")
-        self.__cpu_period_file = os.path.join(cgroup_cpu_dir, "cpu.cfs_period_us")
-        self.__cpu_quota_file = os.path.join(cgroup_cpu_dir, "cpu.cfs_quota_us")
+    Files are sampled for the whole run, so they are opened once and read with `pread`, which does not depend on
+    the position of the file, and hence works for descriptors inherited by forked processes too.
+    """
 
-        cgroup_cpuacct_dir = self.__cgroup_mount_dir(subsystem="cpuacct")
-        self.__cpuacct_usage_file = os.path.join(cgroup_cpuacct_dir, "cpuacct.usage")
+    # What cgroup v1 reports as no memory limit
+    UNLIMITED_MEMORY_BYTES = 2**63 - 4096
+    NO_CPU_QUOTA = -1
+    DEFAULT_CPU_PERIOD_MICROS = 100000
+
+    def __init__(self, proc_mounts="/proc/mounts", proc_self_cgroup="/proc/self/cgroup"):
+        self.__fds = dict()
+        mounts = self.__read_mounts(proc_mounts)
+
+        memory_dir = self.__cgroup_v1_mount_dir(mounts, subsystem="memory")
+        cpu_dir = self.__cgroup_v1_mount_dir(mounts, subsystem="cpu")
+        cpuacct_dir = self.__cgroup_v1_mount_dir(mounts, subsystem="cpuacct")
+        unified_dir = next((mount_dir for mount_dir, fs_type, _ in mounts if fs_type == "cgroup2"), None)
+
+        if memory_dir and cpu_dir and cpuacct_dir:
+            self.version = 1
+            self.__memory_usage_file = os.path.join(memory_dir, "memory.usage_in_bytes")
+            self.__memory_limit_file = os.path.join(memory_dir, "memory.limit_in_bytes")
+            self.__cpu_period_file = os.path.join(cpu_dir, "cpu.cfs_period_us")
+            self.__cpu_quota_file = os.path.join(cpu_dir, "cpu.cfs_quota_us")
+            self.__cpuacct_usage_file = os.path.join(cpuacct_dir, "cpuacct.usage")
+        elif unified_dir:
+            self.version = 2
+            unified_dir = self.__cgroup_v2_dir(unified_dir, proc_self_cgroup)
+            self.__memory_usage_file = os.path.join(unified_dir, "memory.current")
+            self.__memory_limit_file = os.path.join(unified_dir, "memory.max")
+            self.__cpu_max_file = os.path.join(unified_dir, "cpu.max")
+            self.__cpu_stat_file = os.path.join(unified_dir, "cpu.stat")
+        else:
+            raise OSError("Mount directories of cgroup memory and cpu controllers not found")
 
     def get_memory_usage_in_bytes(self):
-        return self.__read_int_file(self.__memory_usage_file)
+        return int(self.__read(self.__memory_usage_file))
 
     def get_memory_limit_in_bytes(self):
-        return self.__read_int_file(self.__memory_limit_file)
+        if self.version == 1:
+            return int(self.__read(self.__memory_limit_file))
+        # the root cgroup has no limit files
+        limit = self.__read(self.__memory_limit_file, default=b"max")
+        return self.UNLIMITED_MEMORY_BYTES if limit.strip() == b"max" else int(limit)
 
     def get_cpu_quota_micros(self):
-        return self.__read_int_file(self.__cpu_quota_file)
+        if self.version == 1:
+            return int(self.__read(self.__cpu_quota_file))
+        quota = self.__read_cpu_max()[0]
+        return self.NO_CPU_QUOTA if quota == b"max" else int(quota)
 
     def get_cpu_period_micros(self):
-        return self.__read_int_file(self.__cpu_period_file)
+        if self.version == 1:
+            return int(self.__read(self.__cpu_period_file))
+        return int(self.__read_cpu_max()[1])
 
     def get_cpuacct_usage_nanos(self):
-        return self.__read_int_file(self.__cpuacct_usage_file)
+        if self.version == 1:
+            return int(self.__read(self.__cpuacct_usage_file))
+        for line in self.__read(self.__cpu_stat_file).splitlines():
+            key, value = line.split()
+            if key == b"usage_usec":
+                return int(value) * 1000
+        raise ValueError("No usage_usec in {}".format(self.__cpu_stat_file))
+
+    def close(self):
+        fds, self.__fds = self.__fds, dict()
+        for fd in fds.values():
+            os.close(fd)
 
-    def __read_int_file(self, filename):
-        with open(filename) as f:
-            return int(f.read())
+    def __del__(self):
+        self.close()
 
-    def __cgroup_mount_dir(self, subsystem):
+    def __read_cpu_max(self):
         """
-        :param subsystem: cgroup subsystem like memory, cpu
-        :return: directory where given subsystem is mounted
+        :return: quota and period, as in "max 100000" or "50000 100000"
+        """
+        fields = self.__read(self.__cpu_max_file, default=b"max").split()
+        return fields[0], fields[1] if len(fields) > 1 else self.DEFAULT_CPU_PERIOD_MICROS
+
+    def __read(self, filename, default=None):
+        fd = self.__fds.get(filename)
+        if fd is None:
+            try:
+                fd = self.__fds[filename] = os.open(filename, os.O_RDONLY)
+            except FileNotFoundError:
+                if default is None:
+                    raise
+                return default
+        return os.pread(fd, 4096, 0)
+
+    @staticmethod
+    def __read_mounts(proc_mounts):
+        """
+        :return: mount directory, filesystem type and options of each mounted filesystem
         """
-        with open("/proc/mounts", "r") as f:
+        mounts = []
+        with open(proc_mounts, "r") as f:
             for line in f.readlines():
-                split_line = re.split(r"\s+", line)
-                mount_dir = split_line[1]
+                split_line = re.split(r"\s+", line.strip())
+                if len(split_line) >= 4:
+                    mounts.append((split_line[1], split_line[2], split_line[3].split(",")))
+        return mounts
 
-                if "cgroup" in mount_dir:
-                    dirname = mount_dir.split("/")[-1]
-                    subsystems = dirname.split(",")
-                    if subsystem in subsystems:
-                        return mount_dir
+    @staticmethod
+    def __cgroup_v1_mount_dir(mounts, subsystem):
+        """
+        :param subsystem: cgroup subsystem like memory, cpu
+        :return: directory where given subsystem is mounted, if any
+        """
+        for mount_dir, fs_type, options in mounts:
+            if fs_type == "cgroup":
+                subsystems = mount_dir.split("/")[-1].split(",")
+                if subsystem in options or subsystem in subsystems:
+                    return mount_dir
+        return None
 
-        assert False, 'Mount directory for "{}" subsystem not found'.format(subsystem)
+    @staticmethod
+    def __cgroup_v2_dir(mount_dir, proc_self_cgroup):
+        """
+        :return: directory of the cgroup of the process, which is the mount directory itself
+            if the process runs in its own cgroup namespace, as in containers
+        """
+        try:
+            with open(proc_self_cgroup, "r") as f:
+                for line in f.readlines():
+                    hierarchy_id, _, path = line.strip().split(":", 2)
+                    if hierarchy_id == "0":
+                        cgroup_dir = os.path.join(mount_dir, path.lstrip("/"))
+                        return cgroup_dir if os.path.isdir(cgroup_dir) else mount_dir
+        except (OSError, ValueError):
+            pass
+        return mount_dir
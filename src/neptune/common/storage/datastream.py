@@ -17,10 +17,15 @@ import dataclasses
 import io
 import math
 import os
+import queue
 import tarfile
+import threading
+import zlib
 from typing import (
     Any,
     Generator,
+    Iterable,
+    Iterator,
     Optional,
 )
 
@@ -85,6 +90,110 @@ def compress_to_tar_gz_in_memory(upload_entries) -> bytes:
         for entry in upload_entries:
             archive.add(name=entry.source, arcname=entry.target_path, recursive=True)
 
-    f.seek(0)
-    data = f.read()
-    return data
+    return f.getvalue()
+
+
+DEFAULT_COMPRESSION_LEVEL = 6
+TAR_GZ_STREAM_CHUNK_SIZE = 1024 * 1024
+TAR_GZ_STREAM_MAX_PENDING_CHUNKS = 4
+
+_END_OF_STREAM = object()
+
+
+class _StreamCancelled(Exception):
+    pass
+
+
+class _GzipPipeWriter:
+    """File object the tar archive is written to; gzips the data and passes it to the reader in chunks."""
+
+    def __init__(self, pipe: queue.Queue, cancelled: threading.Event, compression_level: int, chunk_size: int):
+        self._pipe = pipe
+        self._cancelled = cancelled
+        # 16 + MAX_WBITS makes zlib write gzip headers, so the result is the same format as "w|gz" produces
+        self._compressor = zlib.compressobj(compression_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += self._compressor.compress(data)
+        if len(self._buffer) >= self._chunk_size:
+            self._send_buffer()
+        return len(data)
+
+    def finish(self) -> None:
+        self._buffer += self._compressor.flush()
+        self._send_buffer()
+        self.put(_END_OF_STREAM)
+
+    def put(self, item) -> None:
+        while True:
+            if self._cancelled.is_set():
+                raise _StreamCancelled()
+            try:
+                self._pipe.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _send_buffer(self) -> None:
+        if self._buffer:
+            self.put(bytes(self._buffer))
+            self._buffer = bytearray()
+
+
+def _write_tar_gz(upload_entries: Iterable, writer: _GzipPipeWriter) -> None:
+    try:
+        with tarfile.TarFile.open(fileobj=writer, mode="w|", dereference=True) as archive:
+            for entry in upload_entries:
+                archive.add(name=entry.source, arcname=entry.target_path, recursive=True)
+        writer.finish()
+    except _StreamCancelled:
+        pass
+    except Exception as e:
+        try:
+            writer.put(e)
+        except _StreamCancelled:
+            pass
+
+
+def stream_tar_gz(
+    upload_entries: Iterable,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    chunk_size: int = TAR_GZ_STREAM_CHUNK_SIZE,
+) -> Generator[bytes, None, None]:
+    """
+    Yields a tar.gz archive of upload entries chunk by chunk. The archive is built in a background thread
+    while the chunks are consumed, and at most a few chunks are kept in memory.
+    Compression level 0 stores the data as is, which is the cheapest choice for already compressed files.
+    """
+    pipe = queue.Queue(maxsize=TAR_GZ_STREAM_MAX_PENDING_CHUNKS)
+    cancelled = threading.Event()
+    writer = _GzipPipeWriter(pipe, cancelled, compression_level, chunk_size)
+    thread = threading.Thread(target=_write_tar_gz, args=(upload_entries, writer), name="NeptuneTarGz", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = pipe.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
+        thread.join()
+
+
+class TarGzStream:
+    """
+    Iterable request body streaming a tar.gz archive of upload entries.
+    Every iteration builds the archive from scratch, so a request can be retried.
+    """
+
+    def __init__(self, upload_entries: Iterable, compression_level: int = DEFAULT_COMPRESSION_LEVEL):
+        self._upload_entries = list(upload_entries)
+        self._compression_level = compression_level
+
+    def __iter__(self) -> Iterator[bytes]:
+        return stream_tar_gz(self._upload_entries, self._compression_level)
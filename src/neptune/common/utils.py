@@ -23,9 +23,6 @@ import re
 import ssl
 import sys
 
-import numpy as np
-import pandas as pd
-
 from neptune.common import envs
 from neptune.common.exceptions import (
     FileNotFound,
@@ -103,6 +100,8 @@ def get_channel_name_stems(columns):
 
 
 def merge_dataframes(dataframes, on, how="outer"):
+    import pandas as pd
+
     merged_df = functools.reduce(lambda left, right: pd.merge(left, right, on=on, how=how), dataframes)
     return merged_df
 
@@ -129,6 +128,9 @@ def is_notebook():
 
 
 def _split_df_by_stems(df):
+    import numpy as np
+    import pandas as pd
+
     channel_dfs, x_vals = [], []
     for stem in get_channel_name_stems(df.columns):
         channel_df = df[["x_{}".format(stem), "y_{}".format(stem)]]
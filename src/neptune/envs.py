@@ -28,6 +28,16 @@ __all__ = [
     "NEPTUNE_FETCH_TABLE_STEP_SIZE",
     "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT",
     "NEPTUNE_REQUEST_TIMEOUT",
+    "NEPTUNE_DISK_QUEUE_FORMAT",
+    "NEPTUNE_DISK_QUEUE_DURABILITY",
+    "NEPTUNE_SYNC_PREFETCH_DEPTH",
+    "NEPTUNE_UPLOAD_MAX_WORKERS",
+    "NEPTUNE_UPLOAD_MAX_CONNECTIONS_PER_HOST",
+    "NEPTUNE_FILE_SET_COMPRESSION_LEVEL",
+    "NEPTUNE_FETCH_CACHE_MAX_SIZE",
+    "NEPTUNE_FETCH_CACHE_VALIDATION_INTERVAL",
+    "NEPTUNE_DOWNLOAD_MAX_WORKERS",
+    "NEPTUNE_SWAGGER_SPEC_CACHE_TTL",
 ]
 
 from neptune.common.envs import (
@@ -59,4 +69,24 @@ NEPTUNE_SYNC_AFTER_STOP_TIMEOUT = "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT"
 
 NEPTUNE_REQUEST_TIMEOUT = "NEPTUNE_REQUEST_TIMEOUT"
 
+NEPTUNE_DISK_QUEUE_FORMAT = "NEPTUNE_DISK_QUEUE_FORMAT"
+
+NEPTUNE_DISK_QUEUE_DURABILITY = "NEPTUNE_DISK_QUEUE_DURABILITY"
+
+NEPTUNE_SYNC_PREFETCH_DEPTH = "NEPTUNE_SYNC_PREFETCH_DEPTH"
+
+NEPTUNE_UPLOAD_MAX_WORKERS = "NEPTUNE_UPLOAD_MAX_WORKERS"
+
+NEPTUNE_UPLOAD_MAX_CONNECTIONS_PER_HOST = "NEPTUNE_UPLOAD_MAX_CONNECTIONS_PER_HOST"
+
+NEPTUNE_FILE_SET_COMPRESSION_LEVEL = "NEPTUNE_FILE_SET_COMPRESSION_LEVEL"
+
+NEPTUNE_FETCH_CACHE_MAX_SIZE = "NEPTUNE_FETCH_CACHE_MAX_SIZE"
+
+NEPTUNE_FETCH_CACHE_VALIDATION_INTERVAL = "NEPTUNE_FETCH_CACHE_VALIDATION_INTERVAL"
+
+NEPTUNE_DOWNLOAD_MAX_WORKERS = "NEPTUNE_DOWNLOAD_MAX_WORKERS"
+
+NEPTUNE_SWAGGER_SPEC_CACHE_TTL = "NEPTUNE_SWAGGER_SPEC_CACHE_TTL"
+
 S3_ENDPOINT_URL = "S3_ENDPOINT_URL"
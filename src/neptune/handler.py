@@ -51,6 +51,7 @@ from neptune.internal.utils import (
     is_dict_like,
     is_float,
     is_float_like,
+    is_numeric_array,
     is_string,
     is_stringify_value,
     verify_collection_type,
@@ -446,6 +447,41 @@ class Handler(SupportsNamespaces):
 
             attr.extend(values, steps=steps, timestamps=timestamps, wait=wait, **kwargs)
 
+    @check_protected_paths
+    def aggregate(
+        self,
+        statistic: Optional[str] = "mean",
+        *,
+        window: Optional[Union[float, int]] = None,
+        step_window: Optional[Union[float, int]] = None,
+    ) -> None:
+        """Makes a `FloatSeries` field log one aggregated point per window instead of every appended value.
+
+        Useful for metrics logged at a high frequency, as it reduces the number of points sent to Neptune.
+        The point of the last window is logged on `wait()` and `stop()`.
+
+        Args:
+            statistic: Statistic of the values in a window to log: "mean", "min", "max", "last" or "count".
+                If None, every appended value is logged again.
+            window: Length of the windows in seconds.
+            step_window: Length of the windows in steps. Each appended value must have a step.
+
+        Example:
+            >>> import neptune
+            >>> run = neptune.init_run()
+            >>> run["train/batch/loss"].aggregate("mean", window=1.0)
+            >>> for batch in batches:
+            ...     run["train/batch/loss"].append(loss)  # logs the mean loss of each second
+        """
+        with self._container.lock():
+            attr = self._container.get_attribute(self._path)
+            if attr is None:
+                attr = FloatSeries(self._container, parse_path(self._path))
+                attr.aggregate(statistic, window=window, step_window=step_window)
+                self._container.set_attribute(self._path, attr)
+            else:
+                attr.aggregate(statistic, window=window, step_window=step_window)
+
     @check_protected_paths
     def add(self, values: Union[str, Iterable[str]], *, wait: bool = False) -> None:
         """Adds the provided tag or tags to the run's tags.
@@ -725,7 +761,7 @@ class ExtendUtils:
         if isinstance(values, Namespace) or is_dict_like(values):
             for val in values.values():
                 yield from ExtendUtils.generate_leaf_collection_lengths(val)
-        elif is_collection(values):
+        elif is_collection(values) or is_numeric_array(values):
             yield len(values)
         else:
             raise NeptuneUserApiInputException("Values must be a collection or Namespace leafs must be collections")
@@ -20,8 +20,6 @@ import typing
 from datetime import datetime
 from urllib.parse import urlparse
 
-from botocore.exceptions import NoCredentialsError
-
 from neptune.exceptions import (
     NeptuneRemoteStorageAccessException,
     NeptuneRemoteStorageCredentialsException,
@@ -70,6 +68,8 @@ class S3ArtifactDriver(ArtifactDriver):
                 f"Wildcard characters (*,?) in location URI ({path}) are not supported."
             )
 
+        from botocore.exceptions import NoCredentialsError
+
         remote_storage = get_boto_s3_client().Bucket(bucket_name)
 
         stored_files: typing.List[ArtifactFileData] = list()
@@ -116,6 +116,8 @@ class S3ArtifactDriver(ArtifactDriver):
         url = urlparse(location)
         bucket_name, path = url.netloc, url.path.lstrip("/")
 
+        from botocore.exceptions import NoCredentialsError
+
         remote_storage = get_boto_s3_client()
         try:
             bucket = remote_storage.Bucket(bucket_name)
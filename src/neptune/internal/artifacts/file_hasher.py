@@ -18,6 +18,7 @@ __all__ = ["FileHasher"]
 import datetime
 import hashlib
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from neptune.internal.artifacts.local_file_hash_storage import LocalFileHashStorage
@@ -39,26 +40,68 @@ class FileHasher:
 
     @classmethod
     def get_local_file_hash(cls, file_path: typing.Union[str, Path]) -> str:
+        return cls.get_local_file_hashes([file_path])[0]
+
+    @classmethod
+    def get_local_file_hashes(cls, file_paths: typing.Iterable[typing.Union[str, Path]]) -> typing.List[str]:
+        absolute_paths = [Path(file_path).resolve() for file_path in file_paths]
+        current = []
+        for absolute in absolute_paths:
+            stat = absolute.stat()
+            current.append(
+                LocalFileHashStorage.LocalFileHash(
+                    file_path=str(absolute),
+                    file_hash="",
+                    modification_date=datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%Y%m%d_%H%M%S%f"),
+                    size=stat.st_size,
+                    inode=stat.st_ino,
+                )
+            )
+
         local_storage = LocalFileHashStorage()
+        try:
+            stored_file_hashes = local_storage.fetch_many(absolute_paths)
 
-        absolute = Path(file_path).resolve()
-        modification_date = datetime.datetime.fromtimestamp(absolute.stat().st_mtime).strftime("%Y%m%d_%H%M%S%f")
+            hashes: typing.List[typing.Optional[str]] = [None] * len(absolute_paths)
+            to_compute: typing.List[int] = []
+            up_to_date: typing.List[int] = []
+            for idx, entry in enumerate(current):
+                stored_file_hash = stored_file_hashes.get(entry.file_path)
+                if stored_file_hash and cls._is_up_to_date(stored_file_hash, entry):
+                    hashes[idx] = stored_file_hash.file_hash
+                    up_to_date.append(idx)
+                else:
+                    to_compute.append(idx)
 
-        stored_file_hash = local_storage.fetch_one(absolute)
+            computed_hashes = cls._compute_hashes([absolute_paths[idx] for idx in to_compute])
+            for idx, computed_hash in zip(to_compute, computed_hashes):
+                hashes[idx] = current[idx].file_hash = computed_hash
 
-        if stored_file_hash:
-            if stored_file_hash.modification_date >= modification_date:
-                return stored_file_hash.file_hash
-            else:
-                computed_hash = sha1(absolute)
-                local_storage.update(absolute, computed_hash, modification_date)
+            local_storage.store_many(
+                file_hashes=[current[idx] for idx in to_compute],
+                used_entries=[stored_file_hashes[current[idx].file_path] for idx in up_to_date],
+            )
+        finally:
+            local_storage.close()
 
-                return computed_hash
-        else:
-            computed_hash = sha1(absolute)
-            local_storage.insert(absolute, computed_hash, modification_date)
+        return hashes
 
-            return computed_hash
+    @staticmethod
+    def _is_up_to_date(stored: LocalFileHashStorage.LocalFileHash, current: LocalFileHashStorage.LocalFileHash) -> bool:
+        # size and inode are unknown for entries migrated from the old cache schema
+        return (
+            stored.modification_date >= current.modification_date
+            and stored.size in (None, current.size)
+            and stored.inode in (None, current.inode)
+        )
+
+    @classmethod
+    def _compute_hashes(cls, paths: typing.List[Path]) -> typing.List[str]:
+        if len(paths) <= 1:
+            return [sha1(path) for path in paths]
+        # hashlib and file reads release the GIL, so threads hash files in parallel
+        with ThreadPoolExecutor(thread_name_prefix="NeptuneFileHasher") as executor:
+            return list(executor.map(sha1, paths))
 
     @classmethod
     def _number_to_bytes(cls, int_value: int, bytes_cnt):
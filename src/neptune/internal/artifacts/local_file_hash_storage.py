@@ -17,49 +17,168 @@ __all__ = ["LocalFileHashStorage"]
 
 import os
 import sqlite3 as sql
-from dataclasses import dataclass
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
 from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
 
 
 class LocalFileHashStorage:
+    """
+    Cache of local file hashes in ~/.neptune/files.db, shared by all runs on the machine.
+
+    Entries are keyed by path and validated by modification date, size and inode. Entries not used for
+    MAX_AGE seconds are evicted, and so are the least recently used ones above MAX_ENTRIES. Eviction runs
+    once every EVICTION_INTERVAL inserts and the time of use is refreshed at most every LAST_USED_RESOLUTION
+    seconds, so that hashing unchanged files does not write to the database.
+    """
+
+    # Stays below SQLITE_MAX_VARIABLE_NUMBER of older SQLite versions (999)
+    FETCH_BATCH_SIZE = 500
+    MAX_ENTRIES = 1_000_000
+    MAX_AGE = 90 * 24 * 60 * 60
+    EVICTION_INTERVAL = 10_000
+    LAST_USED_RESOLUTION = 24 * 60 * 60
+    # Seconds to wait for a lock held by another process
+    TIMEOUT = 30
+
+    SCHEMA_VERSION = 1
+
     @dataclass
     class LocalFileHash:
         file_path: str
         file_hash: str
         modification_date: str
+        size: Optional[int] = None
+        inode: Optional[int] = None
+        last_used: Optional[float] = field(default=None, compare=False)
 
     def __init__(self):
         db_path = Path.home() / ".neptune" / "files.db"
         os.makedirs(db_path.parent, exist_ok=True)
 
-        self.session = sql.connect(str(db_path))
+        self.session = sql.connect(str(db_path), timeout=self.TIMEOUT)
         self.cursor: sql.Cursor = self.session.cursor()
-        self.cursor.execute(
-            "CREATE TABLE IF NOT EXISTS local_file_hashes (file_path text, file_hash text, modification_date text)"
-        )
-        self.session.commit()
-
-    def insert(self, path: Path, computed_hash: str, modification_date: str):
-        self.cursor.execute(
-            "INSERT INTO local_file_hashes (file_path, file_hash, modification_date) VALUES (?, ?, ?)",
-            (str(path), computed_hash, modification_date),
-        )
-        self.session.commit()
-
-    def fetch_one(self, path: Path) -> "LocalFileHash":
-        found = [
-            LocalFileHashStorage.LocalFileHash(*row)
+        # WAL lets concurrent runs read the cache while one of them writes to it
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        if self.cursor.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            self._migrate()
+
+    def _migrate(self):
+        self.cursor.execute("BEGIN IMMEDIATE")
+        try:
+            if self.cursor.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+                self.cursor.execute(
+                    "CREATE TABLE IF NOT EXISTS file_hashes ("
+                    " file_path TEXT PRIMARY KEY,"
+                    " file_hash TEXT NOT NULL,"
+                    " modification_date TEXT NOT NULL,"
+                    " size INTEGER,"
+                    " inode INTEGER,"
+                    " last_used REAL NOT NULL"
+                    ")"
+                )
+                self.cursor.execute("CREATE INDEX IF NOT EXISTS file_hashes_last_used ON file_hashes (last_used)")
+                legacy_table = self.cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'local_file_hashes'"
+                ).fetchone()
+                if legacy_table:
+                    # the legacy table has no key, the first row for a path is the one that was used
+                    self.cursor.execute(
+                        "INSERT OR IGNORE INTO file_hashes (file_path, file_hash, modification_date, last_used)"
+                        " SELECT file_path, file_hash, modification_date, ? FROM local_file_hashes ORDER BY rowid",
+                        (time.time(),),
+                    )
+                    self.cursor.execute("DROP TABLE local_file_hashes")
+                self.cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def insert(
+        self,
+        path: Path,
+        computed_hash: str,
+        modification_date: str,
+        size: Optional[int] = None,
+        inode: Optional[int] = None,
+    ):
+        self.store_many([LocalFileHashStorage.LocalFileHash(str(path), computed_hash, modification_date, size, inode)])
+
+    def update(
+        self,
+        path: Path,
+        computed_hash: str,
+        modification_date: str,
+        size: Optional[int] = None,
+        inode: Optional[int] = None,
+    ):
+        self.insert(path, computed_hash, modification_date, size, inode)
+
+    def fetch_one(self, path: Path) -> Optional["LocalFileHash"]:
+        return self.fetch_many([path]).get(str(path))
+
+    def fetch_many(self, paths: Iterable[Path]) -> Dict[str, "LocalFileHash"]:
+        paths = [str(path) for path in paths]
+        found: Dict[str, LocalFileHashStorage.LocalFileHash] = dict()
+        for start in range(0, len(paths), self.FETCH_BATCH_SIZE):
+            batch = paths[start : start + self.FETCH_BATCH_SIZE]
             for row in self.cursor.execute(
-                "SELECT file_path, file_hash, modification_date FROM local_file_hashes WHERE file_path = ?",
-                (str(path),),
-            )
+                "SELECT file_path, file_hash, modification_date, size, inode, last_used FROM file_hashes"
+                " WHERE file_path IN ({})".format(", ".join("?" * len(batch))),
+                batch,
+            ):
+                found[row[0]] = LocalFileHashStorage.LocalFileHash(*row)
+        return found
+
+    def store_many(self, file_hashes: List["LocalFileHash"], used_entries: Iterable["LocalFileHash"] = ()):
+        """
+        Stores new and changed entries and marks the used ones as recently used, in a single transaction.
+        """
+        now = time.time()
+        used_paths = [
+            entry.file_path
+            for entry in used_entries
+            if entry.last_used is None or entry.last_used < now - self.LAST_USED_RESOLUTION
         ]
+        if not file_hashes and not used_paths:
+            return
+        with self.session:
+            self.cursor.executemany(
+                "INSERT OR REPLACE INTO file_hashes (file_path, file_hash, modification_date, size, inode, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (entry.file_path, entry.file_hash, entry.modification_date, entry.size, entry.inode, now)
+                    for entry in file_hashes
+                ],
+            )
+            self.cursor.executemany(
+                "UPDATE file_hashes SET last_used = ? WHERE file_path = ?", [(now, path) for path in used_paths]
+            )
+            if file_hashes:
+                # a replaced row gets a new rowid, so the highest rowid counts the inserts of all processes
+                (last_rowid,) = self.cursor.execute("SELECT MAX(rowid) FROM file_hashes").fetchone()
+                if (last_rowid - len(file_hashes)) // self.EVICTION_INTERVAL != last_rowid // self.EVICTION_INTERVAL:
+                    self._evict(now)
 
-        return found[0] if found is not None and len(found) > 0 else None
+    def _evict(self, now: float):
+        self.cursor.execute("DELETE FROM file_hashes WHERE last_used < ?", (now - self.MAX_AGE,))
+        (count,) = self.cursor.execute("SELECT COUNT(*) FROM file_hashes").fetchone()
+        if count > self.MAX_ENTRIES:
+            self.cursor.execute(
+                "DELETE FROM file_hashes WHERE file_path IN"
+                " (SELECT file_path FROM file_hashes ORDER BY last_used LIMIT ?)",
+                (count - self.MAX_ENTRIES,),
+            )
 
-    def update(self, path: Path, computed_hash: str, modification_date: str):
-        self.cursor.execute(
-            "UPDATE local_file_hashes SET file_hash=?, modification_date=? WHERE file_path = ?",
-            (computed_hash, modification_date, str(path)),
-        )
-        self.session.commit()
+    def close(self):
+        self.session.close()
@@ -24,6 +24,7 @@ from .hosted_neptune_backend import HostedNeptuneBackend
 from .neptune_backend import NeptuneBackend
 from .neptune_backend_mock import NeptuneBackendMock
 from .offline_neptune_backend import OfflineNeptuneBackend
+from .read_only_neptune_backend import ReadOnlyNeptuneBackend
 
 
 def get_backend(mode: Mode, api_token: Optional[str] = None, proxies: Optional[dict] = None) -> NeptuneBackend:
@@ -36,6 +37,6 @@ def get_backend(mode: Mode, api_token: Optional[str] = None, proxies: Optional[d
     elif mode == Mode.OFFLINE:
         return OfflineNeptuneBackend()
     elif mode == Mode.READ_ONLY:
-        return HostedNeptuneBackend(credentials=Credentials.from_token(api_token=api_token), proxies=proxies)
+        return ReadOnlyNeptuneBackend(credentials=Credentials.from_token(api_token=api_token), proxies=proxies)
     else:
         raise ValueError(f"mode should be one of {[m for m in Mode]}")
@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["FetchCache"]
+
+import logging
+import os
+import pickle
+import sqlite3 as sql
+import threading
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from neptune.envs import NEPTUNE_FETCH_CACHE_MAX_SIZE
+from neptune.version import __version__
+
+_logger = logging.getLogger(__name__)
+
+
+class FetchCache:
+    """
+    Cache of values fetched from Neptune servers in ~/.neptune/fetch_cache.db, shared by all processes on the machine.
+
+    Entries are keyed by container id and a request key (attribute path, page etc.) and are valid only for
+    the container version and the client version they were stored with. Least recently used entries are evicted
+    once the total size of cached values exceeds max_size bytes. Errors of the database and entries that cannot
+    be unpickled are treated as misses.
+    """
+
+    MAX_SIZE = int(os.getenv(NEPTUNE_FETCH_CACHE_MAX_SIZE, str(512 * 1024 * 1024)))
+    # Evicting down to a fraction of MAX_SIZE, so that not every store has to evict
+    EVICT_TO_RATIO = 0.9
+    # Seconds to wait for a lock held by another process
+    TIMEOUT = 30
+    # Times of use of hit entries are written in batches, not on every hit
+    TOUCH_BATCH_SIZE = 100
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Optional[Path] = None, max_size: Optional[int] = None):
+        if db_path is None:
+            db_path = Path.home() / ".neptune" / "fetch_cache.db"
+        os.makedirs(db_path.parent, exist_ok=True)
+
+        self.max_size = self.MAX_SIZE if max_size is None else max_size
+        self.hits = 0
+        self.misses = 0
+        self._touched: Dict[Tuple[str, str], float] = {}
+
+        # Series pages are fetched from many threads at once
+        self._lock = threading.Lock()
+        self._session = sql.connect(str(db_path), timeout=self.TIMEOUT, check_same_thread=False)
+        self._session.execute("PRAGMA journal_mode=WAL")
+        if self._session.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            with self._session:
+                self._session.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " container_id TEXT NOT NULL,"
+                    " key TEXT NOT NULL,"
+                    " version TEXT NOT NULL,"
+                    " value BLOB NOT NULL,"
+                    " size INTEGER NOT NULL,"
+                    " last_used REAL NOT NULL,"
+                    " PRIMARY KEY (container_id, key)"
+                    ")"
+                )
+                self._session.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+                self._session.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._size = self._session.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, container_id: str, key: str, version: str) -> Tuple[bool, Any]:
+        """
+        Returns a (found, value) pair; entries stored for another version of the container are a miss.
+        """
+        with self._lock:
+            try:
+                row = self._session.execute(
+                    "SELECT value FROM entries WHERE container_id = ? AND key = ? AND version = ?",
+                    (container_id, key, self._entry_version(version)),
+                ).fetchone()
+            except sql.Error as e:
+                _logger.debug("Cannot read local cache of fetched values: %s", e)
+                row = None
+            if row is not None:
+                try:
+                    value = pickle.loads(row[0])
+                except Exception as e:
+                    _logger.debug("Dropping unreadable entry %s of %s from local cache: %s", key, container_id, e)
+                    self._delete(container_id, key)
+                    row = None
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._touched[(container_id, key)] = time.time()
+            if len(self._touched) >= self.TOUCH_BATCH_SIZE:
+                self._write_touched()
+        return True, value
+
+    def put(self, container_id: str, key: str, version: str, value: Any) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+        with self._lock:
+            try:
+                with self._session:
+                    self._touch()
+                    replaced = self._session.execute(
+                        "SELECT size FROM entries WHERE container_id = ? AND key = ?", (container_id, key)
+                    ).fetchone()
+                    self._session.execute(
+                        "INSERT OR REPLACE INTO entries (container_id, key, version, value, size, last_used)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (container_id, key, self._entry_version(version), data, len(data), time.time()),
+                    )
+                self._size += len(data) - (replaced[0] if replaced else 0)
+                if self._size > self.max_size:
+                    self._evict()
+            except sql.Error as e:
+                _logger.debug("Cannot write to local cache of fetched values: %s", e)
+
+    @staticmethod
+    def _entry_version(version: str) -> str:
+        # Pickled values depend on the layout of client classes
+        return f"{__version__}/{version}"
+
+    def _touch(self) -> None:
+        touched, self._touched = self._touched, {}
+        self._session.executemany(
+            "UPDATE entries SET last_used = ? WHERE container_id = ? AND key = ?",
+            [(last_used, container_id, key) for (container_id, key), last_used in touched.items()],
+        )
+
+    def _write_touched(self) -> None:
+        try:
+            with self._session:
+                self._touch()
+        except sql.Error as e:
+            _logger.debug("Cannot write to local cache of fetched values: %s", e)
+
+    def _delete(self, container_id: str, key: str) -> None:
+        try:
+            with self._session:
+                self._session.execute("DELETE FROM entries WHERE container_id = ? AND key = ?", (container_id, key))
+        except sql.Error as e:
+            _logger.debug("Cannot write to local cache of fetched values: %s", e)
+
+    def _evict(self) -> None:
+        # Other processes write to the same cache, so the size kept in memory is only a hint
+        self._size = self._session.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if self._size <= self.max_size:
+            return
+        to_free = self._size - int(self.max_size * self.EVICT_TO_RATIO)
+        evicted = []
+        for rowid, size in self._session.execute("SELECT rowid, size FROM entries ORDER BY last_used"):
+            if to_free <= 0:
+                break
+            evicted.append((rowid,))
+            to_free -= size
+            self._size -= size
+        with self._session:
+            self._session.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._touched:
+                self._write_touched()
+            self._session.close()
@@ -163,12 +163,20 @@ def create_http_client_with_auth(
     return http_client, client_config
 
 
+def _get_server_version(client_config: ClientConfig) -> str:
+    """
+    Client configs do not carry the version of the server, but whatever they carry changes with it.
+    """
+    return repr((client_config.api_url, client_config.version_info, sorted(client_config._missing_features)))
+
+
 @cache
 def create_backend_client(client_config: ClientConfig, http_client: HttpClient) -> SwaggerClientWrapper:
     return SwaggerClientWrapper(
         create_swagger_client(
             build_operation_url(client_config.api_url, BACKEND_SWAGGER_PATH),
             http_client,
+            server_version=_get_server_version(client_config),
         )
     )
 
@@ -179,6 +187,7 @@ def create_leaderboard_client(client_config: ClientConfig, http_client: HttpClie
         create_swagger_client(
             build_operation_url(client_config.api_url, LEADERBOARD_SWAGGER_PATH),
             http_client,
+            server_version=_get_server_version(client_config),
         )
     )
 
@@ -189,5 +198,6 @@ def create_artifacts_client(client_config: ClientConfig, http_client: HttpClient
         create_swagger_client(
             build_operation_url(client_config.api_url, ARTIFACTS_SWAGGER_PATH),
             http_client,
+            server_version=_get_server_version(client_config),
         )
     )
@@ -22,12 +22,17 @@ __all__ = [
 
 import collections
 import enum
+import itertools
 import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import (
     AnyStr,
+    Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -35,7 +40,10 @@ from typing import (
     Set,
     Union,
 )
-from urllib.parse import urlencode
+from urllib.parse import (
+    urlencode,
+    urlparse,
+)
 
 from bravado.exception import (
     HTTPPaymentRequired,
@@ -58,7 +66,7 @@ from neptune.common.hardware.constants import BYTES_IN_ONE_MB
 from neptune.common.storage.datastream import (
     FileChunk,
     FileChunker,
-    compress_to_tar_gz_in_memory,
+    TarGzStream,
 )
 from neptune.common.storage.storage_utils import (
     AttributeUploadConfiguration,
@@ -67,6 +75,11 @@ from neptune.common.storage.storage_utils import (
     scan_unique_upload_entries,
     split_upload_files,
 )
+from neptune.envs import (
+    NEPTUNE_FILE_SET_COMPRESSION_LEVEL,
+    NEPTUNE_UPLOAD_MAX_CONNECTIONS_PER_HOST,
+    NEPTUNE_UPLOAD_MAX_WORKERS,
+)
 from neptune.exceptions import (
     FileUploadError,
     MetadataInconsistency,
@@ -89,6 +102,16 @@ from neptune.internal.utils.logger import logger
 DEFAULT_CHUNK_SIZE = 5 * BYTES_IN_ONE_MB
 DEFAULT_UPLOAD_CONFIG = AttributeUploadConfiguration(chunk_size=DEFAULT_CHUNK_SIZE)
 
+# Number of files uploaded in parallel, and of parts of a single file kept in flight at once
+UPLOAD_MAX_WORKERS = int(os.getenv(NEPTUNE_UPLOAD_MAX_WORKERS, "4"))
+# Kept below the default connection pool size of requests (10), so that connections are reused
+UPLOAD_MAX_CONNECTIONS_PER_HOST = int(os.getenv(NEPTUNE_UPLOAD_MAX_CONNECTIONS_PER_HOST, "8"))
+# 0 (no compression) suits file sets of already compressed files, like images or checkpoints
+FILE_SET_COMPRESSION_LEVEL = int(os.getenv(NEPTUNE_FILE_SET_COMPRESSION_LEVEL, "6"))
+
+_host_connection_limits: Dict[str, threading.BoundedSemaphore] = dict()
+_host_connection_limits_lock = threading.Lock()
+
 
 class FileUploadTarget(enum.Enum):
     FILE_ATOM = "file"
@@ -152,7 +175,7 @@ def upload_file_set_attribute(
             )
 
             if uploading_multiple_entries or creating_a_single_empty_dir or package.is_empty():
-                data = compress_to_tar_gz_in_memory(upload_entries=package.items)
+                data = TarGzStream(upload_entries=package.items, compression_level=FILE_SET_COMPRESSION_LEVEL)
                 url = build_operation_url(
                     swagger_client.swagger_spec.api_url,
                     swagger_client.api.uploadFileSetAttributeTar.operation.path_name,
@@ -328,8 +351,9 @@ def _multichunk_upload(
                 entry_length,
                 multipart_config,
             )
-            for idx, chunk in enumerate(chunker.generate()):
-                result = upload_raw_data(
+
+            def upload_part(idx: int, chunk: FileChunk) -> None:
+                part_result = upload_raw_data(
                     http_client=swagger_client.swagger_spec.http_client,
                     url=urlset.send_chunk,
                     data=chunk.data,
@@ -340,7 +364,9 @@ def _multichunk_upload(
                         **no_ext_query_params,
                     },
                 )
-                _attribute_upload_response_handler(result)
+                _attribute_upload_response_handler(part_result)
+
+            _upload_parts(chunker.generate(), upload_part)
 
             result = urlset.finish_chunked(**no_ext_query_params, uploadId=upload_id).response().result
             if result.errors:
@@ -350,6 +376,42 @@ def _multichunk_upload(
         file_stream.close()
 
 
+def _upload_parts(chunks: Iterable[FileChunk], upload_part: Callable[[int, FileChunk], None]) -> None:
+    """
+    The first part is sent from the calling thread, so a rejected upload fails before more of the file is read.
+    The rest is sent concurrently, with at most UPLOAD_MAX_WORKERS parts (and so chunks in memory) in flight.
+    """
+    indexed_chunks = enumerate(chunks)
+    for idx, chunk in itertools.islice(indexed_chunks, 1):
+        upload_part(idx, chunk)
+
+    if UPLOAD_MAX_WORKERS <= 1:
+        for idx, chunk in indexed_chunks:
+            upload_part(idx, chunk)
+        return
+
+    in_flight: Deque = collections.deque()
+    with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="NeptuneUploadPart") as executor:
+        try:
+            for idx, chunk in indexed_chunks:
+                if len(in_flight) >= UPLOAD_MAX_WORKERS:
+                    in_flight.popleft().result()
+                in_flight.append(executor.submit(upload_part, idx, chunk))
+            while in_flight:
+                in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def _host_connection_limit(url: str) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc
+    with _host_connection_limits_lock:
+        if host not in _host_connection_limits:
+            _host_connection_limits[host] = threading.BoundedSemaphore(UPLOAD_MAX_CONNECTIONS_PER_HOST)
+        return _host_connection_limits[host]
+
+
 def _build_x_range(chunk: FileChunk, total_size: int) -> str:
     return "bytes=%d-%d/%d" % (
         chunk.start,
@@ -362,7 +424,7 @@ def _build_x_range(chunk: FileChunk, total_size: int) -> str:
 def upload_raw_data(
     http_client: RequestsClient,
     url: str,
-    data: AnyStr,
+    data: Union[AnyStr, Iterable[bytes]],
     path_params: Optional[Dict[str, str]] = None,
     query_params: Optional[Dict[str, str]] = None,
     headers: Optional[Dict[str, str]] = None,
@@ -371,7 +433,8 @@ def upload_raw_data(
 
     session = http_client.session
     request = http_client.authenticator.apply(Request(method="POST", url=url, data=data, headers=headers))
-    response = handle_server_raw_response_messages(session.send(session.prepare_request(request)))
+    with _host_connection_limit(url):
+        response = handle_server_raw_response_messages(session.send(session.prepare_request(request)))
 
     if response.status_code >= 300:
         ApiMethodWrapper.handle_neptune_http_errors(response)
@@ -467,10 +530,13 @@ def _store_response_as_file(response: Response, destination: Optional[str] = Non
     else:
         target_file = destination
     with response:
-        with open(target_file, "wb") as f:
+        # Interrupted downloads must not leave a truncated file under the target name
+        part_file = target_file + ".part"
+        with open(part_file, "wb") as f:
             for chunk in response.iter_content(chunk_size=1024 * 1024):
                 if chunk:
                     f.write(chunk)
+        os.replace(part_file, target_file)
 
 
 def _get_content_disposition_filename(response: Response) -> str:
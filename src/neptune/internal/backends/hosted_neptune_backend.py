@@ -15,15 +15,24 @@
 #
 __all__ = ["HostedNeptuneBackend"]
 
+import collections
 import itertools
 import logging
 import os
 import re
+import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import (
+    datetime,
+    timezone,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    Generator,
     Iterable,
     List,
     Optional,
@@ -38,6 +47,7 @@ from bravado.exception import (
     HTTPUnprocessableEntity,
 )
 
+from neptune.common.backends.api_model import MultipartConfig
 from neptune.common.backends.utils import with_api_exceptions_handler
 from neptune.common.exceptions import (
     ClientHttpError,
@@ -98,6 +108,7 @@ from neptune.internal.backends.hosted_client import (
     create_leaderboard_client,
 )
 from neptune.internal.backends.hosted_file_operations import (
+    UPLOAD_MAX_WORKERS,
     download_file_attribute,
     download_file_set_attribute,
     download_image_series_element,
@@ -105,10 +116,18 @@ from neptune.internal.backends.hosted_file_operations import (
     upload_file_set_attribute,
 )
 from neptune.internal.backends.neptune_backend import NeptuneBackend
-from neptune.internal.backends.nql import NQLQuery
+from neptune.internal.backends.nql import (
+    NQLAggregator,
+    NQLAttributeOperator,
+    NQLAttributeType,
+    NQLQuery,
+    NQLQueryAggregate,
+    NQLQueryAttribute,
+)
 from neptune.internal.backends.operation_api_name_visitor import OperationApiNameVisitor
 from neptune.internal.backends.operation_api_object_converter import OperationApiObjectConverter
 from neptune.internal.backends.operations_preprocessor import OperationsPreprocessor
+from neptune.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
 from neptune.internal.backends.utils import (
     ExecuteOperationsBatchingManager,
     MissingApiClient,
@@ -146,6 +165,8 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+LEADERBOARD_SORT_KEY = "sys/creation_time"
+
 
 class HostedNeptuneBackend(NeptuneBackend):
     def __init__(self, credentials: Credentials, proxies: Optional[Dict[str, str]] = None):
@@ -153,18 +174,46 @@ class HostedNeptuneBackend(NeptuneBackend):
         self.proxies = proxies
         self.missing_features = []
 
+        self._http_client: "RequestsClient"
+        self._client_config: "ClientConfig"
         self._http_client, self._client_config = create_http_client_with_auth(
             credentials=credentials, ssl_verify=ssl_verify(), proxies=proxies
-        )  # type: (RequestsClient, ClientConfig)
-
-        self.backend_client = create_backend_client(self._client_config, self._http_client)
-        self.leaderboard_client = create_leaderboard_client(self._client_config, self._http_client)
+        )
 
-        if self._client_config.has_feature(OptionalFeatures.ARTIFACTS):
-            self.artifacts_client = create_artifacts_client(self._client_config, self._http_client)
-        else:
-            # create a stub
-            self.artifacts_client = MissingApiClient(OptionalFeatures.ARTIFACTS)
+        # Built on first use, as each of them loads its own swagger spec. The backend is shared by
+        # upload and fetch thread pools, so the clients are created under a lock
+        self._clients_lock = threading.Lock()
+        self._backend_client: Optional[SwaggerClientWrapper] = None
+        self._leaderboard_client: Optional[SwaggerClientWrapper] = None
+        self._artifacts_client: Optional[SwaggerClientWrapper] = None
+
+    @property
+    def backend_client(self) -> SwaggerClientWrapper:
+        if self._backend_client is None:
+            with self._clients_lock:
+                if self._backend_client is None:
+                    self._backend_client = create_backend_client(self._client_config, self._http_client)
+        return self._backend_client
+
+    @property
+    def leaderboard_client(self) -> SwaggerClientWrapper:
+        if self._leaderboard_client is None:
+            with self._clients_lock:
+                if self._leaderboard_client is None:
+                    self._leaderboard_client = create_leaderboard_client(self._client_config, self._http_client)
+        return self._leaderboard_client
+
+    @property
+    def artifacts_client(self) -> SwaggerClientWrapper:
+        if self._artifacts_client is None:
+            with self._clients_lock:
+                if self._artifacts_client is None:
+                    if self._client_config.has_feature(OptionalFeatures.ARTIFACTS):
+                        self._artifacts_client = create_artifacts_client(self._client_config, self._http_client)
+                    else:
+                        # create a stub
+                        self._artifacts_client = MissingApiClient(OptionalFeatures.ARTIFACTS)
+        return self._artifacts_client
 
     def verify_feature_available(self, feature_name: str):
         if not self._client_config.has_feature(feature_name):
@@ -472,7 +521,10 @@ class HostedNeptuneBackend(NeptuneBackend):
             )
         )
 
-        (artifact_operations_errors, assign_artifact_operations,) = self._execute_artifact_operations(
+        (
+            artifact_operations_errors,
+            assign_artifact_operations,
+        ) = self._execute_artifact_operations(
             container_id=container_id,
             container_type=container_type,
             artifact_operations=preprocessed_operations.artifact_operations,
@@ -520,45 +572,78 @@ class HostedNeptuneBackend(NeptuneBackend):
         else:
             multipart_config = None
 
-        for op in upload_operations:
-            if isinstance(op, UploadFile):
-                upload_errors = upload_file_attribute(
-                    swagger_client=self.leaderboard_client,
-                    container_id=container_id,
-                    attribute=path_to_str(op.path),
-                    source=op.get_absolute_path(operation_storage),
-                    ext=op.ext,
-                    multipart_config=multipart_config,
-                )
-                if upload_errors:
-                    errors.extend(upload_errors)
-            elif isinstance(op, UploadFileContent):
-                upload_errors = upload_file_attribute(
-                    swagger_client=self.leaderboard_client,
-                    container_id=container_id,
-                    attribute=path_to_str(op.path),
-                    source=base64_decode(op.file_content),
-                    ext=op.ext,
-                    multipart_config=multipart_config,
-                )
-                if upload_errors:
-                    errors.extend(upload_errors)
-            elif isinstance(op, UploadFileSet):
-                upload_errors = upload_file_set_attribute(
-                    swagger_client=self.leaderboard_client,
+        # Uploads to the same attribute have to be applied in order, different attributes are independent
+        op_indices_by_path: Dict[Tuple[str, ...], List[int]] = collections.defaultdict(list)
+        for idx, op in enumerate(upload_operations):
+            op_indices_by_path[tuple(op.path)].append(idx)
+        op_errors: List[List[NeptuneException]] = [[] for _ in upload_operations]
+
+        def upload_attribute(op_indices: List[int]) -> None:
+            for op_idx in op_indices:
+                op_errors[op_idx] = self._execute_upload_operation(
                     container_id=container_id,
-                    attribute=path_to_str(op.path),
-                    file_globs=op.file_globs,
-                    reset=op.reset,
+                    op=upload_operations[op_idx],
+                    operation_storage=operation_storage,
                     multipart_config=multipart_config,
                 )
-                if upload_errors:
-                    errors.extend(upload_errors)
-            else:
-                raise InternalClientError("Upload operation in neither File or FileSet")
+
+        if UPLOAD_MAX_WORKERS <= 1 or len(op_indices_by_path) <= 1:
+            for op_indices in op_indices_by_path.values():
+                upload_attribute(op_indices)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(UPLOAD_MAX_WORKERS, len(op_indices_by_path)),
+                thread_name_prefix="NeptuneUpload",
+            ) as executor:
+                futures = [executor.submit(upload_attribute, op_indices) for op_indices in op_indices_by_path.values()]
+            # every upload has finished at this point; re-raise the first failure, as the sequential loop would
+            for future in futures:
+                future.result()
+
+        for upload_errors in op_errors:
+            errors.extend(upload_errors)
 
         return errors
 
+    def _execute_upload_operation(
+        self,
+        container_id: str,
+        op: Operation,
+        operation_storage: OperationStorage,
+        multipart_config: Optional[MultipartConfig],
+    ) -> List[NeptuneException]:
+        if isinstance(op, UploadFile):
+            upload_errors = upload_file_attribute(
+                swagger_client=self.leaderboard_client,
+                container_id=container_id,
+                attribute=path_to_str(op.path),
+                source=op.get_absolute_path(operation_storage),
+                ext=op.ext,
+                multipart_config=multipart_config,
+            )
+        elif isinstance(op, UploadFileContent):
+            upload_errors = upload_file_attribute(
+                swagger_client=self.leaderboard_client,
+                container_id=container_id,
+                attribute=path_to_str(op.path),
+                source=base64_decode(op.file_content),
+                ext=op.ext,
+                multipart_config=multipart_config,
+            )
+        elif isinstance(op, UploadFileSet):
+            upload_errors = upload_file_set_attribute(
+                swagger_client=self.leaderboard_client,
+                container_id=container_id,
+                attribute=path_to_str(op.path),
+                file_globs=op.file_globs,
+                reset=op.reset,
+                multipart_config=multipart_config,
+            )
+        else:
+            raise InternalClientError("Upload operation in neither File or FileSet")
+
+        return upload_errors or []
+
     def _execute_upload_operations_with_400_retry(
         self,
         container_id: str,
@@ -1000,7 +1085,6 @@ class HostedNeptuneBackend(NeptuneBackend):
         except HTTPNotFound:
             raise FetchAttributeNotFoundException(path_to_str(path))
 
-    @with_api_exceptions_handler
     def search_leaderboard_entries(
         self,
         project_id: UniqueId,
@@ -1008,35 +1092,50 @@ class HostedNeptuneBackend(NeptuneBackend):
         query: Optional[NQLQuery] = None,
         columns: Optional[Iterable[str]] = None,
     ) -> List[LeaderboardEntry]:
-        if query:
-            query_params = {"query": {"query": str(query)}}
-        else:
-            query_params = {}
-        if columns:
-            attributes_filter = {"attributeFilters": [{"path": column} for column in columns]}
-        else:
-            attributes_filter = {}
+        return list(self.iter_leaderboard_entries(project_id=project_id, types=types, query=query, columns=columns))
 
-        def get_portion(limit, offset):
+    def iter_leaderboard_entries(
+        self,
+        project_id: UniqueId,
+        types: Optional[Iterable[ContainerType]] = None,
+        query: Optional[NQLQuery] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> Generator[LeaderboardEntry, None, None]:
+        columns = set(columns) if columns else None
+        # the sort key is needed to resume past the server's offset limit
+        drop_sort_key = columns is not None and LEADERBOARD_SORT_KEY not in columns
+
+        @with_api_exceptions_handler
+        def get_portion(portion_query: Optional[NQLQuery], limit: int, offset: int, sort: bool):
+            params = {"query": {"query": str(portion_query)}} if portion_query else {}
+            if columns is not None:
+                paths = {*columns, LEADERBOARD_SORT_KEY} if sort else columns
+                params["attributeFilters"] = [{"path": column} for column in paths]
+            if sort:
+                params["sorting"] = {
+                    "dir": "ascending",
+                    "aggregationMode": "none",
+                    "sortBy": {"name": LEADERBOARD_SORT_KEY, "type": NQLAttributeType.DATETIME.value},
+                }
+            params["pagination"] = {"limit": limit, "offset": offset}
             return (
                 self.leaderboard_client.api.searchLeaderboardEntries(
                     projectIdentifier=project_id,
                     type=list(map(lambda container_type: container_type.to_api(), types)),
-                    params={
-                        **query_params,
-                        **attributes_filter,
-                        "pagination": {"limit": limit, "offset": offset},
-                    },
+                    params=params,
                     **DEFAULT_REQUEST_KWARGS,
                 )
                 .response()
                 .result.entries
             )
 
+        supported_attribute_types = {item.value for item in AttributeType}
+
         def to_leaderboard_entry(entry) -> LeaderboardEntry:
-            supported_attribute_types = {item.value for item in AttributeType}
             attributes: List[AttributeWithProperties] = []
             for attr in entry.attributes:
+                if drop_sort_key and attr.name == LEADERBOARD_SORT_KEY:
+                    continue
                 if attr.type in supported_attribute_types:
                     properties = attr.__getitem__("{}Properties".format(attr.type))
                     attributes.append(AttributeWithProperties(attr.name, AttributeType(attr.type), properties))
@@ -1044,7 +1143,8 @@ class HostedNeptuneBackend(NeptuneBackend):
 
         try:
             step_size = int(os.getenv(NEPTUNE_FETCH_TABLE_STEP_SIZE, "100"))
-            return [to_leaderboard_entry(e) for e in self._get_all_items(get_portion, step=step_size)]
+            for entry in self._iter_all_items(get_portion, query=query, step=step_size):
+                yield to_leaderboard_entry(entry)
         except HTTPNotFound:
             raise ProjectNotFound(project_id)
 
@@ -1072,11 +1172,111 @@ class HostedNeptuneBackend(NeptuneBackend):
         return f"{base_url}/{workspace}/{project_name}/m/{model_id}/v/{sys_id}"
 
     @staticmethod
-    def _get_all_items(get_portion, step):
-        max_server_offset = 10000
-        items = []
-        previous_items = None
-        while (previous_items is None or len(previous_items) >= step) and len(items) < max_server_offset:
-            previous_items = get_portion(limit=step, offset=len(items))
-            items += previous_items
-        return items
+    def _iter_all_items(
+        get_portion: Callable[[Optional[NQLQuery], int, int, bool], List[Any]],
+        query: Optional[NQLQuery],
+        step: int,
+        max_server_offset: int = 10000,
+        pages_in_flight: int = 4,
+    ) -> Generator[Any, None, None]:
+        """
+        Yields items in the order of the server, fetching pages of a window of up to `max_server_offset` items
+        concurrently, and keeping only `pages_in_flight` pages in memory.
+
+        The server does not return items past that offset, so if there are more, the remaining ones are yielded
+        sorted by LEADERBOARD_SORT_KEY (`get_portion` is called with `sort=True`), in windows starting from
+        the last sort key seen, so that there is no limit on the number of items.
+        """
+        with ThreadPoolExecutor(max_workers=pages_in_flight, thread_name_prefix="NeptuneFetchTable") as executor:
+
+            def iter_window(window_query: Optional[NQLQuery], sort: bool) -> Generator[Any, None, bool]:
+                """Yields items of the window and returns whether it has all the remaining ones."""
+                offsets = iter(range(0, max_server_offset, step))
+                pages = collections.deque(
+                    executor.submit(get_portion, window_query, step, offset, sort)
+                    for offset in itertools.islice(offsets, pages_in_flight)
+                )
+                try:
+                    while pages:
+                        page = pages.popleft().result()
+                        if len(page) < step:
+                            yield from page
+                            return True
+                        for offset in itertools.islice(offsets, 1):
+                            pages.append(executor.submit(get_portion, window_query, step, offset, sort))
+                        yield from page
+                    return False
+                finally:
+                    for page in pages:
+                        page.cancel()
+
+            first_window_ids = set()
+            window = iter_window(query, sort=False)
+            while True:
+                try:
+                    item = next(window)
+                except StopIteration as stop:
+                    window_exhausted = stop.value
+                    break
+                first_window_ids.add(item.experimentId)
+                yield item
+            if window_exhausted:
+                return
+
+            last_key, ids_with_last_key = None, set()
+            while True:
+                window_query = query
+                if last_key is not None:
+                    key_query = NQLQueryAttribute(
+                        name=LEADERBOARD_SORT_KEY,
+                        type=NQLAttributeType.DATETIME,
+                        operator=NQLAttributeOperator.GREATER_THAN_OR_EQUAL,
+                        value=last_key,
+                    )
+                    window_query = (
+                        NQLQueryAggregate(items=[query, key_query], aggregator=NQLAggregator.AND)
+                        if query and str(query)
+                        else key_query
+                    )
+
+                new_items_count = 0
+                window = iter_window(window_query, sort=True)
+                while True:
+                    try:
+                        item = next(window)
+                    except StopIteration as stop:
+                        window_exhausted = stop.value
+                        break
+                    key = _get_leaderboard_sort_key(item)
+                    if key == last_key:
+                        if item.experimentId in ids_with_last_key:
+                            # already seen at the end of the previous window
+                            continue
+                        ids_with_last_key.add(item.experimentId)
+                    else:
+                        last_key, ids_with_last_key = key, {item.experimentId}
+                    new_items_count += 1
+                    if item.experimentId not in first_window_ids:
+                        yield item
+
+                if window_exhausted or last_key is None:
+                    return
+                if new_items_count == 0:
+                    _logger.warning(
+                        "More than %d entries share the same %s, some of them were skipped.",
+                        max_server_offset,
+                        LEADERBOARD_SORT_KEY,
+                    )
+                    return
+
+
+def _get_leaderboard_sort_key(entry) -> Optional[str]:
+    for attr in entry.attributes:
+        if attr.name == LEADERBOARD_SORT_KEY:
+            value = attr.datetimeProperties.value
+            if isinstance(value, datetime):
+                if value.tzinfo is not None:
+                    value = value.astimezone(timezone.utc)
+                return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+            return value
+    return None
@@ -19,6 +19,7 @@ import abc
 from typing import (
     Any,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -305,3 +306,13 @@ class NeptuneBackend:
         columns: Optional[Iterable[str]] = None,
     ) -> List[LeaderboardEntry]:
         pass
+
+    def iter_leaderboard_entries(
+        self,
+        project_id: UniqueId,
+        types: Optional[Iterable[ContainerType]] = None,
+        query: Optional[NQLQuery] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> Iterator[LeaderboardEntry]:
+        """Yields the entries of search_leaderboard_entries, fetching them lazily if the backend can."""
+        yield from self.search_leaderboard_entries(project_id=project_id, types=types, query=query, columns=columns)
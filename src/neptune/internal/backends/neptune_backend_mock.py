@@ -451,7 +451,10 @@ class NeptuneBackendMock(NeptuneBackend):
         val = self._get_attribute(container_id, container_type, path, StringSeries)
         return StringSeriesValues(
             len(val.values),
-            [StringPointValue(timestampMillis=42342, step=idx, value=v) for idx, v in enumerate(val.values)],
+            [
+                StringPointValue(timestampMillis=42342, step=idx, value=v)
+                for idx, v in enumerate(val.values[offset : offset + limit], start=offset)
+            ],
         )
 
     def get_float_series_values(
@@ -465,7 +468,10 @@ class NeptuneBackendMock(NeptuneBackend):
         val = self._get_attribute(container_id, container_type, path, FloatSeries)
         return FloatSeriesValues(
             len(val.values),
-            [FloatPointValue(timestampMillis=42342, step=idx, value=v) for idx, v in enumerate(val.values)],
+            [
+                FloatPointValue(timestampMillis=42342, step=idx, value=v)
+                for idx, v in enumerate(val.values[offset : offset + limit], start=offset)
+            ],
         )
 
     def get_image_series_values(
@@ -57,6 +57,7 @@ class NQLQueryAggregate(NQLQuery):
 class NQLAttributeOperator(str, Enum):
     EQUALS = "="
     CONTAINS = "CONTAINS"
+    GREATER_THAN_OR_EQUAL = ">="
 
 
 class NQLAttributeType(str, Enum):
@@ -64,6 +65,7 @@ class NQLAttributeType(str, Enum):
     STRING_SET = "stringSet"
     EXPERIMENT_STATE = "experimentState"
     BOOLEAN = "bool"
+    DATETIME = "datetime"
 
 
 @dataclass
@@ -15,6 +15,8 @@
 #
 __all__ = ["OperationApiObjectConverter"]
 
+from itertools import repeat
+
 from neptune.common.exceptions import InternalClientError
 from neptune.internal.operation import (
     AddStrings,
@@ -35,6 +37,7 @@ from neptune.internal.operation import (
     DeleteFiles,
     LogFloats,
     LogImages,
+    LogSeriesColumns,
     LogStrings,
     Operation,
     RemoveStrings,
@@ -81,6 +84,19 @@ class OperationApiObjectConverter(OperationVisitor[dict]):
         raise InternalClientError("Specialized endpoints should be used to upload file set attribute")
 
     def visit_log_floats(self, op: LogFloats) -> dict:
+        if isinstance(op.values, LogSeriesColumns):
+            # columns are expanded only here, right before being sent
+            values, steps, timestamps = op.values.as_lists()
+            return {
+                "entries": [
+                    {
+                        "value": value,
+                        "step": step,
+                        "timestampMilliseconds": int(ts * 1000),
+                    }
+                    for value, step, ts in zip(values, steps if steps is not None else repeat(None), timestamps)
+                ]
+            }
         return {
             "entries": [
                 {
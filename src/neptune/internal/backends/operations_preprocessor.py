@@ -44,6 +44,7 @@ from neptune.internal.operation import (
     DeleteFiles,
     LogFloats,
     LogImages,
+    LogSeriesColumns,
     LogStrings,
     Operation,
     RemoveStrings,
@@ -143,6 +144,8 @@ class _OperationsAccumulator(OperationVisitor[None]):
         self._modify_ops = []
         self._config_ops = []
         self._errors = []
+        # Log operation created by this accumulator by merging the logged ones, values are appended to it in place
+        self._merged_log_op: typing.Optional[Operation] = None
 
     def get_operations(self) -> List[Operation]:
         return self._delete_ops + self._modify_ops + self._config_ops
@@ -235,33 +238,21 @@ class _OperationsAccumulator(OperationVisitor[None]):
         self._process_modify_op(
             _DataType.FLOAT_SERIES,
             op,
-            self._log_modifier(
-                LogFloats,
-                ClearFloatLog,
-                lambda op1, op2: LogFloats(op1.path, op1.values + op2.values),
-            ),
+            self._log_modifier(LogFloats, ClearFloatLog),
         )
 
     def visit_log_strings(self, op: LogStrings) -> None:
         self._process_modify_op(
             _DataType.STRING_SERIES,
             op,
-            self._log_modifier(
-                LogStrings,
-                ClearStringLog,
-                lambda op1, op2: LogStrings(op1.path, op1.values + op2.values),
-            ),
+            self._log_modifier(LogStrings, ClearStringLog),
         )
 
     def visit_log_images(self, op: LogImages) -> None:
         self._process_modify_op(
             _DataType.IMAGE_SERIES,
             op,
-            self._log_modifier(
-                LogImages,
-                ClearImageLog,
-                lambda op1, op2: LogImages(op1.path, op1.values + op2.values),
-            ),
+            self._log_modifier(LogImages, ClearImageLog),
         )
 
     def visit_clear_float_log(self, op: ClearFloatLog) -> None:
@@ -344,8 +335,20 @@ class _OperationsAccumulator(OperationVisitor[None]):
     def _clear_modifier():
         return lambda ops, new_op: [new_op]
 
-    @staticmethod
-    def _log_modifier(log_op_class: type, clear_op_class: type, log_combine: Callable[[T, T], T]):
+    def _log_combine(self, op: T, new_op: T) -> T:
+        # Copying values on every merge would make merging n operations O(n^2), so they are copied only once,
+        # into an operation owned by this accumulator, and appended in place afterwards.
+        # Operations passed to the preprocessor are never modified, as they may be processed again on retry.
+        if op is not self._merged_log_op:
+            values = op.values.copy() if isinstance(op.values, LogSeriesColumns) else list(op.values)
+            op = type(op)(op.path, values)
+            self._merged_log_op = op
+        op.values.extend(new_op.values)
+        return op
+
+    def _log_modifier(self, log_op_class: type, clear_op_class: type):
+        log_combine = self._log_combine
+
         def modifier(ops, new_op):
             if len(ops) == 0:
                 return [new_op]
@@ -363,9 +366,15 @@ class _OperationsAccumulator(OperationVisitor[None]):
     @staticmethod
     def _add_modifier():
         # We do not optimize it on client side for now. It should not be often operation.
-        return lambda ops, op: ops + [op]
+        return _append_op
 
     @staticmethod
     def _remove_modifier():
         # We do not optimize it on client side for now. It should not be often operation.
-        return lambda ops, op: ops + [op]
+        return _append_op
+
+
+def _append_op(ops: List[Operation], op: Operation) -> List[Operation]:
+    # Lists of modify operations are owned by the accumulator, so they can be extended in place
+    ops.append(op)
+    return ops
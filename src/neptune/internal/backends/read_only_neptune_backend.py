@@ -0,0 +1,288 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["ReadOnlyNeptuneBackend"]
+
+import logging
+import os
+import sqlite3 as sql
+import threading
+import time
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from neptune.envs import NEPTUNE_FETCH_CACHE_VALIDATION_INTERVAL
+from neptune.exceptions import FetchAttributeNotFoundException
+from neptune.internal.backends.api_model import (
+    ArtifactAttribute,
+    Attribute,
+    AttributeType,
+    BoolAttribute,
+    DatetimeAttribute,
+    FileAttribute,
+    FloatAttribute,
+    FloatSeriesAttribute,
+    FloatSeriesValues,
+    ImageSeriesValues,
+    IntAttribute,
+    StringAttribute,
+    StringSeriesAttribute,
+    StringSeriesValues,
+    StringSetAttribute,
+)
+from neptune.internal.backends.fetch_cache import FetchCache
+from neptune.internal.backends.hosted_neptune_backend import HostedNeptuneBackend
+from neptune.internal.container_type import ContainerType
+from neptune.internal.credentials import Credentials
+from neptune.internal.utils.paths import path_to_str
+
+_logger = logging.getLogger(__name__)
+
+
+class ReadOnlyNeptuneBackend(HostedNeptuneBackend):
+    """
+    Backend of read-only containers, which keeps fetched values in a FetchCache.
+
+    Cached values are valid as long as `sys/modification_time` of their container does not change. It is checked
+    on every `get_attributes` call (that is on every `sync`) and otherwise at most once per VALIDATION_INTERVAL
+    seconds, which is the default flush period of runs writing to the container.
+    """
+
+    VALIDATION_INTERVAL = float(os.getenv(NEPTUNE_FETCH_CACHE_VALIDATION_INTERVAL, "5"))
+
+    def __init__(
+        self,
+        credentials: Credentials,
+        proxies: Optional[Dict[str, str]] = None,
+        fetch_cache: Optional[FetchCache] = None,
+    ):
+        super().__init__(credentials=credentials, proxies=proxies)
+        if fetch_cache is None and FetchCache.MAX_SIZE > 0:
+            try:
+                fetch_cache = FetchCache()
+            except (OSError, sql.Error) as e:
+                _logger.warning("Cannot open local cache of fetched values, it will not be used: %s", e)
+        self._fetch_cache = fetch_cache
+        self._versions: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._versions_lock = threading.Lock()
+
+    def close(self) -> None:
+        if self._fetch_cache is not None:
+            _logger.debug(
+                "Local cache of fetched values: %d hits, %d misses", self._fetch_cache.hits, self._fetch_cache.misses
+            )
+            self._fetch_cache.close()
+            self._fetch_cache = None
+        super().close()
+
+    def _get_container_version(
+        self, container_id: str, container_type: ContainerType, refresh: bool = False
+    ) -> Optional[str]:
+        with self._versions_lock:
+            checked_at, version = self._versions.get(container_id, (None, None))
+        if refresh or checked_at is None or time.monotonic() - checked_at > self.VALIDATION_INTERVAL:
+            try:
+                modification_time = super().get_datetime_attribute(
+                    container_id, container_type, ["sys", "modification_time"]
+                )
+                version = str(modification_time.value)
+            except FetchAttributeNotFoundException:
+                # Nothing to validate entries against, so values of such container are not cached
+                version = None
+            with self._versions_lock:
+                self._versions[container_id] = (time.monotonic(), version)
+        return version
+
+    def _cached(
+        self,
+        container_id: str,
+        container_type: ContainerType,
+        key: str,
+        fetch: Callable[[], Any],
+        refresh: bool = False,
+    ) -> Any:
+        if self._fetch_cache is None:
+            return fetch()
+        version = self._get_container_version(container_id, container_type, refresh=refresh)
+        if version is None:
+            return fetch()
+        found, value = self._fetch_cache.get(container_id, key, version)
+        if not found:
+            value = fetch()
+            self._fetch_cache.put(container_id, key, version, value)
+        return value
+
+    def get_attributes(self, container_id: str, container_type: ContainerType) -> List[Attribute]:
+        return self._cached(
+            container_id,
+            container_type,
+            "attributes",
+            partial(super().get_attributes, container_id, container_type),
+            refresh=True,
+        )
+
+    def fetch_atom_attribute_values(
+        self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> List[Tuple[str, AttributeType, Any]]:
+        return self._cached(
+            container_id,
+            container_type,
+            f"atom_values/{path_to_str(path)}",
+            partial(super().fetch_atom_attribute_values, container_id, container_type, path),
+        )
+
+    def get_float_attribute(self, container_id: str, container_type: ContainerType, path: List[str]) -> FloatAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"float/{path_to_str(path)}",
+            partial(super().get_float_attribute, container_id, container_type, path),
+        )
+
+    def get_int_attribute(self, container_id: str, container_type: ContainerType, path: List[str]) -> IntAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"int/{path_to_str(path)}",
+            partial(super().get_int_attribute, container_id, container_type, path),
+        )
+
+    def get_bool_attribute(self, container_id: str, container_type: ContainerType, path: List[str]) -> BoolAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"bool/{path_to_str(path)}",
+            partial(super().get_bool_attribute, container_id, container_type, path),
+        )
+
+    def get_file_attribute(self, container_id: str, container_type: ContainerType, path: List[str]) -> FileAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"file/{path_to_str(path)}",
+            partial(super().get_file_attribute, container_id, container_type, path),
+        )
+
+    def get_string_attribute(
+        self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> StringAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"string/{path_to_str(path)}",
+            partial(super().get_string_attribute, container_id, container_type, path),
+        )
+
+    def get_datetime_attribute(
+        self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> DatetimeAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"datetime/{path_to_str(path)}",
+            partial(super().get_datetime_attribute, container_id, container_type, path),
+        )
+
+    def get_artifact_attribute(
+        self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> ArtifactAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"artifact/{path_to_str(path)}",
+            partial(super().get_artifact_attribute, container_id, container_type, path),
+        )
+
+    def get_float_series_attribute(
+        self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> FloatSeriesAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"float_series/{path_to_str(path)}",
+            partial(super().get_float_series_attribute, container_id, container_type, path),
+        )
+
+    def get_string_series_attribute(
+        self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> StringSeriesAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"string_series/{path_to_str(path)}",
+            partial(super().get_string_series_attribute, container_id, container_type, path),
+        )
+
+    def get_string_set_attribute(
+        self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> StringSetAttribute:
+        return self._cached(
+            container_id,
+            container_type,
+            f"string_set/{path_to_str(path)}",
+            partial(super().get_string_set_attribute, container_id, container_type, path),
+        )
+
+    def get_image_series_values(
+        self,
+        container_id: str,
+        container_type: ContainerType,
+        path: List[str],
+        offset: int,
+        limit: int,
+    ) -> ImageSeriesValues:
+        return self._cached(
+            container_id,
+            container_type,
+            f"image_series_values/{path_to_str(path)}/{offset}/{limit}",
+            partial(super().get_image_series_values, container_id, container_type, path, offset, limit),
+        )
+
+    def get_string_series_values(
+        self,
+        container_id: str,
+        container_type: ContainerType,
+        path: List[str],
+        offset: int,
+        limit: int,
+    ) -> StringSeriesValues:
+        return self._cached(
+            container_id,
+            container_type,
+            f"string_series_values/{path_to_str(path)}/{offset}/{limit}",
+            partial(super().get_string_series_values, container_id, container_type, path, offset, limit),
+        )
+
+    def get_float_series_values(
+        self,
+        container_id: str,
+        container_type: ContainerType,
+        path: List[str],
+        offset: int,
+        limit: int,
+    ) -> FloatSeriesValues:
+        return self._cached(
+            container_id,
+            container_type,
+            f"float_series_values/{path_to_str(path)}/{offset}/{limit}",
+            partial(super().get_float_series_values, container_id, container_type, path, offset, limit),
+        )
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["load_swagger_spec", "store_swagger_spec"]
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from neptune.envs import NEPTUNE_SWAGGER_SPEC_CACHE_TTL
+
+_logger = logging.getLogger(__name__)
+
+# Specs of a server deployment change only when it is upgraded, which does not always change its client config,
+# hence cached specs expire after a day (0 disables the cache)
+SWAGGER_SPEC_CACHE_TTL = int(os.getenv(NEPTUNE_SWAGGER_SPEC_CACHE_TTL, str(24 * 60 * 60)))
+
+
+def _get_spec_path(url: str) -> Path:
+    return Path.home() / ".neptune" / "swagger" / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def load_swagger_spec(url: str, server_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Returns the spec stored for url and server_version, or None if there is no fresh one.
+    """
+    if SWAGGER_SPEC_CACHE_TTL <= 0:
+        return None
+    try:
+        with open(_get_spec_path(url), "r", encoding="utf-8") as spec_file:
+            entry = json.load(spec_file)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(entry, dict)
+        or entry.get("url") != url
+        or entry.get("server_version") != server_version
+        or time.time() - entry.get("stored_at", 0) > SWAGGER_SPEC_CACHE_TTL
+    ):
+        return None
+    return entry.get("spec")
+
+
+def store_swagger_spec(url: str, spec: Dict[str, Any], server_version: Optional[str] = None) -> None:
+    if SWAGGER_SPEC_CACHE_TTL <= 0:
+        return
+    spec_path = _get_spec_path(url)
+    entry = {"url": url, "server_version": server_version, "stored_at": time.time(), "spec": spec}
+    try:
+        os.makedirs(spec_path.parent, exist_ok=True)
+        # Many processes may start at once, so the spec is replaced atomically
+        fd, tmp_path = tempfile.mkstemp(dir=spec_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as spec_file:
+                json.dump(entry, spec_file)
+            os.replace(tmp_path, spec_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        _logger.debug("Cannot store swagger spec of %s: %s", url, e)
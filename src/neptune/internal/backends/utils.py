@@ -64,6 +64,7 @@ from requests import (
 )
 
 from neptune.common.backends.utils import with_api_exceptions_handler
+from neptune.common.patches import apply_patches
 from neptune.envs import NEPTUNE_ALLOW_SELF_SIGNED_CERTIFICATE
 from neptune.exceptions import (
     CannotResolveHostname,
@@ -73,6 +74,10 @@ from neptune.exceptions import (
 )
 from neptune.internal.backends.api_model import ClientConfig
 from neptune.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
+from neptune.internal.backends.swagger_spec_cache import (
+    load_swagger_spec,
+    store_swagger_spec,
+)
 from neptune.internal.operation import (
     CopyAttribute,
     Operation,
@@ -105,17 +110,31 @@ uuid_format = SwaggerFormat(
 
 
 @with_api_exceptions_handler
-def create_swagger_client(url: str, http_client: HttpClient) -> SwaggerClient:
-    return SwaggerClient.from_url(
-        url,
-        config=dict(
-            validate_swagger_spec=False,
-            validate_requests=False,
-            validate_responses=False,
-            formats=[uuid_format],
-        ),
-        http_client=http_client,
+def create_swagger_client(url: str, http_client: HttpClient, server_version: Optional[str] = None) -> SwaggerClient:
+    """
+    Specs are cached on disk per url and server_version, so that they are not downloaded by every process.
+    """
+    # Patched bravado is needed only from here on, so it is not imported along with neptune
+    apply_patches()
+
+    config = dict(
+        validate_swagger_spec=False,
+        validate_requests=False,
+        validate_responses=False,
+        formats=[uuid_format],
     )
+    spec = load_swagger_spec(url, server_version)
+    if spec is not None:
+        try:
+            return SwaggerClient.from_spec(spec, origin_url=url, http_client=http_client, config=config)
+        except Exception as e:
+            _logger.debug("Cannot use cached swagger spec of %s: %s", url, e)
+
+    swagger_client = SwaggerClient.from_url(url, config=config, http_client=http_client)
+    spec = getattr(swagger_client.swagger_spec, "spec_dict", None)
+    if isinstance(spec, dict):
+        store_swagger_spec(url, spec, server_version)
+    return swagger_client
 
 
 def verify_client_version(client_config: ClientConfig, version: Version):
@@ -19,8 +19,10 @@ from collections import deque
 from typing import (
     Callable,
     Generic,
+    Iterator,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -64,6 +66,17 @@ class ContainerStructure(Generic[T, Node]):
         for path in self._iterate_node(root or {}, path_prefix):
             yield path_to_str(path)
 
+    def iterate_attributes(self) -> Iterator[Tuple[List[str], T]]:
+        """Yields paths and values of all attributes, skipping namespaces"""
+        nodes_stack = [(self._structure, [])]
+        while nodes_stack:
+            node, prefix = nodes_stack.pop()
+            for key, value in node.items():
+                if isinstance(value, self._node_type):
+                    nodes_stack.append((value, prefix + [key]))
+                else:
+                    yield prefix + [key], value
+
     def get(self, path: List[str]) -> Union[T, Node, None]:
         ref = self._structure
 
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["QueueElement", "DiskQueue"]
+__all__ = ["QueueElement", "DiskQueue", "Durability", "SegmentFormat"]
 
 import json
 import logging
@@ -21,8 +21,10 @@ import os
 import shutil
 import threading
 from dataclasses import dataclass
+from enum import Enum
 from glob import glob
 from pathlib import Path
+from time import monotonic
 from typing import (
     Callable,
     Generic,
@@ -30,9 +32,20 @@ from typing import (
     Optional,
     Tuple,
     TypeVar,
+    Union,
 )
 
+from neptune.envs import (
+    NEPTUNE_DISK_QUEUE_DURABILITY,
+    NEPTUNE_DISK_QUEUE_FORMAT,
+)
 from neptune.exceptions import MalformedOperation
+from neptune.internal.utils.binary_file_splitter import (
+    BINARY_SEGMENT_MAGIC,
+    BinaryFileSplitter,
+    encode_binary_record,
+    is_binary_segment,
+)
 from neptune.internal.utils.json_file_splitter import JsonFileSplitter
 from neptune.internal.utils.sync_offset_file import SyncOffsetFile
 
@@ -48,9 +61,53 @@ class QueueElement(Generic[T]):
     size: int
 
 
+class SegmentFormat(str, Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+class Durability(str, Enum):
+    """
+    NONE: data and offsets are written to the OS in batches, nothing is fsynced.
+    GROUP_COMMIT: same, but every write is followed by fsync and happens at least every
+        `group_commit_interval` seconds or `group_commit_ops` operations.
+    STRICT: every operation is written and fsynced before `put` returns.
+    """
+
+    NONE = "none"
+    GROUP_COMMIT = "group-commit"
+    STRICT = "strict"
+
+
+class _SegmentReader:
+    """
+    Reads a single `data-*.log` segment regardless of its format. The format is detected lazily,
+    as the segment may still be empty when the reader is created.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        self._splitter: Union[JsonFileSplitter, BinaryFileSplitter, None] = None
+
+    def close(self) -> None:
+        if self._splitter is not None:
+            self._splitter.close()
+
+    def get_with_size(self) -> Tuple[Optional[dict], int]:
+        if self._splitter is None:
+            binary = is_binary_segment(self._file_path)
+            if binary is None:
+                return None, 0
+            self._splitter = BinaryFileSplitter(self._file_path) if binary else JsonFileSplitter(self._file_path)
+        return self._splitter.get_with_size()
+
+
 class DiskQueue(Generic[T]):
     # NOTICE: This class is thread-safe as long as there is only one consumer and one producer.
     DEFAULT_MAX_BATCH_SIZE_BYTES = 100 * 1024**2
+    WRITE_BUFFER_SIZE = 64 * 1024
+    DEFAULT_GROUP_COMMIT_INTERVAL = 0.1
+    DEFAULT_GROUP_COMMIT_OPS = 1000
 
     def __init__(
         self,
@@ -60,6 +117,10 @@ class DiskQueue(Generic[T]):
         lock: threading.RLock,
         max_file_size: int = 64 * 1024**2,
         max_batch_size_bytes: int = None,
+        segment_format: Optional[SegmentFormat] = None,
+        durability: Optional[Durability] = None,
+        group_commit_interval: float = DEFAULT_GROUP_COMMIT_INTERVAL,
+        group_commit_ops: int = DEFAULT_GROUP_COMMIT_OPS,
     ):
         self._dir_path = dir_path.resolve()
         self._to_dict = to_dict
@@ -68,6 +129,12 @@ class DiskQueue(Generic[T]):
         self._max_batch_size_bytes = max_batch_size_bytes or int(
             os.environ.get("NEPTUNE_MAX_BATCH_SIZE_BYTES") or str(self.DEFAULT_MAX_BATCH_SIZE_BYTES)
         )
+        self._segment_format = SegmentFormat(
+            segment_format or os.environ.get(NEPTUNE_DISK_QUEUE_FORMAT) or SegmentFormat.JSON
+        )
+        self._durability = Durability(durability or os.environ.get(NEPTUNE_DISK_QUEUE_DURABILITY) or Durability.NONE)
+        self._group_commit_interval = group_commit_interval
+        self._group_commit_ops = group_commit_ops
 
         try:
             os.makedirs(self._dir_path)
@@ -81,27 +148,65 @@ class DiskQueue(Generic[T]):
             self._read_file_version,
             self._write_file_version,
         ) = self._get_first_and_last_log_file_version()
-        self._writer = open(self._get_log_file(self._write_file_version), "a")
-        self._reader = JsonFileSplitter(self._get_log_file(self._read_file_version))
+        self._writer = None
+        if self._get_segment_format(self._write_file_version) in (None, self._segment_format):
+            self._writer = self._open_writer(self._write_file_version)
+        # Otherwise the last segment was written in a different format and a new one is started on next `put`
+        self._reader = _SegmentReader(self._get_log_file(self._read_file_version))
         self._file_size = 0
         self._should_skip_to_ack = True
 
+        # Records are buffered here and written together with the offset on commit
+        self._write_lock = threading.Lock()
+        self._write_buffer: List[bytes] = []
+        self._write_buffer_size = 0
+        self._last_commit = monotonic()
+
         self._empty_cond = threading.Condition(lock)
 
     def put(self, obj: T) -> int:
         version = self._last_put_file.read_local() + 1
-        _json = json.dumps(self._serialize(obj, version))
-        if self._file_size + len(_json) > self._max_file_size:
-            self._writer.flush()
-            self._writer.close()
-            self._writer = open(self._get_log_file(version), "a")
-            self._file_size = 0
-            self._write_file_version = version
-        self._writer.write(_json + "\n")
-        self._last_put_file.write(version)
-        self._file_size += len(_json) + 1
+        record = self._encode(self._serialize(obj, version))
+        with self._write_lock:
+            if self._writer is None or self._file_size + len(record) > self._max_file_size:
+                if self._writer is not None:
+                    self._commit(fsync=self._durability != Durability.NONE)
+                    self._writer.close()
+                self._writer = self._open_writer(version)
+                self._file_size = 0
+                self._write_file_version = version
+            self._write_buffer.append(record)
+            self._write_buffer_size += len(record)
+            self._last_put_file.write_local(version)
+            self._file_size += len(record)
+
+            if self._durability == Durability.STRICT:
+                self._commit(fsync=True)
+            elif self._durability == Durability.GROUP_COMMIT:
+                if (
+                    len(self._write_buffer) >= self._group_commit_ops
+                    or self._write_buffer_size >= self.WRITE_BUFFER_SIZE
+                    or monotonic() - self._last_commit >= self._group_commit_interval
+                ):
+                    self._commit(fsync=True)
+            elif self._write_buffer_size >= self.WRITE_BUFFER_SIZE:
+                self._commit(fsync=False)
         return version
 
+    def _commit(self, fsync: bool) -> None:
+        # Offset goes first, so that after a crash it can only be ahead of the data on disk, never behind it
+        if fsync:
+            self._last_put_file.fsync()
+        else:
+            self._last_put_file.flush()
+        if self._write_buffer:
+            self._writer.write(b"".join(self._write_buffer))
+            self._write_buffer = []
+            self._write_buffer_size = 0
+        if fsync:
+            os.fsync(self._writer.fileno())
+        self._last_commit = monotonic()
+
     def get(self) -> Optional[QueueElement[T]]:
         if self._should_skip_to_ack:
             return self._skip_and_get()
@@ -131,7 +236,7 @@ class DiskQueue(Generic[T]):
                 return None
             self._reader.close()
             self._read_file_version = self._next_log_file_version(self._read_file_version)
-            self._reader = JsonFileSplitter(self._get_log_file(self._read_file_version))
+            self._reader = _SegmentReader(self._get_log_file(self._read_file_version))
             # It is safe. Max recursion level is 2.
             return self._get()
         try:
@@ -162,7 +267,9 @@ class DiskQueue(Generic[T]):
         return ret
 
     def flush(self):
-        self._writer.flush()
+        with self._write_lock:
+            if self._writer is not None:
+                self._commit(fsync=self._durability != Durability.NONE)
         self._last_ack_file.flush()
         self._last_put_file.flush()
 
@@ -171,13 +278,24 @@ class DiskQueue(Generic[T]):
         Close and remove underlying files if queue is empty
         """
         self._reader.close()
-        self._writer.close()
+        with self._write_lock:
+            if self._writer is not None:
+                self._commit(fsync=self._durability != Durability.NONE)
+                self._writer.close()
         self._last_ack_file.close()
         self._last_put_file.close()
 
         if self.is_empty():
             self._remove_data()
 
+    def __del__(self):
+        # Like a buffered file object, a queue dropped without `flush` or `close` writes out its buffered records
+        try:
+            if self._write_buffer and self._writer is not None and not self._writer.closed:
+                self._commit(fsync=False)
+        except Exception:
+            pass
+
     def _remove_data(self):
         path = self._dir_path
         shutil.rmtree(path, ignore_errors=True)
@@ -229,6 +347,27 @@ class DiskQueue(Generic[T]):
     def _get_log_file(self, index: int) -> str:
         return "{}/data-{}.log".format(self._dir_path, index)
 
+    def _open_writer(self, version: int):
+        # Unbuffered, as writes are batched in `_write_buffer`
+        writer = open(self._get_log_file(version), "ab", buffering=0)
+        if self._segment_format == SegmentFormat.BINARY and writer.tell() == 0:
+            writer.write(BINARY_SEGMENT_MAGIC)
+        return writer
+
+    def _get_segment_format(self, version: int) -> Optional[SegmentFormat]:
+        try:
+            binary = is_binary_segment(self._get_log_file(version))
+        except FileNotFoundError:
+            return None
+        if binary is None:
+            return None
+        return SegmentFormat.BINARY if binary else SegmentFormat.JSON
+
+    def _encode(self, data: dict) -> bytes:
+        if self._segment_format == SegmentFormat.BINARY:
+            return encode_binary_record(data)
+        return (json.dumps(data) + "\n").encode("utf-8")
+
     def _get_all_log_file_versions(self):
         log_files = glob("{}/data-*.log".format(self._dir_path))
         if not log_files:
@@ -23,22 +23,18 @@ from typing import (
     TYPE_CHECKING,
     Dict,
     Optional,
+    Set,
+    Tuple,
 )
 
-from neptune.common.hardware.gauges.gauge_factory import GaugeFactory
-from neptune.common.hardware.gauges.gauge_mode import GaugeMode
-from neptune.common.hardware.metrics.metrics_factory import MetricsFactory
-from neptune.common.hardware.metrics.reports.metric_reporter import MetricReporter
-from neptune.common.hardware.metrics.reports.metric_reporter_factory import MetricReporterFactory
-from neptune.common.hardware.resources.system_resource_info_factory import SystemResourceInfoFactory
-from neptune.common.hardware.system.system_monitor import SystemMonitor
+from neptune.attributes.series.float_series import FloatSeries as FloatSeriesAttribute
 from neptune.common.utils import in_docker
 from neptune.internal.background_job import BackgroundJob
-from neptune.internal.hardware.gpu.gpu_monitor import GPUMonitor
 from neptune.internal.threading.daemon import Daemon
 from neptune.types.series import FloatSeries
 
 if TYPE_CHECKING:
+    from neptune.common.hardware.metrics.reports.metric_reporter import MetricReporter
     from neptune.metadata_containers import MetadataContainer
 
 _logger = logging.getLogger(__name__)
@@ -53,6 +49,15 @@ class HardwareMetricReportingJob(BackgroundJob):
         self._attribute_namespace = attribute_namespace
 
     def start(self, container: "MetadataContainer"):
+        # The gauge stack (psutil, GPU bindings) is loaded only by runs that capture hardware metrics
+        from neptune.common.hardware.gauges.gauge_factory import GaugeFactory
+        from neptune.common.hardware.gauges.gauge_mode import GaugeMode
+        from neptune.common.hardware.metrics.metrics_factory import MetricsFactory
+        from neptune.common.hardware.metrics.reports.metric_reporter_factory import MetricReporterFactory
+        from neptune.common.hardware.resources.system_resource_info_factory import SystemResourceInfoFactory
+        from neptune.common.hardware.system.system_monitor import SystemMonitor
+        from neptune.internal.hardware.gpu.gpu_monitor import GPUMonitor
+
         gauge_mode = GaugeMode.CGROUP if in_docker() else GaugeMode.SYSTEM
         system_resource_info = SystemResourceInfoFactory(
             system_monitor=SystemMonitor(),
@@ -67,13 +72,15 @@ class HardwareMetricReportingJob(BackgroundJob):
         for metric in metrics_container.metrics():
             self._gauges_in_resource[metric.resource_type] = len(metric.gauges)
 
+        paths: Dict[Tuple[str, str], str] = dict()
         for metric in metrics_container.metrics():
             for gauge in metric.gauges:
                 path = self.get_attribute_name(metric.resource_type, gauge.name())
                 if not container.get_attribute(path):
                     container[path] = FloatSeries([], min=metric.min_value, max=metric.max_value, unit=metric.unit)
+                paths[(metric.resource_type, gauge.name())] = path
 
-        self._thread = self.ReportingThread(self, self._period, container, metric_reporter)
+        self._thread = self.ReportingThread(self._period, container, metric_reporter, paths)
         self._thread.start()
         self._started = True
 
@@ -102,21 +109,45 @@ class HardwareMetricReportingJob(BackgroundJob):
     class ReportingThread(Daemon):
         def __init__(
             self,
-            outer: "HardwareMetricReportingJob",
             period: float,
             container: "MetadataContainer",
-            metric_reporter: MetricReporter,
+            metric_reporter: "MetricReporter",
+            paths: Dict[Tuple[str, str], str],
         ):
             super().__init__(sleep_time=period, name="NeptuneReporting")
-            self._outer = outer
             self._container = container
             self._metric_reporter = metric_reporter
+            # Paths of gauges by resource type and gauge name, resolved once instead of on every report
+            self._paths = paths
+            self._skipped_paths: Set[str] = set()
 
         def work(self) -> None:
             metric_reports = self._metric_reporter.report(time.time())
-            for report in metric_reports:
-                for gauge_name, metric_values in groupby(report.values, lambda value: value.gauge_name):
-                    attr = self._container[self._outer.get_attribute_name(report.metric.resource_type, gauge_name)]
-                    # TODO: Avoid loop
-                    for metric_value in metric_values:
-                        attr.log(value=metric_value.value, timestamp=metric_value.timestamp)
+            with self._container.lock():
+                operations = []
+                for report in metric_reports:
+                    for gauge_name, metric_values in groupby(report.values, lambda value: value.gauge_name):
+                        attribute = self._get_attribute(self._paths[(report.metric.resource_type, gauge_name)])
+                        if attribute is None:
+                            continue
+                        metric_values = list(metric_values)
+                        value = FloatSeries(
+                            [metric_value.value for metric_value in metric_values],
+                            timestamps=[metric_value.timestamp for metric_value in metric_values],
+                        )
+                        operations.extend(attribute._get_append_operations(value))
+                # All gauges are reported with a single enqueue
+                self._container._enqueue_operations(operations, wait=False)
+
+        def _get_attribute(self, path: str) -> Optional[FloatSeriesAttribute]:
+            # Fields can be deleted, or retyped by a sync, while the job runs
+            attribute = self._container.get_attribute(path)
+            if attribute is None:
+                self._container[path] = FloatSeries([])
+                attribute = self._container.get_attribute(path)
+            if not isinstance(attribute, FloatSeriesAttribute):
+                if path not in self._skipped_paths:
+                    self._skipped_paths.add(path)
+                    _logger.warning("Field %s is not a float series, hardware metrics are not logged to it", path)
+                return None
+            return attribute
@@ -14,18 +14,26 @@
 # limitations under the License.
 #
 import abc
+import inspect
 import os
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import repeat
 from typing import (
     TYPE_CHECKING,
+    Callable,
+    Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 from neptune.common.exceptions import (
@@ -53,6 +61,7 @@ def all_subclasses(cls):
 
 @dataclass
 class Operation(abc.ABC):
+    __slots__ = ("path",)
 
     path: List[str]
 
@@ -70,14 +79,19 @@ class Operation(abc.ABC):
     def from_dict(data: dict) -> "Operation":
         if "type" not in data:
             raise ValueError("Malformed operation {} - type is missing".format(data))
-        sub_classes = {cls.__name__: cls for cls in all_subclasses(Operation)}
-        if not data["type"] in sub_classes:
-            raise ValueError("Malformed operation {} - unknown type {}".format(data, data["type"]))
-        return sub_classes[data["type"]].from_dict(data)
+        decoder = _OPERATION_DECODERS.get(data["type"])
+        if decoder is None:
+            # operations defined after this module was imported are registered on first use
+            _register_operation_decoders()
+            decoder = _OPERATION_DECODERS.get(data["type"])
+            if decoder is None:
+                raise ValueError("Malformed operation {} - unknown type {}".format(data, data["type"]))
+        return decoder(data)
 
 
 @dataclass
 class AssignFloat(Operation):
+    __slots__ = ("value",)
 
     value: float
 
@@ -96,6 +110,7 @@ class AssignFloat(Operation):
 
 @dataclass
 class AssignInt(Operation):
+    __slots__ = ("value",)
 
     value: int
 
@@ -114,6 +129,7 @@ class AssignInt(Operation):
 
 @dataclass
 class AssignBool(Operation):
+    __slots__ = ("value",)
 
     value: bool
 
@@ -132,6 +148,7 @@ class AssignBool(Operation):
 
 @dataclass
 class AssignString(Operation):
+    __slots__ = ("value",)
 
     value: str
 
@@ -150,6 +167,7 @@ class AssignString(Operation):
 
 @dataclass
 class AssignDatetime(Operation):
+    __slots__ = ("value",)
 
     value: datetime
 
@@ -168,6 +186,7 @@ class AssignDatetime(Operation):
 
 @dataclass
 class AssignArtifact(Operation):
+    __slots__ = ("hash",)
 
     hash: str
 
@@ -184,6 +203,7 @@ class AssignArtifact(Operation):
         return AssignArtifact(data["path"], str(data["hash"]))
 
 
+# no __slots__, as they cannot be combined with default values of dataclass fields
 @dataclass
 class UploadFile(Operation):
 
@@ -253,6 +273,7 @@ class UploadFile(Operation):
 
 @dataclass
 class UploadFileContent(Operation):
+    __slots__ = ("ext", "file_content")
 
     ext: str
     file_content: str
@@ -273,6 +294,7 @@ class UploadFileContent(Operation):
 
 @dataclass
 class UploadFileSet(Operation):
+    __slots__ = ("file_globs", "reset")
 
     file_globs: List[str]
     reset: bool
@@ -292,11 +314,12 @@ class UploadFileSet(Operation):
 
 
 class LogOperation(Operation, abc.ABC):
-    pass
+    __slots__ = ()
 
 
 @dataclass
 class LogSeriesValue(Generic[T]):
+    __slots__ = ("value", "step", "ts")
 
     value: T
     step: Optional[float]
@@ -307,34 +330,123 @@ class LogSeriesValue(Generic[T]):
 
     @staticmethod
     def from_dict(data: dict, value_deserializer=lambda x: x) -> "LogSeriesValue[T]":
-        return LogSeriesValue[T](value_deserializer(data["value"]), data.get("step", None), data["ts"])
+        return LogSeriesValue(value_deserializer(data["value"]), data.get("step", None), data["ts"])
+
+
+def _to_list(column: Sequence) -> list:
+    if isinstance(column, list):
+        return column
+    if hasattr(column, "tolist"):
+        return column.tolist()
+    return list(column)
+
+
+class LogSeriesColumns(Generic[T]):
+    """
+    Values of a series kept as columns, e.g. slices of NumPy arrays, instead of a list of `LogSeriesValue`.
+
+    It behaves like a sequence of `LogSeriesValue`, but the values are expanded only when iterated, so that
+    operations logging big arrays are batched, queued and merged without creating an object per value.
+    `steps` is None if no value has a step.
+    """
+
+    __slots__ = ("values", "steps", "timestamps")
+
+    def __init__(self, values: Sequence[T], steps: Optional[Sequence[Optional[float]]], timestamps: Sequence[float]):
+        self.values = values
+        self.steps = steps
+        self.timestamps = timestamps
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[LogSeriesValue[T]]:
+        values, steps, timestamps = self.as_lists()
+        for value, step, ts in zip(values, steps if steps is not None else repeat(None), timestamps):
+            yield LogSeriesValue(value, step, ts)
+
+    def __getitem__(self, index: int) -> LogSeriesValue[T]:
+        values, steps, timestamps = self.as_lists()
+        return LogSeriesValue(values[index], steps[index] if steps is not None else None, timestamps[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LogSeriesColumns, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LogSeriesColumns({list(self)!r})"
+
+    def as_lists(self) -> Tuple[list, Optional[list], list]:
+        return (
+            _to_list(self.values),
+            _to_list(self.steps) if self.steps is not None else None,
+            _to_list(self.timestamps),
+        )
+
+    def copy(self) -> "LogSeriesColumns[T]":
+        values, steps, timestamps = self.as_lists()
+        return LogSeriesColumns(list(values), list(steps) if steps is not None else None, list(timestamps))
+
+    def extend(self, other: Iterable[LogSeriesValue[T]]) -> None:
+        if isinstance(other, LogSeriesColumns):
+            other_values, other_steps, other_timestamps = other.as_lists()
+        else:
+            other = list(other)
+            other_values = [value.value for value in other]
+            other_steps = [value.step for value in other]
+            other_timestamps = [value.ts for value in other]
+        self.values, self.steps, self.timestamps = self.as_lists()
+        self.values.extend(other_values)
+        self.timestamps.extend(other_timestamps)
+        if self.steps is None and other_steps is not None:
+            self.steps = [None] * (len(self.values) - len(other_values))
+        if self.steps is not None:
+            self.steps.extend(other_steps if other_steps is not None else repeat(None, len(other_values)))
+
+    def to_dict(self) -> dict:
+        values, steps, timestamps = self.as_lists()
+        return {"value": values, "step": steps, "ts": timestamps}
+
+    @staticmethod
+    def from_dict(data: dict) -> "LogSeriesColumns[T]":
+        return LogSeriesColumns(data["value"], data["step"], data["ts"])
 
 
 @dataclass
 class LogFloats(LogOperation):
+    __slots__ = ("values",)
 
     ValueType = LogSeriesValue[float]
 
-    values: List[ValueType]
+    values: Union[List[ValueType], LogSeriesColumns[float]]
 
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_log_floats(self)
 
     def to_dict(self) -> dict:
-        ret = super().to_dict()
-        ret["values"] = [value.to_dict() for value in self.values]
-        return ret
+        if isinstance(self.values, LogSeriesColumns):
+            return {"type": "LogFloats", "path": self.path, "columns": self.values.to_dict()}
+        # series values are inlined, as queues of millions of them are replayed by `neptune sync`
+        return {
+            "type": "LogFloats",
+            "path": self.path,
+            "values": [{"value": value.value, "step": value.step, "ts": value.ts} for value in self.values],
+        }
 
     @staticmethod
     def from_dict(data: dict) -> "LogFloats":
+        if "columns" in data:
+            return LogFloats(data["path"], LogSeriesColumns.from_dict(data["columns"]))
         return LogFloats(
             data["path"],
-            [LogFloats.ValueType.from_dict(value) for value in data["values"]],
+            [LogSeriesValue(value["value"], value.get("step"), value["ts"]) for value in data["values"]],
         )
 
 
 @dataclass
 class LogStrings(LogOperation):
+    __slots__ = ("values",)
 
     ValueType = LogSeriesValue[str]
 
@@ -344,20 +456,23 @@ class LogStrings(LogOperation):
         return visitor.visit_log_strings(self)
 
     def to_dict(self) -> dict:
-        ret = super().to_dict()
-        ret["values"] = [value.to_dict() for value in self.values]
-        return ret
+        return {
+            "type": "LogStrings",
+            "path": self.path,
+            "values": [{"value": value.value, "step": value.step, "ts": value.ts} for value in self.values],
+        }
 
     @staticmethod
     def from_dict(data: dict) -> "LogStrings":
         return LogStrings(
             data["path"],
-            [LogStrings.ValueType.from_dict(value) for value in data["values"]],
+            [LogSeriesValue(value["value"], value.get("step"), value["ts"]) for value in data["values"]],
         )
 
 
 @dataclass
 class ImageValue:
+    __slots__ = ("data", "name", "description")
     data: Optional[str]
     name: Optional[str]
     description: Optional[str]
@@ -380,6 +495,7 @@ class ImageValue:
 
 @dataclass
 class LogImages(LogOperation):
+    __slots__ = ("values",)
 
     ValueType = LogSeriesValue[ImageValue]
 
@@ -403,6 +519,8 @@ class LogImages(LogOperation):
 
 @dataclass
 class ClearFloatLog(Operation):
+    __slots__ = ()
+
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_clear_float_log(self)
 
@@ -413,6 +531,8 @@ class ClearFloatLog(Operation):
 
 @dataclass
 class ClearStringLog(Operation):
+    __slots__ = ()
+
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_clear_string_log(self)
 
@@ -423,6 +543,8 @@ class ClearStringLog(Operation):
 
 @dataclass
 class ClearImageLog(Operation):
+    __slots__ = ()
+
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_clear_image_log(self)
 
@@ -433,6 +555,7 @@ class ClearImageLog(Operation):
 
 @dataclass
 class ConfigFloatSeries(Operation):
+    __slots__ = ("min", "max", "unit")
 
     min: Optional[float]
     max: Optional[float]
@@ -455,6 +578,7 @@ class ConfigFloatSeries(Operation):
 
 @dataclass
 class AddStrings(Operation):
+    __slots__ = ("values",)
 
     values: Set[str]
 
@@ -473,6 +597,7 @@ class AddStrings(Operation):
 
 @dataclass
 class RemoveStrings(Operation):
+    __slots__ = ("values",)
 
     values: Set[str]
 
@@ -491,6 +616,8 @@ class RemoveStrings(Operation):
 
 @dataclass
 class ClearStringSet(Operation):
+    __slots__ = ()
+
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_clear_string_set(self)
 
@@ -501,6 +628,7 @@ class ClearStringSet(Operation):
 
 @dataclass
 class DeleteFiles(Operation):
+    __slots__ = ("file_paths",)
 
     file_paths: Set[str]
 
@@ -519,6 +647,8 @@ class DeleteFiles(Operation):
 
 @dataclass
 class DeleteAttribute(Operation):
+    __slots__ = ()
+
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_delete_attribute(self)
 
@@ -529,6 +659,7 @@ class DeleteAttribute(Operation):
 
 @dataclass
 class TrackFilesToArtifact(Operation):
+    __slots__ = ("project_id", "entries")
     project_id: str
     entries: List[Tuple[str, Optional[str]]]
 
@@ -552,6 +683,8 @@ class TrackFilesToArtifact(Operation):
 
 @dataclass
 class ClearArtifact(Operation):
+    __slots__ = ()
+
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_clear_artifact(self)
 
@@ -562,6 +695,7 @@ class ClearArtifact(Operation):
 
 @dataclass
 class CopyAttribute(Operation):
+    __slots__ = ("container_id", "container_type", "source_path", "source_attr_cls")
     container_id: str
     container_type: ContainerType
     source_path: List[str]
@@ -603,3 +737,15 @@ class CopyAttribute(Operation):
         create_assignment_operation = self.source_attr_cls.create_assignment_operation
         value = getter(backend, self.container_id, self.container_type, self.source_path)
         return create_assignment_operation(self.path, value)
+
+
+_OPERATION_DECODERS: Dict[str, Callable[[dict], Operation]] = {}
+
+
+def _register_operation_decoders() -> None:
+    _OPERATION_DECODERS.update(
+        {cls.__name__: cls.from_dict for cls in all_subclasses(Operation) if not inspect.isabstract(cls)}
+    )
+
+
+_register_operation_decoders()
@@ -18,6 +18,7 @@ __all__ = ("AsyncOperationProcessor",)
 import logging
 import os
 import threading
+from collections import deque
 from datetime import datetime
 from time import (
     monotonic,
@@ -32,7 +33,10 @@ from neptune.constants import (
     ASYNC_DIRECTORY,
     NEPTUNE_DATA_DIRECTORY,
 )
-from neptune.envs import NEPTUNE_SYNC_AFTER_STOP_TIMEOUT
+from neptune.envs import (
+    NEPTUNE_SYNC_AFTER_STOP_TIMEOUT,
+    NEPTUNE_SYNC_PREFETCH_DEPTH,
+)
 from neptune.exceptions import NeptuneSynchronizationAlreadyStoppedException
 from neptune.internal.backends.neptune_backend import NeptuneBackend
 from neptune.internal.container_type import ContainerType
@@ -42,6 +46,7 @@ from neptune.internal.operation import Operation
 from neptune.internal.operation_processors.operation_processor import OperationProcessor
 from neptune.internal.operation_processors.operation_storage import OperationStorage
 from neptune.internal.threading.daemon import Daemon
+from neptune.internal.threading.prefetcher import Prefetcher
 from neptune.internal.utils.logger import logger
 
 _logger = logging.getLogger(__name__)
@@ -50,6 +55,8 @@ _logger = logging.getLogger(__name__)
 class AsyncOperationProcessor(OperationProcessor):
     STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS = 30
     STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS = int(os.getenv(NEPTUNE_SYNC_AFTER_STOP_TIMEOUT, "300"))
+    WRITER_SLEEP_TIME = 0.1
+    DEFAULT_PREFETCH_DEPTH = int(os.getenv(NEPTUNE_SYNC_PREFETCH_DEPTH, "1"))
 
     def __init__(
         self,
@@ -59,6 +66,8 @@ class AsyncOperationProcessor(OperationProcessor):
         lock: threading.RLock,
         sleep_time: float = 5,
         batch_size: int = 1000,
+        ring_buffer_size: int = 10000,
+        prefetch_depth: int = DEFAULT_PREFETCH_DEPTH,
     ):
         self._operation_storage = OperationStorage(self._init_data_path(container_id, container_type))
 
@@ -75,7 +84,16 @@ class AsyncOperationProcessor(OperationProcessor):
         self._batch_size = batch_size
         self._last_version = 0
         self._consumed_version = 0
-        self._consumer = self.ConsumerThread(self, sleep_time, batch_size)
+        self._consumer = self.ConsumerThread(self, sleep_time, batch_size, prefetch_depth)
+
+        # Operations are put in this in-memory ring first and written to disk in batches by the writer thread,
+        # so that callers don't pay for the serialization. `deque.append` and `deque.popleft` are thread-safe.
+        self._ring = deque()
+        self._ring_buffer_size = ring_buffer_size
+        self._drain_lock = threading.Lock()
+        self._writer = self.WriterThread(self, self.WRITER_SLEEP_TIME)
+        # Error of the writer thread, raised to the next caller of `enqueue_operation`, `flush` or `wait`
+        self._writer_error: Optional[Exception] = None
 
         # Caller is responsible for taking this lock
         self._waiting_cond = threading.Condition(lock=lock)
@@ -89,12 +107,43 @@ class AsyncOperationProcessor(OperationProcessor):
         return data_path
 
     def enqueue_operation(self, op: Operation, *, wait: bool) -> None:
-        self._last_version = self._queue.put(op)
-        if self._queue.size() > self._batch_size / 2:
-            self._consumer.wake_up()
+        self._raise_writer_error()
+        self._ring.append(op)
+        ring_size = len(self._ring)
+        if ring_size >= self._ring_buffer_size:
+            # Writer thread can't keep up, write to disk on the caller thread
+            self._drain_ring()
+        elif ring_size == self._ring_buffer_size // 2:
+            self._writer.wake_up()
         if wait:
             self.wait()
 
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        self._raise_writer_error()
+        self._ring.extend(ops)
+        ring_size = len(self._ring)
+        if ring_size >= self._ring_buffer_size:
+            self._drain_ring()
+        elif ring_size - len(ops) < self._ring_buffer_size // 2 <= ring_size:
+            self._writer.wake_up()
+        if wait:
+            self.wait()
+
+    def _drain_ring(self) -> None:
+        """Writes operations from the ring to disk; if one cannot be stored, the error is raised
+        and that operation and the ones after it are left in the ring."""
+        with self._drain_lock:
+            while self._ring:
+                self._last_version = self._queue.put(self._ring[0])
+                self._ring.popleft()
+        if self._queue.size() > self._batch_size / 2:
+            self._consumer.wake_up()
+
+    def _raise_writer_error(self) -> None:
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise error
+
     def wait(self):
         self.flush()
         waiting_for_version = self._last_version
@@ -109,16 +158,21 @@ class AsyncOperationProcessor(OperationProcessor):
             raise NeptuneSynchronizationAlreadyStoppedException()
 
     def flush(self):
+        self._raise_writer_error()
+        self._drain_ring()
         self._queue.flush()
 
     def start(self):
+        self._writer.start()
         self._consumer.start()
 
     def pause(self):
+        self._writer.pause()
         self._consumer.pause()
-        self._queue.flush()
+        self.flush()
 
     def resume(self):
+        self._writer.resume()
         self._consumer.resume()
 
     def _wait_for_queue_empty(self, initial_queue_size: int, seconds: Optional[float]):
@@ -195,9 +249,15 @@ class AsyncOperationProcessor(OperationProcessor):
                 already_synced_proc,
             )
 
+    def _stop_writer(self):
+        if self._writer.is_alive():
+            self._writer.interrupt()
+            self._writer.join()
+
     def stop(self, seconds: Optional[float] = None):
         ts = time()
-        self._queue.flush()
+        self._stop_writer()
+        self.flush()
         if self._consumer.is_running():
             self._consumer.disable_sleep()
             self._consumer.wake_up()
@@ -208,19 +268,41 @@ class AsyncOperationProcessor(OperationProcessor):
         self._queue.close()
 
     def close(self):
+        self._stop_writer()
+        self._drain_ring()
         self._queue.close()
 
+    class WriterThread(Daemon):
+        def __init__(self, processor: "AsyncOperationProcessor", sleep_time: float):
+            super().__init__(sleep_time=sleep_time, name="NeptuneAsyncOpWriter")
+            self._processor = processor
+
+        def work(self) -> None:
+            try:
+                self._processor._drain_ring()
+            except Exception as e:
+                _logger.exception("Failed to store operation on disk")
+                self._processor._writer_error = e
+
     class ConsumerThread(Daemon):
         def __init__(
             self,
             processor: "AsyncOperationProcessor",
             sleep_time: float,
             batch_size: int,
+            prefetch_depth: int,
         ):
             super().__init__(sleep_time=sleep_time, name="NeptuneAsyncOpProcessor")
             self._processor = processor
             self._batch_size = batch_size
             self._last_flush = 0
+            # Next batches are read from disk and deserialized while the current one is being sent.
+            # Batches are still sent one by one, as the order of operations has to be preserved.
+            self._prefetcher = Prefetcher(
+                lambda: self._processor._queue.get_batch(self._batch_size),
+                depth=prefetch_depth,
+                name="NeptuneAsyncOpPrefetcher",
+            )
 
         def run(self):
             try:
@@ -229,6 +311,8 @@ class AsyncOperationProcessor(OperationProcessor):
                 with self._processor._waiting_cond:
                     self._processor._waiting_cond.notify_all()
                 raise
+            finally:
+                self._prefetcher.close()
 
         def work(self) -> None:
             ts = time()
@@ -237,7 +321,7 @@ class AsyncOperationProcessor(OperationProcessor):
                 self._processor._queue.flush()
 
             while True:
-                batch = self._processor._queue.get_batch(self._batch_size)
+                batch = self._prefetcher.get()
                 if not batch:
                     return
                 self.process_batch([element.obj for element in batch], batch[-1].ver)
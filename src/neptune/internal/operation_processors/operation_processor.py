@@ -16,7 +16,10 @@
 __all__ = ("OperationProcessor",)
 
 import abc
-from typing import Optional
+from typing import (
+    List,
+    Optional,
+)
 
 from neptune.internal.operation import Operation
 
@@ -26,6 +29,13 @@ class OperationProcessor(abc.ABC):
     def enqueue_operation(self, op: Operation, *, wait: bool) -> None:
         pass
 
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        """Enqueues `ops` in order; callers take the container lock once for all of them."""
+        for op in ops:
+            self.enqueue_operation(op, wait=False)
+        if wait:
+            self.wait()
+
     @abc.abstractmethod
     def wait(self) -> None:
         pass
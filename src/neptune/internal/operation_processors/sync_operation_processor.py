@@ -16,7 +16,10 @@
 __all__ = ("SyncOperationProcessor",)
 
 from datetime import datetime
-from typing import Optional
+from typing import (
+    List,
+    Optional,
+)
 
 from neptune.constants import (
     NEPTUNE_DATA_DIRECTORY,
@@ -45,10 +48,13 @@ class SyncOperationProcessor(OperationProcessor):
         return data_path
 
     def enqueue_operation(self, op: Operation, *, wait: bool) -> None:
+        self.enqueue_operations([op], wait=wait)
+
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
         _, errors = self._backend.execute_operations(
             container_id=self._container_id,
             container_type=self._container_type,
-            operations=[op],
+            operations=ops,
             operation_storage=self._operation_storage,
         )
         if errors:
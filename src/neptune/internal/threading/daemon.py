@@ -39,6 +39,8 @@ class Daemon(threading.Thread):
         self._sleep_time = sleep_time
         self._state: Daemon.DaemonState = Daemon.DaemonState.INIT
         self._wait_condition = threading.Condition()
+        # Set by `wake_up` calls made while working, so that they are not lost and no sleep follows
+        self._woken_up = False
         self.last_backoff_time = 0  # used only with ConnectionRetryWrapper decorator
 
     def interrupt(self):
@@ -62,6 +64,7 @@ class Daemon(threading.Thread):
 
     def wake_up(self):
         with self._wait_condition:
+            self._woken_up = True
             self._wait_condition.notify_all()
 
     def disable_sleep(self):
@@ -92,10 +95,15 @@ class Daemon(threading.Thread):
                         self._wait_condition.wait_for(lambda: self._state != Daemon.DaemonState.PAUSED)
 
                 if self._state == Daemon.DaemonState.WORKING:
+                    with self._wait_condition:
+                        self._woken_up = False
                     self.work()
                     with self._wait_condition:
                         if self._sleep_time > 0 and not self._is_interrupted():
-                            self._wait_condition.wait(timeout=self._sleep_time)
+                            self._wait_condition.wait_for(
+                                lambda: self._woken_up or self._state != Daemon.DaemonState.WORKING,
+                                timeout=self._sleep_time,
+                            )
         finally:
             with self._wait_condition:
                 self._state = Daemon.DaemonState.STOPPED
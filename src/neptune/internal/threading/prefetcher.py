@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["Prefetcher"]
+
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Callable,
+    Deque,
+    Generic,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class Prefetcher(Generic[T]):
+    """
+    Calls `fetch` in a background thread, so that up to `depth` results are already prepared while the caller
+    processes the one returned by `get`. Results are returned in the order they were fetched.
+    With `depth` equal to 0 `fetch` is called directly by `get`.
+
+    Empty results, e.g. empty batches of a queue, are not returned from ahead, as new items may have been added
+    after they were fetched; `fetch` is called again instead. After an empty result nothing is fetched ahead,
+    so that an idle caller does not keep a stale empty result pending.
+    """
+
+    def __init__(self, fetch: Callable[[], T], depth: int, name: str):
+        self._fetch = fetch
+        self._depth = depth
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name) if depth > 0 else None
+        self._pending: Deque[Future] = deque()
+
+    def get(self) -> T:
+        if self._executor is None:
+            return self._fetch()
+        while self._pending:
+            result = self._pending.popleft().result()
+            if result:
+                break
+        else:
+            result = self._executor.submit(self._fetch).result()
+        if result:
+            while len(self._pending) < self._depth:
+                self._pending.append(self._executor.submit(self._fetch))
+        return result
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._pending.clear()
@@ -27,6 +27,7 @@ __all__ = [
     "is_stringify_value",
     "verify_collection_type",
     "is_collection",
+    "is_numeric_array",
     "base64_encode",
     "base64_decode",
     "get_absolute_paths",
@@ -39,6 +40,7 @@ __all__ = [
 import base64
 import logging
 import os
+import sys
 from glob import glob
 from io import IOBase
 from typing import (
@@ -137,6 +139,16 @@ def is_collection(var) -> bool:
     return isinstance(var, (list, set, tuple))
 
 
+def is_numeric_array(var) -> bool:
+    """Whether var is a 1-dimensional NumPy array or pandas Series of numbers"""
+    # a value cannot be an instance of a class from a module that has not been imported yet
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(var, pandas.Series):
+        var = var.values
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(var, numpy.ndarray) and var.ndim == 1 and var.dtype.kind in "biuf"
+
+
 def base64_encode(data: bytes) -> str:
     return base64.b64encode(data).decode("utf-8")
 
@@ -0,0 +1,75 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["BinaryFileSplitter", "BINARY_SEGMENT_MAGIC", "encode_binary_record", "is_binary_segment"]
+
+import struct
+from typing import (
+    Optional,
+    Tuple,
+)
+
+import msgpack
+
+# Every binary segment starts with this header, so it can be told apart from a JSON lines segment
+# (which always starts with "{").
+BINARY_SEGMENT_MAGIC = b"NPTQ\x01"
+
+# Each record is a little-endian uint32 payload length followed by a msgpack payload.
+_RECORD_HEADER = struct.Struct("<I")
+
+
+def encode_binary_record(data: dict) -> bytes:
+    payload = msgpack.packb(data, use_bin_type=True)
+    return _RECORD_HEADER.pack(len(payload)) + payload
+
+
+def is_binary_segment(file_path: str) -> Optional[bool]:
+    """
+    Returns None if there is not enough data in the file yet to tell its format.
+    """
+    with open(file_path, "rb") as file:
+        head = file.read(len(BINARY_SEGMENT_MAGIC))
+    if head == BINARY_SEGMENT_MAGIC:
+        return True
+    if BINARY_SEGMENT_MAGIC.startswith(head):
+        return None
+    return False
+
+
+class BinaryFileSplitter:
+    def __init__(self, file_path: str):
+        self._file = open(file_path, "rb")
+        self._file.seek(len(BINARY_SEGMENT_MAGIC))
+
+    def close(self) -> None:
+        self._file.close()
+
+    def get(self) -> Optional[dict]:
+        return self.get_with_size()[0]
+
+    def get_with_size(self) -> Tuple[Optional[dict], int]:
+        start = self._file.tell()
+        header = self._file.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            # Record is not fully written yet, retry from the same place next time
+            self._file.seek(start)
+            return None, 0
+        (length,) = _RECORD_HEADER.unpack(header)
+        payload = self._file.read(length)
+        if len(payload) < length:
+            self._file.seek(start)
+            return None, 0
+        return msgpack.unpackb(payload, raw=False), _RECORD_HEADER.size + length
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["DownloadManager"]
+
+import os
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Callable,
+    Optional,
+    Set,
+)
+
+from neptune.envs import NEPTUNE_DOWNLOAD_MAX_WORKERS
+from neptune.internal.utils.logger import logger
+
+
+class DownloadManager:
+    """
+    Runs downloads on a bounded pool of threads and logs their progress.
+
+    Downloads are submitted with `submit`, which blocks while `max_workers` downloads are pending, so that
+    a generator of thousands of downloads is never materialized at once. Leaving the `with` block waits for
+    all of them and raises the first error, if any; downloads not started yet are cancelled after an error.
+
+        with DownloadManager(total=len(indices)) as downloads:
+            for index in indices:
+                downloads.submit(backend.download_file_series_by_index, container_id, ..., index, destination)
+    """
+
+    MAX_WORKERS = int(os.getenv(NEPTUNE_DOWNLOAD_MAX_WORKERS, "8"))
+    # Seconds between progress messages; downloads finishing faster than that are not reported at all
+    PROGRESS_INTERVAL = 10
+
+    def __init__(self, total: Optional[int] = None, max_workers: Optional[int] = None):
+        self._total = total
+        self._max_workers = max_workers or self.MAX_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._done = 0
+        self._started_at = time.monotonic()
+        self._reported_at = self._started_at
+
+    def __enter__(self) -> "DownloadManager":
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="NeptuneDownload")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                self.wait()
+        finally:
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def submit(self, download: Callable, *args, **kwargs) -> None:
+        assert self._executor is not None, "DownloadManager should be used in a `with` block"
+        if len(self._pending) >= self._max_workers:
+            done, self._pending = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        future = self._executor.submit(download, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        self._pending.add(future)
+
+    def wait(self) -> None:
+        done, self._pending = wait(self._pending)
+        for future in done:
+            future.result()
+        if self._reported_at != self._started_at:
+            logger.info("Downloaded %d files in %.0f seconds", self._done, time.monotonic() - self._started_at)
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self._done += 1
+            now = time.monotonic()
+            if now - self._reported_at < self.PROGRESS_INTERVAL:
+                return
+            self._reported_at = now
+            done = self._done
+        if self._total:
+            logger.info("Downloaded %d of %d files (%d%%)", done, self._total, 100 * done // self._total)
+        else:
+            logger.info("Downloaded %d files", done)
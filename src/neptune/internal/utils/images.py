@@ -30,38 +30,26 @@ import base64
 import io
 import logging
 import pickle
+import sys
 import warnings
 from io import (
     BytesIO,
     StringIO,
 )
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
 
 from packaging import version
-from pandas import DataFrame
 
 from neptune.exceptions import PlotlyIncompatibilityException
 from neptune.internal.utils.logger import logger
 
-_logger = logging.getLogger(__name__)
-
-try:
-    from numpy import array as numpy_array
-    from numpy import ndarray as numpy_ndarray
-    from numpy import uint8 as numpy_uint8
-except ImportError:
-    numpy_ndarray = None
-    numpy_array = None
-    numpy_uint8 = None
-
-try:
-    from PIL.Image import Image as PILImage
-    from PIL.Image import fromarray as pilimage_fromarray
-except ImportError:
-    PILImage = None
+if TYPE_CHECKING:
+    import PIL.Image
 
-    def pilimage_fromarray():
-        pass
+_logger = logging.getLogger(__name__)
 
 
 def get_image_content(image) -> Optional[bytes]:
@@ -190,6 +178,9 @@ def _image_content_to_html(content: bytes) -> str:
 
 
 def _get_numpy_as_image(array):
+    import numpy
+    from PIL.Image import fromarray as pilimage_fromarray
+
     array = array.copy()  # prevent original array from modifying
 
     data_range_warnings = []
@@ -208,20 +199,20 @@ def _get_numpy_as_image(array):
     array *= 255
     shape = array.shape
     if len(shape) == 2:
-        return _get_pil_image_data(pilimage_fromarray(array.astype(numpy_uint8)))
+        return _get_pil_image_data(pilimage_fromarray(array.astype(numpy.uint8)))
     if len(shape) == 3:
         if shape[2] == 1:
-            array2d = numpy_array([[col[0] for col in row] for row in array])
-            return _get_pil_image_data(pilimage_fromarray(array2d.astype(numpy_uint8)))
+            array2d = numpy.array([[col[0] for col in row] for row in array])
+            return _get_pil_image_data(pilimage_fromarray(array2d.astype(numpy.uint8)))
         if shape[2] in (3, 4):
-            return _get_pil_image_data(pilimage_fromarray(array.astype(numpy_uint8)))
+            return _get_pil_image_data(pilimage_fromarray(array.astype(numpy.uint8)))
     raise ValueError(
         "Incorrect size of numpy.ndarray. Should be 2-dimensional or"
         "3-dimensional with 3rd dimension of size 1, 3 or 4."
     )
 
 
-def _get_pil_image_data(image: PILImage) -> bytes:
+def _get_pil_image_data(image: "PIL.Image.Image") -> bytes:
     with io.BytesIO() as image_buffer:
         image.save(image_buffer, format="PNG")
         return image_buffer.getvalue()
@@ -253,12 +244,15 @@ def _is_matplotlib_pyplot(chart):
     return chart.__class__.__module__.startswith("matplotlib.pyplot")
 
 
+# Objects of a library exist only once it is imported, so these checks do not import libraries themselves
 def is_numpy_array(image) -> bool:
-    return numpy_ndarray is not None and isinstance(image, numpy_ndarray)
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(image, numpy.ndarray)
 
 
 def is_pil_image(image) -> bool:
-    return PILImage is not None and isinstance(image, PILImage)
+    pil_image = sys.modules.get("PIL.Image")
+    return pil_image is not None and isinstance(image, pil_image.Image)
 
 
 def is_matplotlib_figure(image):
@@ -278,7 +272,8 @@ def is_bokeh_figure(chart):
 
 
 def is_pandas_dataframe(table):
-    return isinstance(table, DataFrame)
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(table, pandas.DataFrame)
 
 
 def _export_pandas_dataframe_to_html(table):
@@ -16,9 +16,8 @@
 __all__ = ["JsonFileSplitter"]
 
 import json
-from collections import deque
-from io import StringIO
-from json import JSONDecodeError
+import mmap
+import os
 from typing import (
     Optional,
     Tuple,
@@ -26,71 +25,86 @@ from typing import (
 
 
 class JsonFileSplitter:
-    BUFFER_SIZE = 64 * 1024
-    MAX_PART_READ = 8 * 1024
+    """
+    Reads consecutive JSON objects from a file that may still be appended to.
+
+    The file is accessed through a read-only memory map of at most `WINDOW_SIZE` bytes (more only when a single
+    object does not fit in it), which slides forward as objects are consumed, so memory usage does not depend on
+    the size of the file. Objects are delimited by newlines and decoded straight from the mapped window.
+    """
+
+    WINDOW_SIZE = 8 * 1024**2
 
     def __init__(self, file_path: str):
-        self._file = open(file_path, "r")
+        self._file = open(file_path, "rb")
         self._decoder = json.JSONDecoder(strict=False)
-        self._part_buffer = StringIO()
-        self._parsed_queue = deque()
-        self._start_pos = 0
+        self._map: Optional[mmap.mmap] = None
+        self._map_start = 0
+        self._map_end = 0
+        self._pos = 0
 
     def close(self) -> None:
+        self._unmap()
         self._file.close()
-        self._part_buffer.close()
 
     def get(self) -> Optional[dict]:
         return (self.get_with_size() or (None, None))[0]
 
     def get_with_size(self) -> Tuple[Optional[dict], int]:
-        if self._parsed_queue:
-            return self._parsed_queue.popleft()
-        self._read_data()
-        if self._parsed_queue:
-            return self._parsed_queue.popleft()
-        return None, 0
-
-    def _read_data(self):
-        if self._part_buffer.tell() < self.MAX_PART_READ:
-            data = self._file.read(self.BUFFER_SIZE)
-            if not data:
-                return
-            if self._part_buffer.tell() > 0:
-                data = self._reset_part_buffer() + data
-            self._decode(data)
-
-        if not self._parsed_queue:
-            data = self._file.read(self.BUFFER_SIZE)
-            while data:
-                self._part_buffer.write(data)
-                data = self._file.read(self.BUFFER_SIZE)
-            data = self._reset_part_buffer()
-            self._decode(data)
+        start = self._find(b"{", self._pos, self._pos)
+        if start is None:
+            return None, 0
+        self._pos = start
 
-    def _decode(self, data: str):
-        start = self._json_start(data)
-        while start is not None:
+        search_from = start
+        while True:
+            newline = self._find(b"\n", search_from, start)
+            stop = self._map_end if newline is None else newline
             try:
-                json_data, new_start = self._decoder.raw_decode(data, start)
-                size = new_start - start
-                start = new_start
-            except JSONDecodeError:
-                self._part_buffer.write(data[start:])
-                break
+                text = self._map[start - self._map_start : stop - self._map_start].decode("utf-8")
+                json_data, size = self._decoder.raw_decode(text)
+            except ValueError:
+                if newline is None:
+                    # Object is not fully written yet, retry from the same place next time
+                    return None, 0
+                # Object spans multiple lines
+                search_from = newline + 1
+                continue
+
+            if len(text) == stop - start:
+                self._pos = start + size
             else:
-                self._parsed_queue.append((json_data, size))
-                start = self._json_start(data, start)
+                self._pos = start + len(text[:size].encode("utf-8"))
+            return json_data, size
+
+    def _find(self, sub: bytes, offset: int, keep: int) -> Optional[int]:
+        """
+        Returns the file offset of the first occurrence of a single byte `sub` at or after `offset`.
+        Everything from `keep` onwards stays mapped.
+        """
+        while True:
+            if self._map is not None and offset < self._map_end:
+                index = self._map.find(sub, offset - self._map_start)
+                if index != -1:
+                    return self._map_start + index
+                offset = self._map_end
+            if not self._remap(keep, offset):
+                return None
+
+    def _remap(self, keep: int, offset: int) -> bool:
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size <= offset:
+            return False
 
-    @staticmethod
-    def _json_start(data: str, start: int = 0) -> Optional[int]:
-        try:
-            return data.index("{", start)
-        except ValueError:
-            return None
+        self._unmap()
+        map_start = keep - keep % mmap.ALLOCATIONGRANULARITY
+        map_end = min(file_size, offset + self.WINDOW_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), map_end - map_start, access=mmap.ACCESS_READ, offset=map_start)
+        self._map_start = map_start
+        self._map_end = map_end
+        return True
 
-    def _reset_part_buffer(self) -> str:
-        data = self._part_buffer.getvalue()
-        self._part_buffer.close()
-        self._part_buffer = StringIO()
-        return data
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
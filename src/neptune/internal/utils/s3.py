@@ -17,8 +17,6 @@ __all__ = ["get_boto_s3_client"]
 
 import os
 
-import boto3
-
 from neptune.envs import S3_ENDPOINT_URL
 
 
@@ -31,6 +29,9 @@ def get_boto_s3_client():
     boto3 `endpoint_url` support PR:
      * https://github.com/boto/boto3/pull/2746
     """
+    # boto3 takes longer to import than the rest of neptune, while only artifacts tracked in S3 need it
+    import boto3
+
     endpoint_url = os.getenv(S3_ENDPOINT_URL)
     return boto3.resource(
         service_name="s3",
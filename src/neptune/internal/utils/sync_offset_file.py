@@ -15,6 +15,8 @@
 #
 __all__ = ["SyncOffsetFile"]
 
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -24,13 +26,18 @@ class SyncOffsetFile:
         mode = "r+" if path.exists() else "w+"
         self._file = open(path, mode)
         self._default = default
+        self._lock = threading.Lock()
         self._last = self.read()
+        self._persisted = self._last
 
     def write(self, offset: int) -> None:
-        self._file.seek(0)
-        self._file.write(str(offset))
-        self._file.truncate()
-        self._file.flush()
+        self.write_local(offset)
+        self.flush()
+
+    def write_local(self, offset: int) -> None:
+        """
+        Updates the offset in memory only. It's persisted on next `flush`.
+        """
         self._last = offset
 
     def read(self) -> Optional[int]:
@@ -44,7 +51,19 @@ class SyncOffsetFile:
         return self._last
 
     def flush(self):
-        self._file.flush()
+        with self._lock:
+            offset = self._last
+            if offset != self._persisted:
+                self._file.seek(0)
+                self._file.write(str(offset))
+                self._file.truncate()
+                self._persisted = offset
+            self._file.flush()
+
+    def fsync(self):
+        self.flush()
+        os.fsync(self._file.fileno())
 
     def close(self):
+        self.flush()
         self._file.close()
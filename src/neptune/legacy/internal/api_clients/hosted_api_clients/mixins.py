@@ -23,6 +23,7 @@ from bravado_core.formatter import SwaggerFormat
 from packaging import version
 from six.moves import urllib
 
+from neptune.common.patches import apply_patches
 from neptune.legacy.exceptions import (
     CannotResolveHostname,
     DeprecatedApiToken,
@@ -50,6 +51,7 @@ class HostedNeptuneMixin:
 
     @legacy_with_api_exceptions_handler
     def _get_swagger_client(self, url, http_client):
+        apply_patches()
         return SwaggerClient.from_url(
             url,
             config=dict(
@@ -19,11 +19,14 @@ __all__ = [
     "Logger",
 ]
 
-from neptune.metadata_containers import MetadataContainer
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from neptune.metadata_containers import MetadataContainer
 
 
 class Logger(object):
-    def __init__(self, container: MetadataContainer, attribute_name: str):
+    def __init__(self, container: "MetadataContainer", attribute_name: str):
         self._container = container
         self._attribute_name = attribute_name
 
@@ -25,15 +25,21 @@ import traceback
 from contextlib import AbstractContextManager
 from functools import wraps
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
+    Set,
     Union,
 )
 
-from neptune.attributes import create_attribute_from_type
+from neptune.attributes import (
+    create_attribute_from_type,
+    get_attribute_class,
+)
 from neptune.attributes.attribute import Attribute
 from neptune.attributes.namespace import Namespace as NamespaceAttr
 from neptune.attributes.namespace import NamespaceBuilder
@@ -44,9 +50,11 @@ from neptune.exceptions import (
     MetadataInconsistency,
     NeptunePossibleLegacyUsageException,
 )
-from neptune.handler import Handler
 from neptune.internal.backends.api_model import (
     ApiExperiment,
+)
+from neptune.internal.backends.api_model import Attribute as ApiAttribute
+from neptune.internal.backends.api_model import (
     AttributeType,
     Project,
 )
@@ -64,20 +72,33 @@ from neptune.internal.id_formats import (
     conform_optional,
 )
 from neptune.internal.init.parameters import DEFAULT_FLUSH_PERIOD
-from neptune.internal.operation import DeleteAttribute
+from neptune.internal.operation import (
+    DeleteAttribute,
+    Operation,
+)
 from neptune.internal.operation_processors.factory import get_operation_processor
 from neptune.internal.operation_processors.operation_processor import OperationProcessor
 from neptune.internal.state import ContainerState
 from neptune.internal.utils import verify_type
 from neptune.internal.utils.logger import logger
-from neptune.internal.utils.paths import parse_path
+from neptune.internal.utils.paths import (
+    parse_path,
+    path_to_str,
+)
 from neptune.internal.utils.uncaught_exception_handler import instance as uncaught_exception_handler
 from neptune.internal.value_to_attribute_visitor import ValueToAttributeVisitor
 from neptune.metadata_containers.abstract import SupportsNamespaces
-from neptune.metadata_containers.metadata_containers_table import Table
+from neptune.metadata_containers.metadata_containers_table import (
+    Table,
+    TableEntry,
+)
 from neptune.types.mode import Mode
 from neptune.types.type_casting import cast_value
 
+if TYPE_CHECKING:
+    from neptune.attributes.series.float_series import FloatSeries
+    from neptune.handler import Handler
+
 
 def ensure_not_stopped(fun):
     @wraps(fun)
@@ -111,6 +132,11 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
         self._mode: Mode = mode
         self._flush_period = flush_period
         self._lock: threading.RLock = threading.RLock()
+        self._sync_lock: threading.Lock = threading.Lock()
+        # Paths of attributes set or removed locally while `sync` fetches the structure, which it must not revert
+        self._paths_changed_during_sync: Optional[Set[str]] = None
+        # Series logging aggregated points, whose last windows are flushed on `wait` and `stop`
+        self._aggregated_series: List["FloatSeries"] = []
         self._state: ContainerState = ContainerState.CREATED
 
         self._backend: NeptuneBackend = get_backend(mode=mode, api_token=api_token, proxies=proxies)
@@ -229,6 +255,9 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
 
     @ensure_not_stopped
     def __getitem__(self, path: str) -> "Handler":
+        # neptune.handler imports this module, so that it can be imported on its own
+        from neptune.handler import Handler
+
         return Handler(self, path)
 
     @ensure_not_stopped
@@ -349,6 +378,8 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
         self._bg_job.join(seconds)
         logger.info("Done!")
 
+        with self._lock:
+            self._flush_aggregated_series()
         sec_left = None if seconds is None else seconds - (time.time() - ts)
         self._op_processor.stop(sec_left)
 
@@ -424,7 +455,10 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
 
     def set_attribute(self, path: str, attribute: Attribute) -> Optional[Attribute]:
         with self._lock:
-            return self._structure.set(parse_path(path), attribute)
+            parsed_path = parse_path(path)
+            if self._paths_changed_during_sync is not None:
+                self._paths_changed_during_sync.add(path_to_str(parsed_path))
+            return self._structure.set(parsed_path, attribute)
 
     def exists(self, path: str) -> bool:
         """Checks if there is a field or namespace under the specified path."""
@@ -458,12 +492,18 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
         self._get_root_handler().pop(path, wait=wait)
 
     def _pop_impl(self, parsed_path: List[str], *, wait: bool):
+        if self._paths_changed_during_sync is not None:
+            self._paths_changed_during_sync.add(path_to_str(parsed_path))
         self._structure.pop(parsed_path)
         self._op_processor.enqueue_operation(DeleteAttribute(parsed_path), wait=wait)
 
     def lock(self) -> threading.RLock:
         return self._lock
 
+    def _enqueue_operations(self, operations: List[Operation], *, wait: bool) -> None:
+        """Enqueues operations of many attributes at once, the caller is responsible for taking the lock."""
+        self._op_processor.enqueue_operations(operations, wait=wait)
+
     def wait(self, *, disk_only=False) -> None:
         """Wait for all the queued metadata tracking calls to reach the Neptune servers.
 
@@ -475,11 +515,18 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
             https://docs.neptune.ai/api/universal/#wait
         """
         with self._lock:
+            self._flush_aggregated_series()
             if disk_only:
                 self._op_processor.flush()
             else:
                 self._op_processor.wait()
 
+    def _flush_aggregated_series(self) -> None:
+        for attribute in self._aggregated_series:
+            # a series removed from the structure is not flushed, as its path may be reused by another attribute
+            if self._structure.get(attribute._path) is attribute:
+                attribute._flush_aggregation()
+
     def sync(self, *, wait: bool = True) -> None:
         """Synchronizes the local representation of the object with the representation on the Neptune servers.
 
@@ -502,19 +549,50 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
         See also the API reference:
             https://docs.neptune.ai/api/universal/#sync
         """
-        with self._lock:
-            if wait:
-                self._op_processor.wait()
-            attributes = self._backend.get_attributes(self._id, self.container_type)
-            self._structure.clear()
-            for attribute in attributes:
-                self._define_attribute(parse_path(attribute.path), attribute.type)
+        with self._sync_lock:
+            with self._lock:
+                if wait:
+                    self._flush_aggregated_series()
+                    self._op_processor.wait()
+                self._paths_changed_during_sync = set()
+            try:
+                # Fetching may take long for big containers, so the lock is not held meanwhile,
+                # and logging from other threads is not blocked
+                attributes = self._backend.get_attributes(self._id, self.container_type)
+                with self._lock:
+                    self._update_structure(attributes, skipped_paths=self._paths_changed_during_sync)
+            finally:
+                with self._lock:
+                    self._paths_changed_during_sync = None
+
+    def _update_structure(self, attributes: List[ApiAttribute], skipped_paths: Set[str]) -> None:
+        """Makes the structure match `attributes`, keeping the attributes whose types did not change"""
+        remote_types = {
+            attribute.path: attribute.type for attribute in attributes if attribute.path not in skipped_paths
+        }
+        local_attributes = list(self._structure.iterate_attributes())
+
+        # Removal goes first, as an attribute may have been replaced with a namespace or the other way round
+        for parsed_path, attr in local_attributes:
+            path = path_to_str(parsed_path)
+            if path in skipped_paths:
+                continue
+            remote_type = remote_types.pop(path, None)
+            if remote_type is None or type(attr) is not get_attribute_class(remote_type):
+                self._structure.pop(parsed_path)
+                if remote_type is not None:
+                    remote_types[path] = remote_type
+
+        for path, attribute_type in remote_types.items():
+            self._define_attribute(parse_path(path), attribute_type)
 
     def _define_attribute(self, _path: List[str], _type: AttributeType):
         attr = create_attribute_from_type(_type, self, _path)
         self._structure.set(_path, attr)
 
     def _get_root_handler(self):
+        from neptune.handler import Handler
+
         return Handler(self, "")
 
     @abc.abstractmethod
@@ -538,17 +616,20 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
     def _shutdown_hook(self):
         self.stop()
 
-    def _fetch_entries(self, child_type: ContainerType, query: NQLQuery, columns: Optional[Iterable[str]]) -> Table:
+    @staticmethod
+    def _entries_columns(columns: Optional[Iterable[str]]) -> Optional[Iterable[str]]:
         if columns is not None:
             # always return entries with `sys/id` column when filter applied
             columns = set(columns)
             columns.add("sys/id")
+        return columns
 
+    def _fetch_entries(self, child_type: ContainerType, query: NQLQuery, columns: Optional[Iterable[str]]) -> Table:
         leaderboard_entries = self._backend.search_leaderboard_entries(
             project_id=self._project_id,
             types=[child_type],
             query=query,
-            columns=columns,
+            columns=self._entries_columns(columns),
         )
 
         return Table(
@@ -557,6 +638,24 @@ class MetadataContainer(AbstractContextManager, SupportsNamespaces):
             entries=leaderboard_entries,
         )
 
+    def _iter_entries(
+        self, child_type: ContainerType, query: NQLQuery, columns: Optional[Iterable[str]]
+    ) -> Iterator[TableEntry]:
+        attribute_positions: Dict[str, int] = dict()
+        for entry in self._backend.iter_leaderboard_entries(
+            project_id=self._project_id,
+            types=[child_type],
+            query=query,
+            columns=self._entries_columns(columns),
+        ):
+            yield TableEntry(
+                backend=self._backend,
+                container_type=child_type,
+                _id=entry.id,
+                attributes=entry.attributes,
+                attribute_positions=attribute_positions,
+            )
+
     def get_root_object(self) -> "MetadataContainer":
         """Returns the same Neptune object."""
         return self
@@ -19,6 +19,7 @@ import logging
 from datetime import datetime
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -43,96 +44,109 @@ logger = logging.getLogger(__name__)
 
 
 class TableEntry:
+    __slots__ = ("_backend", "_container_type", "_id", "_attributes", "_attribute_positions", "_attribute_index")
+
     def __init__(
         self,
         backend: NeptuneBackend,
         container_type: ContainerType,
         _id: str,
         attributes: List[AttributeWithProperties],
+        attribute_positions: Optional[Dict[str, int]] = None,
     ):
         self._backend = backend
         self._container_type = container_type
         self._id = _id
         self._attributes = attributes
+        # Path -> position hints shared by the entries of a table, which usually list attributes in the same order
+        self._attribute_positions: Dict[str, int] = attribute_positions if attribute_positions is not None else {}
+        # Built only if the shared hint misses
+        self._attribute_index: Optional[Dict[str, int]] = None
 
     def __getitem__(self, path: str) -> "LeaderboardHandler":
         return LeaderboardHandler(table_entry=self, path=path)
 
+    def _get_attribute(self, path: str) -> AttributeWithProperties:
+        position = self._attribute_positions.get(path)
+        if position is not None and position < len(self._attributes) and self._attributes[position].path == path:
+            return self._attributes[position]
+
+        if self._attribute_index is None:
+            self._attribute_index = dict()
+            for idx, attr in enumerate(self._attributes):
+                self._attribute_index.setdefault(attr.path, idx)
+        position = self._attribute_index.get(path)
+        if position is None:
+            raise ValueError("Could not find {} attribute".format(path))
+        self._attribute_positions[path] = position
+        return self._attributes[position]
+
     def get_attribute_type(self, path: str) -> AttributeType:
-        for attr in self._attributes:
-            if attr.path == path:
-                return attr.type
-        raise ValueError("Could not find {} attribute".format(path))
+        return self._get_attribute(path).type
 
     def get_attribute_value(self, path: str) -> Any:
-        for attr in self._attributes:
-            if attr.path == path:
-                _type = attr.type
-                if _type == AttributeType.RUN_STATE:
-                    return RunState.from_api(attr.properties.value).value
-                if _type in (
-                    AttributeType.FLOAT,
-                    AttributeType.INT,
-                    AttributeType.BOOL,
-                    AttributeType.STRING,
-                    AttributeType.DATETIME,
-                ):
-                    return attr.properties.value
-                if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
-                    return attr.properties.last
-                if _type == AttributeType.IMAGE_SERIES:
-                    raise MetadataInconsistency("Cannot get value for image series.")
-                if _type == AttributeType.FILE:
-                    raise MetadataInconsistency("Cannot get value for file attribute. Use download() instead.")
-                if _type == AttributeType.FILE_SET:
-                    raise MetadataInconsistency("Cannot get value for file set attribute. Use download() instead.")
-                if _type == AttributeType.STRING_SET:
-                    return set(attr.properties.values)
-                if _type == AttributeType.GIT_REF:
-                    return attr.properties.commit.commitId
-                if _type == AttributeType.NOTEBOOK_REF:
-                    return attr.properties.notebookName
-                if _type == AttributeType.ARTIFACT:
-                    return attr.properties.hash
-                logger.error(
-                    "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
-                    _type,
-                )
-                return None
-        raise ValueError("Could not find {} attribute".format(path))
+        attr = self._get_attribute(path)
+        _type = attr.type
+        if _type == AttributeType.RUN_STATE:
+            return RunState.from_api(attr.properties.value).value
+        if _type in (
+            AttributeType.FLOAT,
+            AttributeType.INT,
+            AttributeType.BOOL,
+            AttributeType.STRING,
+            AttributeType.DATETIME,
+        ):
+            return attr.properties.value
+        if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
+            return attr.properties.last
+        if _type == AttributeType.IMAGE_SERIES:
+            raise MetadataInconsistency("Cannot get value for image series.")
+        if _type == AttributeType.FILE:
+            raise MetadataInconsistency("Cannot get value for file attribute. Use download() instead.")
+        if _type == AttributeType.FILE_SET:
+            raise MetadataInconsistency("Cannot get value for file set attribute. Use download() instead.")
+        if _type == AttributeType.STRING_SET:
+            return set(attr.properties.values)
+        if _type == AttributeType.GIT_REF:
+            return attr.properties.commit.commitId
+        if _type == AttributeType.NOTEBOOK_REF:
+            return attr.properties.notebookName
+        if _type == AttributeType.ARTIFACT:
+            return attr.properties.hash
+        logger.error(
+            "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
+            _type,
+        )
+        return None
 
     def download_file_attribute(self, path: str, destination: Optional[str]):
-        for attr in self._attributes:
-            if attr.path == path:
-                _type = attr.type
-                if _type == AttributeType.FILE:
-                    self._backend.download_file(
-                        container_id=self._id,
-                        container_type=self._container_type,
-                        path=parse_path(path),
-                        destination=destination,
-                    )
-                    return
-                raise MetadataInconsistency("Cannot download file from attribute of type {}".format(_type))
-        raise ValueError("Could not find {} attribute".format(path))
+        _type = self._get_attribute(path).type
+        if _type == AttributeType.FILE:
+            self._backend.download_file(
+                container_id=self._id,
+                container_type=self._container_type,
+                path=parse_path(path),
+                destination=destination,
+            )
+            return
+        raise MetadataInconsistency("Cannot download file from attribute of type {}".format(_type))
 
     def download_file_set_attribute(self, path: str, destination: Optional[str]):
-        for attr in self._attributes:
-            if attr.path == path:
-                _type = attr.type
-                if _type == AttributeType.FILE_SET:
-                    self._backend.download_file_set(
-                        container_id=self._id,
-                        container_type=self._container_type,
-                        path=parse_path(path),
-                        destination=destination,
-                    )
-                    return
-                raise MetadataInconsistency("Cannot download ZIP archive from attribute of type {}".format(_type))
-        raise ValueError("Could not find {} attribute".format(path))
+        _type = self._get_attribute(path).type
+        if _type == AttributeType.FILE_SET:
+            self._backend.download_file_set(
+                container_id=self._id,
+                container_type=self._container_type,
+                path=parse_path(path),
+                destination=destination,
+            )
+            return
+        raise MetadataInconsistency("Cannot download ZIP archive from attribute of type {}".format(_type))
 
 
 class LeaderboardHandler:
+    __slots__ = ("_table_entry", "_path")
+
     def __init__(self, table_entry: TableEntry, path: str):
         self._table_entry = table_entry
         self._path = path
@@ -164,64 +178,22 @@ class Table:
         self._container_type = container_type
 
     def to_rows(self) -> List[TableEntry]:
+        attribute_positions: Dict[str, int] = dict()
         return [
             TableEntry(
                 backend=self._backend,
                 container_type=self._container_type,
                 _id=e.id,
                 attributes=e.attributes,
+                attribute_positions=attribute_positions,
             )
             for e in self._entries
         ]
 
     def to_pandas(self):
+        import numpy as np
         import pandas as pd
 
-        def make_attribute_value(
-            attribute: AttributeWithProperties,
-        ) -> Optional[Union[str, float, datetime]]:
-            _type = attribute.type
-            _properties = attribute.properties
-            if _type == AttributeType.RUN_STATE:
-                return RunState.from_api(_properties.value).value
-            if _type in (
-                AttributeType.FLOAT,
-                AttributeType.INT,
-                AttributeType.BOOL,
-                AttributeType.STRING,
-                AttributeType.DATETIME,
-            ):
-                return _properties.value
-            if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
-                return _properties.last
-            if _type == AttributeType.IMAGE_SERIES:
-                return None
-            if _type == AttributeType.FILE or _type == AttributeType.FILE_SET:
-                return None
-            if _type == AttributeType.STRING_SET:
-                return ",".join(_properties.values)
-            if _type == AttributeType.GIT_REF:
-                return _properties.commit.commitId
-            if _type == AttributeType.NOTEBOOK_REF:
-                return _properties.notebookName
-            if _type == AttributeType.ARTIFACT:
-                return _properties.hash
-            logger.error(
-                "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
-                _type,
-            )
-            return None
-
-        def make_row(
-            entry: LeaderboardEntry,
-        ) -> Dict[str, Optional[Union[str, float, datetime]]]:
-            row: Dict[str, Union[str, float, datetime]] = dict()
-            for attr in entry.attributes:
-                value = make_attribute_value(attr)
-                if value is not None:
-                    row[attr.path] = value
-            return row
-
         def sort_key(attr):
             domain = attr.split("/")[0]
             if domain == "sys":
@@ -230,8 +202,61 @@ class Table:
                 return 2, attr
             return 1, attr
 
-        rows = dict((n, make_row(entry)) for (n, entry) in enumerate(self._entries))
+        # values are collected column by column; a missing value is NaN, as it would be in a frame built from rows
+        columns: Dict[str, List[Any]] = dict()
+        unsupported_types = set()
+        for idx, entry in enumerate(self._entries):
+            for attr in entry.attributes:
+                make_value = _TABLE_VALUE_MAKERS.get(attr.type)
+                if make_value is None:
+                    unsupported_types.add(attr.type)
+                    continue
+                value = make_value(attr.properties)
+                if value is None:
+                    continue
+                column = columns.get(attr.path)
+                if column is None:
+                    column = columns[attr.path] = [np.nan] * len(self._entries)
+                column[idx] = value
+
+        for _type in unsupported_types:
+            logger.error(
+                "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
+                _type,
+            )
+
+        return pd.DataFrame(
+            {path: columns[path] for path in sorted(columns, key=sort_key)},
+            index=pd.RangeIndex(len(self._entries)),
+        )
+
+
+def _none(_properties) -> None:
+    return None
+
+
+def _simple_value(properties) -> Optional[Union[str, float, datetime]]:
+    return properties.value
+
+
+def _series_last_value(properties) -> Optional[Union[str, float]]:
+    return properties.last
+
 
-        df = pd.DataFrame.from_dict(data=rows, orient="index")
-        df = df.reindex(sorted(df.columns, key=sort_key), axis="columns")
-        return df
+_TABLE_VALUE_MAKERS: Dict[AttributeType, Callable[[Any], Optional[Union[str, float, datetime]]]] = {
+    AttributeType.RUN_STATE: lambda properties: RunState.from_api(properties.value).value,
+    AttributeType.FLOAT: _simple_value,
+    AttributeType.INT: _simple_value,
+    AttributeType.BOOL: _simple_value,
+    AttributeType.STRING: _simple_value,
+    AttributeType.DATETIME: _simple_value,
+    AttributeType.FLOAT_SERIES: _series_last_value,
+    AttributeType.STRING_SERIES: _series_last_value,
+    AttributeType.IMAGE_SERIES: _none,
+    AttributeType.FILE: _none,
+    AttributeType.FILE_SET: _none,
+    AttributeType.STRING_SET: lambda properties: ",".join(properties.values),
+    AttributeType.GIT_REF: lambda properties: properties.commit.commitId,
+    AttributeType.NOTEBOOK_REF: lambda properties: properties.notebookName,
+    AttributeType.ARTIFACT: lambda properties: properties.hash,
+}
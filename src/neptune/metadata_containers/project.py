@@ -16,16 +16,27 @@
 __all__ = ["Project"]
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Iterable,
+    Iterator,
     Optional,
     Union,
 )
 
+from neptune.attributes.series.fetchable_series import fetch_series_values
 from neptune.common.exceptions import NeptuneException
 from neptune.envs import CONNECTION_MODE
-from neptune.exceptions import InactiveProjectException
-from neptune.internal.backends.api_model import ApiExperiment
+from neptune.exceptions import (
+    InactiveProjectException,
+    MetadataInconsistency,
+)
+from neptune.internal.backends.api_model import (
+    ApiExperiment,
+    AttributeType,
+)
 from neptune.internal.backends.nql import (
     NQLAggregator,
     NQLAttributeOperator,
@@ -40,17 +51,27 @@ from neptune.internal.utils import (
     as_list,
     verify_type,
 )
+from neptune.internal.utils.paths import parse_path
 from neptune.internal.utils.run_state import RunState
 from neptune.metadata_containers import MetadataContainer
-from neptune.metadata_containers.metadata_containers_table import Table
+from neptune.metadata_containers.metadata_containers_table import (
+    Table,
+    TableEntry,
+)
 from neptune.types.mode import Mode
 
+if TYPE_CHECKING:
+    import pandas
+
 
 class Project(MetadataContainer):
     """Class for tracking and retrieving project-level metadata of a neptune.ai project."""
 
     container_type = ContainerType.PROJECT
 
+    # Number of series fetched at once by `fetch_runs_values()`
+    _FETCH_MAX_WORKERS = 8
+
     def __init__(
         self,
         project: Optional[str] = None,
@@ -320,6 +341,145 @@ class Project(MetadataContainer):
             columns=columns,
         )
 
+    def iter_runs_table(
+        self,
+        *,
+        id: Optional[Union[str, Iterable[str]]] = None,
+        state: Optional[Union[str, Iterable[str]]] = None,
+        owner: Optional[Union[str, Iterable[str]]] = None,
+        tag: Optional[Union[str, Iterable[str]]] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> Iterator[TableEntry]:
+        """Iterate over runs matching the specified criteria, without fetching all of them at once.
+
+        Takes the same arguments as `fetch_runs_table()`. Runs are fetched in pages while the iterator is consumed,
+        ordered by creation time, so only a few pages are held in memory regardless of the number of runs.
+
+        Returns:
+            Iterator of table entries. Use `entry["sys/id"].get()` to read the value of a field.
+
+        Examples:
+            >>> import neptune
+
+            >>> # Fetch project "jackie/sandbox"
+            ... project = neptune.init_project(mode="read-only", project="jackie/sandbox")
+
+            >>> # Go through the losses of all inactive runs
+            ... for run in project.iter_runs_table(state="inactive", columns=["train/loss"]):
+            ...     print(run["sys/id"].get(), run["train/loss"].get())
+        """
+        ids = as_list("id", id)
+        states = as_list("state", state)
+        owners = as_list("owner", owner)
+        tags = as_list("tag", tag)
+
+        nql_query = self._prepare_nql_query(ids, states, owners, tags)
+
+        return MetadataContainer._iter_entries(
+            self,
+            child_type=ContainerType.RUN,
+            query=nql_query,
+            columns=columns,
+        )
+
+    def fetch_runs_values(
+        self,
+        id: Union[str, Iterable[str]],
+        attributes: Union[str, Iterable[str]],
+        *,
+        include_timestamp: bool = True,
+    ) -> "pandas.DataFrame":
+        """Retrieve values of the given fields of several runs at once.
+
+        Unlike connecting to each run with `init_run()` and calling `fetch()` or `fetch_values()` field by field,
+        it fetches the atoms of all the runs with a single query and the series concurrently.
+
+        Args:
+            id: Neptune ID of a run, or list of several IDs.
+                Example: `"SAN-1"` or `["SAN-1", "SAN-2"]`.
+            attributes: Path of a field, or list of paths of fields.
+                Example: `["params/lr", "train/loss"]`.
+                Fields missing in a run are skipped, and so are fields with no value to fetch,
+                such as files, file sets and image series.
+            include_timestamp: Whether to include the timestamps of series values.
+
+        Returns:
+            pandas DataFrame in the long format, with "sys/id", "attribute", "step" and "value" columns,
+            and "timestamp" if `include_timestamp` is `True`. Series have a row per value and atoms a single row,
+            with no step nor timestamp.
+
+        Examples:
+            >>> import neptune
+
+            >>> project = neptune.init_project(mode="read-only", project="jackie/sandbox")
+
+            >>> # Compare the losses of two runs
+            ... df = project.fetch_runs_values(["SAN-1", "SAN-2"], ["train/loss"])
+            >>> losses = df.pivot(index="step", columns="sys/id", values="value")
+        """
+        import pandas as pd
+
+        ids = as_list("id", id)
+        paths = as_list("attributes", attributes)
+        verify_type("include_timestamp", include_timestamp, bool)
+
+        columns = ["sys/id", "attribute", "step", "value"] + (["timestamp"] if include_timestamp else [])
+        if not ids or not paths:
+            return pd.DataFrame(columns=columns)
+
+        entries = {}
+        for entry in self._iter_entries(
+            child_type=ContainerType.RUN,
+            query=self._prepare_nql_query(ids, states=None, owners=None, tags=None),
+            columns=paths,
+        ):
+            entries[entry.get_attribute_value("sys/id")] = entry
+
+        atoms, series = [], []
+        for sys_id in dict.fromkeys(ids):
+            entry = entries.get(sys_id)
+            if entry is None:
+                continue
+            for path in dict.fromkeys(paths):
+                try:
+                    attribute_type = entry.get_attribute_type(path)
+                except ValueError:
+                    continue
+                if attribute_type == AttributeType.FLOAT_SERIES:
+                    fetch_page = partial(self._backend.get_float_series_values, entry._id, ContainerType.RUN)
+                    series.append((sys_id, path, fetch_page, "float64"))
+                elif attribute_type == AttributeType.STRING_SERIES:
+                    fetch_page = partial(self._backend.get_string_series_values, entry._id, ContainerType.RUN)
+                    series.append((sys_id, path, fetch_page, object))
+                else:
+                    try:
+                        atoms.append((sys_id, path, entry.get_attribute_value(path)))
+                    except MetadataInconsistency:
+                        continue
+
+        def fetch(sys_id, path, fetch_page, value_dtype) -> pd.DataFrame:
+            values = fetch_series_values(
+                partial(fetch_page, parse_path(path)),
+                value_dtype=value_dtype,
+                include_timestamp=include_timestamp,
+                # the series are fetched concurrently already
+                max_workers=1,
+            )
+            values.insert(0, "sys/id", sys_id)
+            values.insert(1, "attribute", path)
+            return values
+
+        frames = [pd.DataFrame(atoms, columns=["sys/id", "attribute", "value"])] if atoms else []
+        if series:
+            with ThreadPoolExecutor(
+                max_workers=min(self._FETCH_MAX_WORKERS, len(series)), thread_name_prefix="NeptuneFetchRunsValues"
+            ) as executor:
+                frames.extend(executor.map(lambda args: fetch(*args), series))
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True).reindex(columns=columns)
+
     def fetch_models_table(self, *, columns: Optional[Iterable[str]] = None) -> Table:
         """Retrieve models stored in the project.
 
@@ -372,3 +532,24 @@ class Project(MetadataContainer):
             ),
             columns=columns,
         )
+
+    def iter_models_table(self, *, columns: Optional[Iterable[str]] = None) -> Iterator[TableEntry]:
+        """Iterate over models stored in the project, without fetching all of them at once.
+
+        Takes the same arguments as `fetch_models_table()`. Models are fetched in pages while the iterator is
+        consumed, ordered by creation time, so only a few pages are held in memory regardless of the number of models.
+
+        Returns:
+            Iterator of table entries. Use `entry["sys/id"].get()` to read the value of a field.
+        """
+        return MetadataContainer._iter_entries(
+            self,
+            child_type=ContainerType.MODEL,
+            query=NQLQueryAttribute(
+                name="sys/trashed",
+                type=NQLAttributeType.BOOLEAN,
+                operator=NQLAttributeOperator.EQUALS,
+                value=False,
+            ),
+            columns=columns,
+        )
@@ -26,7 +26,10 @@ from typing import (
 )
 
 from neptune.internal.types.stringify_value import extract_if_stringify_value
-from neptune.internal.utils import is_collection
+from neptune.internal.utils import (
+    is_collection,
+    is_numeric_array,
+)
 from neptune.types.series.series import Series
 
 if TYPE_CHECKING:
@@ -46,14 +49,18 @@ class FloatSeries(Series):
         steps: Optional[Sequence[float]] = None,
     ):
         values = extract_if_stringify_value(values)
+        self._min = min
+        self._max = max
+        self._unit = unit
+
+        if is_numeric_array(values):
+            self._init_columns(values, timestamps, steps)
+            return
 
         if not is_collection(values):
             raise TypeError("`values` is not a collection")
 
         self._values = [float(value) for value in values]
-        self._min = min
-        self._max = max
-        self._unit = unit
 
         if steps is None:
             self._steps = cycle([None])
@@ -67,6 +74,29 @@ class FloatSeries(Series):
             assert len(values) == len(timestamps)
             self._timestamps = timestamps
 
+    def _init_columns(self, values, timestamps: Optional[Sequence[float]], steps: Optional[Sequence[float]]) -> None:
+        # NumPy arrays and pandas Series are copied to float64 arrays, never converted value by value. The copy keeps
+        # queued operations intact when the caller reuses its buffer before they are written to disk
+        import numpy as np
+
+        self._values = np.array(values, dtype=np.float64)
+        if steps is None:
+            self._steps = None
+        else:
+            assert len(values) == len(steps)
+            self._steps = np.array(steps, dtype=np.float64)
+
+        if timestamps is None:
+            self._timestamps = np.full(len(self._values), time.time())
+        else:
+            assert len(values) == len(timestamps)
+            self._timestamps = np.array(timestamps, dtype=np.float64)
+
+    @property
+    def is_columnar(self) -> bool:
+        """Whether values, steps and timestamps are NumPy arrays, with steps being None if not given"""
+        return not isinstance(self._values, list)
+
     @property
     def steps(self):
         return self._steps
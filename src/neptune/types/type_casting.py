@@ -31,6 +31,7 @@ from neptune.internal.utils import (
     is_float,
     is_float_like,
     is_int,
+    is_numeric_array,
     is_string,
     is_stringify_value,
 )
@@ -89,7 +90,7 @@ def cast_value(value: Any) -> Optional[Value]:
 
 
 def cast_value_for_extend(
-    values: Union[StringifyValue, Namespace, Series, Collection[Any]]
+    values: Union[StringifyValue, Namespace, Series, Collection[Any]],
 ) -> Optional[Union[Series, Namespace]]:
     from_stringify_value, original_values = False, None
     if is_stringify_value(values):
@@ -101,6 +102,8 @@ def cast_value_for_extend(
         return Namespace(values)
     elif isinstance(values, Series):
         return values
+    elif is_numeric_array(values):
+        return FloatSeries(values=values)
 
     sample_val = next(iter(values))
 
@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import uuid
+
+import pytest
+from mock import MagicMock
+
+from neptune.envs import NEPTUNE_DISK_QUEUE_DURABILITY
+from neptune.internal.container_type import ContainerType
+from neptune.internal.disk_queue import Durability
+from neptune.internal.operation import LogFloats
+from neptune.internal.operation_processors.async_operation_processor import AsyncOperationProcessor
+from tests.benchmarks.utils import report
+
+OPERATIONS_COUNT = 5_000
+
+
+def _processor() -> AsyncOperationProcessor:
+    backend = MagicMock()
+    backend.execute_operations.side_effect = lambda operations, **kwargs: (len(operations), [])
+    return AsyncOperationProcessor(
+        container_id=str(uuid.uuid4()),
+        container_type=ContainerType.RUN,
+        backend=backend,
+        lock=threading.RLock(),
+    )
+
+
+def _operations():
+    return [
+        LogFloats(["train", "loss"], [LogFloats.ValueType(i * 0.01, step=i, ts=1680000000.0 + i)])
+        for i in range(OPERATIONS_COUNT)
+    ]
+
+
+@pytest.mark.parametrize("durability", list(Durability))
+def test_enqueue_operation(durability, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv(NEPTUNE_DISK_QUEUE_DURABILITY, durability.value)
+    operations = _operations()
+
+    processor = _processor()
+    processor.start()
+
+    start = time.perf_counter()
+    for op in operations:
+        processor.enqueue_operation(op, wait=False)
+    enqueued = time.perf_counter()
+    processor.flush()
+    flushed = time.perf_counter()
+
+    processor.stop()
+
+    report(f"enqueue_operation, caller thread [{durability.value}]", OPERATIONS_COUNT, enqueued - start)
+    report(f"enqueue_operation + flush [{durability.value}]", OPERATIONS_COUNT, flushed - start)
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from neptune.common.hardware.cgroup.cgroup_filesystem_reader import CGroupFilesystemReader
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+READS = 10_000
+
+
+def _read_memory_usage(reader: CGroupFilesystemReader) -> None:
+    for _ in range(READS):
+        reader.get_memory_usage_in_bytes()
+
+
+def test_read_fake_cgroupfs(tmp_path):
+    cgroup_dir = tmp_path / "cgroup"
+    cgroup_dir.mkdir()
+    usage_file = cgroup_dir / "memory.current"
+    usage_file.write_text("2097152\n")
+    mounts = tmp_path / "mounts"
+    mounts.write_text(f"cgroup2 {cgroup_dir} cgroup2 rw 0 0\n")
+    reader = CGroupFilesystemReader(str(mounts))
+
+    def read_opening_file():
+        for _ in range(READS):
+            with open(usage_file) as f:
+                int(f.read())
+
+    report("cgroup read: open [fake]", READS, measure(read_opening_file))
+    report("cgroup read: pread [fake]", READS, measure(lambda: _read_memory_usage(reader)))
+    reader.close()
+
+
+def test_read_host_cgroupfs():
+    try:
+        reader = CGroupFilesystemReader()
+    except OSError:
+        pytest.skip("No cgroup filesystem mounted")
+
+    report(f"cgroup v{reader.version} read: pread [host]", READS, measure(lambda: _read_memory_usage(reader)))
+    reader.close()
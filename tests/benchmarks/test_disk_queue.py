@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from neptune.internal.disk_queue import (
+    DiskQueue,
+    SegmentFormat,
+)
+from neptune.internal.operation import (
+    LogFloats,
+    Operation,
+)
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+OPERATIONS_COUNT = 20_000
+
+
+def _operations():
+    return [
+        LogFloats(["train", "loss"], [LogFloats.ValueType(i * 0.01, step=i, ts=1680000000.0 + i)])
+        for i in range(OPERATIONS_COUNT)
+    ]
+
+
+@pytest.mark.parametrize("segment_format", list(SegmentFormat))
+def test_put_and_get(segment_format):
+    operations = _operations()
+
+    def put():
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue(
+                Path(dirpath),
+                lambda x: x.to_dict(),
+                Operation.from_dict,
+                threading.RLock(),
+                segment_format=segment_format,
+            )
+            for op in operations:
+                queue.put(op)
+            queue.flush()
+            queue.close()
+
+    def get():
+        while queue.get_batch(1000):
+            pass
+
+    # Deserialization into `Operation` objects is left out to measure the segment decoding only
+
+    report(f"DiskQueue.put [{segment_format.value}]", OPERATIONS_COUNT, measure(put))
+
+    with TemporaryDirectory() as dirpath:
+        queue = DiskQueue(
+            Path(dirpath), lambda x: x.to_dict(), lambda x: x, threading.RLock(), segment_format=segment_format
+        )
+        for op in operations:
+            queue.put(op)
+        queue.flush()
+        report(f"DiskQueue.get_batch [{segment_format.value}]", OPERATIONS_COUNT, measure(get, repeat=1))
+        queue.close()
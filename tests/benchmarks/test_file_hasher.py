@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+import pytest
+from mock import patch
+
+from neptune.internal.artifacts.drivers.local import LocalArtifactDriver
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+SMALL_FILES_COUNT = 5000
+LARGE_FILES_COUNT = 3
+LARGE_FILE_SIZE = 32 * 2**20
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    root = tmp_path_factory.mktemp("dataset")
+    for idx in range(SMALL_FILES_COUNT):
+        directory = root / str(idx % 50)
+        directory.mkdir(exist_ok=True)
+        (directory / f"{idx}.txt").write_bytes(os.urandom(512))
+    for idx in range(LARGE_FILES_COUNT):
+        (root / f"large_{idx}.bin").write_bytes(os.urandom(LARGE_FILE_SIZE))
+    return root
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_get_tracked_files(dataset, tmp_path, cached):
+    homes = iter(range(1000))
+
+    def track():
+        # a fresh home directory means an empty hash cache
+        home = tmp_path if cached else tmp_path / str(next(homes))
+        with patch("pathlib.Path.home", return_value=home):
+            LocalArtifactDriver.get_tracked_files(str(dataset))
+
+    if cached:
+        track()
+
+    report(
+        f"LocalArtifactDriver.get_tracked_files [{'warm' if cached else 'cold'} cache]",
+        SMALL_FILES_COUNT + LARGE_FILES_COUNT,
+        measure(track),
+    )
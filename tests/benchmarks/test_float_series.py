@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from mock import MagicMock
+
+from neptune.attributes.series.float_series import (
+    FloatSeries,
+    FloatSeriesVal,
+)
+from neptune.internal.backends.operation_api_object_converter import OperationApiObjectConverter
+from neptune.internal.backends.operations_preprocessor import OperationsPreprocessor
+from neptune.internal.operation import Operation
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+VALUES_COUNT = 1_000_000
+
+
+@pytest.mark.parametrize("kind", ["list", "numpy"])
+def test_extend_pipeline(kind):
+    array = np.random.default_rng(0).random(VALUES_COUNT)
+    values = array.tolist() if kind == "list" else array
+    attribute = FloatSeries(MagicMock(), ["train", "loss"])
+
+    def to_operations():
+        return attribute._get_log_operations_from_value(FloatSeriesVal(values))
+
+    operations = to_operations()
+    lines = [json.dumps(op.to_dict()) for op in operations]
+    decoded = [Operation.from_dict(json.loads(line)) for line in lines]
+
+    def preprocess():
+        preprocessor = OperationsPreprocessor()
+        preprocessor.process(decoded)
+        return preprocessor.get_operations().other_operations
+
+    merged = preprocess()
+    converter = OperationApiObjectConverter()
+
+    report(f"extend: value -> operations [{kind}]", VALUES_COUNT, measure(to_operations))
+    report(
+        f"extend: queue encode [{kind}]", VALUES_COUNT, measure(lambda: [json.dumps(op.to_dict()) for op in operations])
+    )
+    report(
+        f"extend: queue decode [{kind}]",
+        VALUES_COUNT,
+        measure(lambda: [Operation.from_dict(json.loads(line)) for line in lines]),
+    )
+    report(f"extend: preprocess [{kind}]", VALUES_COUNT, measure(preprocess))
+    report(f"extend: API encode [{kind}]", VALUES_COUNT, measure(lambda: [converter.convert(op) for op in merged]))
+
+
+@pytest.mark.parametrize("step_window", [None, 100])
+def test_log_with_aggregation(step_window):
+    count = 100_000
+    operations = []
+
+    def enqueue_operation(op, wait):
+        # the disk queue encodes every operation
+        operations.append(json.dumps(op.to_dict()))
+
+    lock = threading.RLock()
+    container = MagicMock(lock=lambda: lock, _op_processor=SimpleNamespace(enqueue_operation=enqueue_operation))
+
+    def log():
+        operations.clear()
+        attribute = FloatSeries(container, ["train", "loss"])
+        if step_window:
+            attribute.aggregate("mean", step_window=step_window)
+        for step in range(count):
+            attribute.log(step / count, step=step)
+        attribute._flush_aggregation()
+
+    name = f"log [step_window={step_window}]"
+    report(name, count, measure(log))
+    print(f"{name:<60} {len(operations):>14,} operations")
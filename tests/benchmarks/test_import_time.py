@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import subprocess
+import sys
+
+from tests.benchmarks.utils import report
+
+REPEAT = 5
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
+    )
+
+
+def _import_time(module: str) -> float:
+    """Returns the best cumulative import time of `module` reported by `python -X importtime`, in seconds."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        for line in _run("-X", "importtime", "-c", f"import {module}").stderr.splitlines():
+            cumulative_us, name = [part.strip() for part in line.split("|")[1:]]
+            if name == module:
+                best = min(best, int(cumulative_us) / 1e6)
+    return best
+
+
+def _statement_time(statement: str) -> float:
+    """Returns the best wall-clock time of `statement` run in a fresh interpreter, in seconds."""
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    return min(float(_run("-c", code).stdout) for _ in range(REPEAT))
+
+
+def test_import_neptune():
+    report("import neptune", 1, _import_time("neptune"))
+
+
+def test_import_model_version():
+    report("from neptune import ModelVersion", 1, _statement_time("from neptune import ModelVersion"))
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from neptune.internal.operation import (
+    AssignFloat,
+    LogFloats,
+    LogSeriesValue,
+    LogStrings,
+    Operation,
+)
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+OPERATIONS_COUNT = 100_000
+
+
+def _serialized_operations():
+    operations = []
+    for i in range(OPERATIONS_COUNT):
+        if i % 10 == 0:
+            operations.append(AssignFloat(["params", f"param_{i % 100}"], i * 0.5))
+        elif i % 10 == 1:
+            operations.append(LogStrings(["logs", "stdout"], [LogSeriesValue(f"line {i}", None, 1680000000.0 + i)]))
+        else:
+            operations.append(
+                LogFloats(["train", f"metric_{i % 8}"], [LogSeriesValue(i * 0.01, float(i), 1680000000.0 + i)])
+            )
+    return [json.dumps(operation.to_dict()) for operation in operations]
+
+
+def test_replay_operations():
+    lines = _serialized_operations()
+    dicts = [json.loads(line) for line in lines]
+    operations = [Operation.from_dict(data) for data in dicts]
+
+    report("Operation.from_dict", OPERATIONS_COUNT, measure(lambda: [Operation.from_dict(data) for data in dicts]))
+    report("Operation.to_dict", OPERATIONS_COUNT, measure(lambda: [operation.to_dict() for operation in operations]))
+    report(
+        "replay: json.loads + Operation.from_dict",
+        OPERATIONS_COUNT,
+        measure(lambda: [Operation.from_dict(json.loads(line)) for line in lines]),
+    )
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from neptune.internal.backends.operations_preprocessor import OperationsPreprocessor
+from neptune.internal.operation import LogFloats
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+BATCH_SIZE = 1000
+BATCHES_COUNT = 50
+
+
+@pytest.mark.parametrize("paths_count", [1, 10, 1000])
+def test_process_batch(paths_count):
+    batches = [
+        [
+            LogFloats(["metrics", str(i % paths_count)], [LogFloats.ValueType(float(i), step=None, ts=float(i))])
+            for i in range(BATCH_SIZE)
+        ]
+        for _ in range(BATCHES_COUNT)
+    ]
+
+    def process():
+        for batch in batches:
+            preprocessor = OperationsPreprocessor()
+            preprocessor.process(batch)
+            preprocessor.get_operations()
+
+    report(f"OperationsPreprocessor [{paths_count} paths]", BATCH_SIZE * BATCHES_COUNT, measure(process))
+
+
+def test_process_batch_with_multiple_values_per_operation():
+    batches = [
+        [
+            LogFloats(["metrics", "loss"], [LogFloats.ValueType(float(j), step=None, ts=float(j)) for j in range(100)])
+            for _ in range(BATCH_SIZE)
+        ]
+        for _ in range(5)
+    ]
+
+    def process():
+        for batch in batches:
+            preprocessor = OperationsPreprocessor()
+            preprocessor.process(batch)
+            preprocessor.get_operations()
+
+    report("OperationsPreprocessor [1 path, 100 values per op]", BATCH_SIZE * 5, measure(process))
@@ -0,0 +1,50 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+from mock import patch
+
+from neptune import (
+    ANONYMOUS_API_TOKEN,
+    init_run,
+)
+from neptune.envs import (
+    API_TOKEN_ENV_NAME,
+    PROJECT_ENV_NAME,
+)
+from neptune.internal.backends.api_model import (
+    Attribute,
+    AttributeType,
+)
+from neptune.internal.backends.neptune_backend_mock import NeptuneBackendMock
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+ATTRIBUTES_COUNT = 50_000
+
+
+@patch.dict(os.environ, {PROJECT_ENV_NAME: "organization/project", API_TOKEN_ENV_NAME: ANONYMOUS_API_TOKEN})
+@patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+def test_sync_unchanged_structure():
+    attributes = [
+        Attribute(f"metrics/{i // 100}/value_{i}", AttributeType.FLOAT_SERIES) for i in range(ATTRIBUTES_COUNT)
+    ]
+    with init_run(mode="sync") as run:
+        with patch.object(run._backend, "get_attributes", return_value=attributes):
+            run.sync(wait=False)
+            report("sync, unchanged structure", ATTRIBUTES_COUNT, measure(lambda: run.sync(wait=False)))
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from datetime import datetime
+
+from mock import Mock
+
+from neptune.internal.backends.api_model import (
+    AttributeType,
+    AttributeWithProperties,
+    LeaderboardEntry,
+)
+from neptune.internal.container_type import ContainerType
+from neptune.metadata_containers.metadata_containers_table import Table
+from tests.benchmarks.utils import (
+    measure,
+    report,
+)
+
+ENTRIES_COUNT = 10000
+COLUMNS_COUNT = 100
+
+
+def _attribute(idx: int) -> AttributeWithProperties:
+    kind = idx % 4
+    if kind == 0:
+        return AttributeWithProperties(f"metrics/{idx}", AttributeType.FLOAT_SERIES, Mock(last=float(idx)))
+    if kind == 1:
+        return AttributeWithProperties(f"params/{idx}", AttributeType.FLOAT, Mock(value=float(idx)))
+    if kind == 2:
+        return AttributeWithProperties(f"params/{idx}", AttributeType.STRING, Mock(value=str(idx)))
+    return AttributeWithProperties(f"sys/{idx}", AttributeType.DATETIME, Mock(value=datetime.now()))
+
+
+def test_to_pandas():
+    attributes = [_attribute(idx) for idx in range(COLUMNS_COUNT)]
+    # every other entry misses a few columns
+    entries = [
+        LeaderboardEntry(str(idx), attributes if idx % 2 else attributes[: COLUMNS_COUNT - 5])
+        for idx in range(ENTRIES_COUNT)
+    ]
+    table = Table(backend=Mock(), container_type=ContainerType.RUN, entries=entries)
+
+    report(
+        f"Table.to_pandas [{ENTRIES_COUNT} entries, {COLUMNS_COUNT} columns]",
+        ENTRIES_COUNT,
+        measure(table.to_pandas),
+    )
+
+
+def test_to_rows():
+    attributes = [_attribute(idx) for idx in range(COLUMNS_COUNT)]
+    entries = [LeaderboardEntry(str(idx), attributes) for idx in range(ENTRIES_COUNT)]
+    table = Table(backend=Mock(), container_type=ContainerType.RUN, entries=entries)
+    paths = [attribute.path for attribute in attributes[-10:]]
+
+    def read_rows():
+        for row in table.to_rows():
+            for path in paths:
+                row[path].get()
+
+    report(
+        f"Table.to_rows [{ENTRIES_COUNT} entries, {len(paths)} of {COLUMNS_COUNT} fields read]",
+        ENTRIES_COUNT,
+        measure(read_rows),
+    )
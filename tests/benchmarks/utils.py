@@ -0,0 +1,33 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["measure", "report"]
+
+import time
+from typing import Callable
+
+
+def measure(fun: Callable[[], None], repeat: int = 3) -> float:
+    """Returns the best wall-clock time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fun()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name: str, count: int, seconds: float) -> None:
+    print(f"{name:<60} {count / seconds:>14,.0f} ops/s {seconds * 1e6 / count:>10.2f} us/op")
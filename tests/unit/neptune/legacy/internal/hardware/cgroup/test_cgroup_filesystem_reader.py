@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import tempfile
+import unittest
+
+from mock import patch
+
+from neptune.common.hardware.cgroup.cgroup_filesystem_reader import CGroupFilesystemReader
+
+
+class TestCGroupFilesystemReader(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.root = self._tmp_dir.name
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _write(self, path, content):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def _mounts(self, *mounts):
+        return self._write(
+            "proc/mounts", "".join(f"{fs} {self.root}/{mount_dir} {fs} {opts} 0 0\n" for fs, mount_dir, opts in mounts)
+        )
+
+    def _reader(self, mounts, proc_self_cgroup="0::/\n"):
+        reader = CGroupFilesystemReader(
+            proc_mounts=mounts, proc_self_cgroup=self._write("proc/self/cgroup", proc_self_cgroup)
+        )
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_cgroup_v1(self):
+        # given
+        mounts = self._mounts(
+            ("tmpfs", "sys/fs/cgroup", "rw,mode=755"),
+            ("cgroup", "sys/fs/cgroup/cpu,cpuacct", "rw,relatime,cpu,cpuacct"),
+            ("cgroup", "sys/fs/cgroup/memory", "rw,relatime,memory"),
+            ("cgroup2", "sys/fs/cgroup/unified", "rw,relatime"),
+        )
+        self._write("sys/fs/cgroup/memory/memory.usage_in_bytes", "1048576\n")
+        self._write("sys/fs/cgroup/memory/memory.limit_in_bytes", "9223372036854771712\n")
+        self._write("sys/fs/cgroup/cpu,cpuacct/cpu.cfs_quota_us", "-1\n")
+        self._write("sys/fs/cgroup/cpu,cpuacct/cpu.cfs_period_us", "100000\n")
+        self._write("sys/fs/cgroup/cpu,cpuacct/cpuacct.usage", "123456789\n")
+
+        # when
+        reader = self._reader(mounts)
+
+        # then
+        self.assertEqual(1, reader.version)
+        self.assertEqual(1048576, reader.get_memory_usage_in_bytes())
+        self.assertEqual(9223372036854771712, reader.get_memory_limit_in_bytes())
+        self.assertEqual(-1, reader.get_cpu_quota_micros())
+        self.assertEqual(100000, reader.get_cpu_period_micros())
+        self.assertEqual(123456789, reader.get_cpuacct_usage_nanos())
+
+    def test_cgroup_v2(self):
+        # given
+        mounts = self._mounts(("cgroup2", "sys/fs/cgroup", "rw,nosuid,nodev,noexec,relatime"))
+        self._write("sys/fs/cgroup/memory.current", "2097152\n")
+        self._write("sys/fs/cgroup/memory.max", "4294967296\n")
+        self._write("sys/fs/cgroup/cpu.max", "150000 100000\n")
+        self._write("sys/fs/cgroup/cpu.stat", "usage_usec 5000\nuser_usec 4000\nsystem_usec 1000\n")
+
+        # when
+        reader = self._reader(mounts)
+
+        # then
+        self.assertEqual(2, reader.version)
+        self.assertEqual(2097152, reader.get_memory_usage_in_bytes())
+        self.assertEqual(4294967296, reader.get_memory_limit_in_bytes())
+        self.assertEqual(150000, reader.get_cpu_quota_micros())
+        self.assertEqual(100000, reader.get_cpu_period_micros())
+        self.assertEqual(5000000, reader.get_cpuacct_usage_nanos())
+
+    def test_cgroup_v2_without_limits(self):
+        # given
+        mounts = self._mounts(("cgroup2", "sys/fs/cgroup", "rw"))
+        self._write("sys/fs/cgroup/memory.current", "2097152\n")
+        self._write("sys/fs/cgroup/memory.max", "max\n")
+        self._write("sys/fs/cgroup/cpu.stat", "usage_usec 5000\n")
+
+        # when
+        reader = self._reader(mounts)
+
+        # then
+        self.assertEqual(CGroupFilesystemReader.UNLIMITED_MEMORY_BYTES, reader.get_memory_limit_in_bytes())
+        self.assertEqual(-1, reader.get_cpu_quota_micros())
+        self.assertEqual(100000, reader.get_cpu_period_micros())
+
+    def test_cgroup_v2_of_process(self):
+        # given
+        mounts = self._mounts(("cgroup2", "sys/fs/cgroup", "rw"))
+        self._write("sys/fs/cgroup/memory.current", "1\n")
+        self._write("sys/fs/cgroup/system.slice/job.scope/memory.current", "2\n")
+
+        # when
+        reader = self._reader(mounts, proc_self_cgroup="0::/system.slice/job.scope\n")
+
+        # then
+        self.assertEqual(2, reader.get_memory_usage_in_bytes())
+
+    def test_files_are_opened_once(self):
+        # given
+        mounts = self._mounts(("cgroup2", "sys/fs/cgroup", "rw"))
+        usage_file = self._write("sys/fs/cgroup/memory.current", "1\n")
+        reader = self._reader(mounts)
+
+        # when
+        with patch("os.open", wraps=os.open) as os_open:
+            values = []
+            for value in ["1\n", "22\n", "3\n"]:
+                with open(usage_file, "w") as f:
+                    f.write(value)
+                values.append(reader.get_memory_usage_in_bytes())
+
+        # then
+        self.assertEqual([1, 22, 3], values)
+        self.assertEqual(1, os_open.call_count)
+
+    def test_no_cgroup(self):
+        # given
+        mounts = self._mounts(("tmpfs", "sys/fs/cgroup", "rw"), ("cgroup", "sys/fs/cgroup/memory", "rw,memory"))
+
+        # expect
+        with self.assertRaises(OSError):
+            self._reader(mounts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,13 +14,23 @@
 # limitations under the License.
 #
 
+import io
+import os
+import tarfile
+import threading
 import unittest
 
 import pytest
 from mock import Mock
 
 from neptune.common.exceptions import InternalClientError
-from neptune.common.storage.datastream import FileChunker
+from neptune.common.storage.datastream import (
+    FileChunker,
+    TarGzStream,
+    compress_to_tar_gz_in_memory,
+    stream_tar_gz,
+)
+from neptune.common.storage.storage_utils import UploadEntry
 from neptune.legacy.internal.api_clients.client_config import MultipartConfig
 
 
@@ -71,5 +81,54 @@ class TestFileChunker:
             chunker._get_chunk_size()
 
 
+class TestTarGzStream:
+    @staticmethod
+    def _upload_entries(tmp_path):
+        (tmp_path / "dir").mkdir()
+        (tmp_path / "dir" / "a.txt").write_bytes(b"a" * 100_000)
+        (tmp_path / "b.bin").write_bytes(os.urandom(300_000))
+        return [
+            UploadEntry(str(tmp_path / "dir"), "dir"),
+            UploadEntry(str(tmp_path / "b.bin"), "b.bin"),
+        ]
+
+    @staticmethod
+    def _read_archive(data):
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as archive:
+            return {member.name: archive.extractfile(member).read() for member in archive if member.isfile()}
+
+    @pytest.mark.parametrize("compression_level", [0, 1, 9])
+    def test_stream_matches_in_memory_archive(self, tmp_path, compression_level):
+        entries = self._upload_entries(tmp_path)
+
+        data = b"".join(stream_tar_gz(entries, compression_level=compression_level, chunk_size=1024))
+
+        assert self._read_archive(data) == self._read_archive(compress_to_tar_gz_in_memory(entries))
+
+    def test_stream_is_chunked(self, tmp_path):
+        chunks = list(stream_tar_gz(self._upload_entries(tmp_path), compression_level=0, chunk_size=64 * 1024))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 64 * 1024 for chunk in chunks[:-1])
+
+    def test_request_body_can_be_read_many_times(self, tmp_path):
+        body = TarGzStream(self._upload_entries(tmp_path))
+
+        assert self._read_archive(b"".join(body)) == self._read_archive(b"".join(body))
+
+    def test_abandoned_stream_stops_writer(self, tmp_path):
+        threads_before = threading.active_count()
+        stream = stream_tar_gz(self._upload_entries(tmp_path), compression_level=0, chunk_size=1024)
+
+        next(stream)
+        stream.close()
+
+        assert threading.active_count() == threads_before
+
+    def test_error_is_raised_to_reader(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            list(stream_tar_gz([UploadEntry(str(tmp_path / "missing"), "missing")]))
+
+
 if __name__ == "__main__":
     unittest.main()
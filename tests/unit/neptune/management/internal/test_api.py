@@ -28,6 +28,7 @@ from neptune.management import trash_objects
 
 
 @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+@patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
 class TestTrashObjects(unittest.TestCase):
     PROJECT_NAME = "organization/project"
 
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+
+from neptune.attributes.series.aggregation import SeriesAggregator
+from neptune.internal.operation import LogSeriesValue
+
+
+class TestSeriesAggregator(unittest.TestCase):
+    def test_statistics(self):
+        values = [(3.0, 1, 100.0), (1.0, 2, 100.5), (5.0, 3, 101.0), (4.0, 4, 101.5)]
+        expected = {"mean": 3.25, "min": 1.0, "max": 5.0, "last": 4.0, "count": 4.0}
+        for statistic, value in expected.items():
+            with self.subTest(statistic=statistic):
+                # given
+                aggregator = SeriesAggregator(statistic, step_window=10)
+
+                # when
+                points = aggregator.add(values)
+
+                # then
+                self.assertEqual([], points)
+                self.assertEqual(LogSeriesValue(value, 4, 101.5), aggregator.flush())
+                self.assertIsNone(aggregator.flush())
+
+    def test_step_window(self):
+        # given
+        aggregator = SeriesAggregator("mean", step_window=10)
+
+        # when
+        points = aggregator.add((float(step), step, 1000.0 + step) for step in range(25))
+
+        # then
+        self.assertEqual([LogSeriesValue(4.5, 9, 1009.0), LogSeriesValue(14.5, 19, 1019.0)], points)
+        self.assertEqual(LogSeriesValue(22.0, 24, 1024.0), aggregator.flush())
+
+    def test_time_window(self):
+        # given
+        aggregator = SeriesAggregator("max", window=1)
+
+        # when
+        points = aggregator.add((float(i), None, 100 + i / 4) for i in range(10))
+
+        # then
+        self.assertEqual([LogSeriesValue(3.0, None, 100.75), LogSeriesValue(7.0, None, 101.75)], points)
+        self.assertEqual(LogSeriesValue(9.0, None, 102.25), aggregator.flush())
+
+    def test_reset(self):
+        # given
+        aggregator = SeriesAggregator("count", window=1)
+        aggregator.add([(1.0, None, 100.0), (2.0, None, 100.5)])
+
+        # when
+        aggregator.reset()
+
+        # then
+        self.assertIsNone(aggregator.flush())
+        self.assertEqual([], aggregator.add([(3.0, None, 100.7)]))
+        self.assertEqual(LogSeriesValue(1.0, None, 100.7), aggregator.flush())
+
+    def test_invalid_configuration(self):
+        for kwargs in [
+            {"statistic": "median", "window": 1},
+            {"statistic": "mean"},
+            {"statistic": "mean", "window": 1, "step_window": 10},
+            {"statistic": "mean", "window": 0},
+        ]:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    SeriesAggregator(**kwargs)
+
+    def test_step_window_requires_steps(self):
+        with self.assertRaises(ValueError):
+            SeriesAggregator("mean", step_window=10).add([(1.0, None, 100.0)])
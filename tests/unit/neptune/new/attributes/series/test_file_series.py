@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 import io
+import os
+from tempfile import TemporaryDirectory
 from unittest import mock
 
 import numpy
@@ -45,6 +47,26 @@ class TestFileSeries(TestAttributeBase):
             with self.assertRaises(Exception):
                 FileSeries(MagicMock(), MagicMock()).assign(value)
 
+    def test_download_skips_downloaded_images(self):
+        with TemporaryDirectory() as tmp_dir:
+            # given
+            for name in ("0.png", "2.png", "3.png.part"):
+                with open(os.path.join(tmp_dir, name), "wb") as f:
+                    f.write(b"image")
+            backend = MagicMock()
+            backend.get_image_series_values.return_value.totalItemCount = 4
+            container = MagicMock()
+            container._backend = backend
+            path = self._random_path()
+
+            # when
+            FileSeries(container, path).download(tmp_dir)
+
+            # then
+            self.assertEqual(
+                [1, 3], sorted(call_args[0][3] for call_args in backend.download_file_series_by_index.call_args_list)
+            )
+
     def test_log_type_error(self):
         values = [[5.0], [[]], 55, None]
         for value in values:
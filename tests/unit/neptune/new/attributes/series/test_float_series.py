@@ -13,12 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from datetime import datetime
+
 from mock import (
     MagicMock,
     patch,
 )
 
 from neptune.attributes.series.float_series import FloatSeries
+from neptune.internal.backends.api_model import (
+    FloatPointValue,
+    FloatSeriesValues,
+)
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
 
@@ -51,3 +57,92 @@ class TestFloatSeries(TestAttributeBase):
             values = list(var.fetch_values()["value"].array)
             expected = list(range(0, 5000))
             self.assertEqual(len(set(expected)), len(set(values)))
+
+    def test_fetch_values_in_pages(self):
+        # given
+        total = 2500
+        points = [FloatPointValue(timestampMillis=1_600_000_000_000 + i, step=i, value=i / 2) for i in range(total)]
+        backend = MagicMock()
+        backend.get_float_series_values.side_effect = lambda _id, _type, _path, offset, limit: FloatSeriesValues(
+            total, points[offset : offset + limit]
+        )
+        var = FloatSeries(MagicMock(_backend=backend), self._random_path())
+        var._FETCH_PAGE_SIZE = 100
+
+        # when
+        df = var.fetch_values()
+
+        # then
+        self.assertEqual(["step", "value", "timestamp"], list(df.columns))
+        self.assertEqual(list(range(total)), list(df["step"]))
+        self.assertEqual([i / 2 for i in range(total)], list(df["value"]))
+        self.assertEqual("float64", df["value"].dtype)
+        self.assertEqual(datetime.fromtimestamp(1_600_000_000.5), df["timestamp"][500])
+        self.assertEqual(25, backend.get_float_series_values.call_count)
+        self.assertEqual(["step", "value"], list(var.fetch_values(include_timestamp=False).columns))
+
+    def test_fetch_values_of_shrinking_series(self):
+        # given
+        points = [FloatPointValue(timestampMillis=0, step=i, value=i) for i in range(150)]
+        backend = MagicMock()
+        backend.get_float_series_values.side_effect = lambda _id, _type, _path, offset, limit: FloatSeriesValues(
+            300 if offset == 0 else 150, points[offset : offset + limit]
+        )
+        var = FloatSeries(MagicMock(_backend=backend), self._random_path())
+        var._FETCH_PAGE_SIZE = 100
+
+        # when
+        df = var.fetch_values()
+
+        # then
+        self.assertEqual(list(range(150)), list(df["value"]))
+
+    def test_aggregate_over_step_window(self):
+        with self._exp() as exp:
+            # given
+            exp["train/loss"].aggregate("mean", step_window=10)
+
+            # when
+            exp["train/loss"].extend(list(range(25)), steps=list(range(25)))
+
+            # then
+            self.assertEqual([4.5, 14.5], list(exp["train/loss"].fetch_values()["value"]))
+
+            # and when
+            exp.wait()
+
+            # then
+            self.assertEqual([4.5, 14.5, 22.0], list(exp["train/loss"].fetch_values()["value"]))
+
+    def test_aggregate_numpy_array_over_time_window(self):
+        import numpy as np
+
+        with self._exp() as exp:
+            # given
+            exp["train/loss"].aggregate("max", window=1)
+
+            attribute = exp.get_attribute("train/loss")
+
+            # when
+            exp["train/loss"].extend(np.arange(10.0), timestamps=100 + np.arange(10) / 4)
+            exp.stop()
+
+            # then
+            self.assertEqual([3.0, 7.0, 9.0], list(attribute.fetch_values()["value"]))
+
+    def test_configure_aggregation(self):
+        with self._exp() as exp:
+            # given
+            var = exp["train/acc"]
+            var.append(0.5)
+            attribute = exp.get_attribute("train/acc")
+
+            # when
+            attribute.configure(aggregate="last", step_window=100)
+            for step in range(1, 250):
+                var.append(step / 250, step=step)
+            attribute.aggregate(None)
+            var.append(1.0, step=250)
+
+            # then
+            self.assertEqual([0.5, 99 / 250, 199 / 250, 249 / 250, 1.0], list(exp["train/acc"].fetch_values()["value"]))
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import numpy as np
 from mock import (
     MagicMock,
     call,
@@ -32,6 +33,7 @@ from neptune.internal.operation import (
     ClearStringLog,
     ConfigFloatSeries,
     LogFloats,
+    LogSeriesColumns,
 )
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
@@ -121,6 +123,49 @@ class TestSeries(TestAttributeBase):
                 var.log(value, wait=wait)
                 processor.enqueue_operation.assert_called_with(LogFloats(path, expected), wait=wait)
 
+    @patch("neptune.metadata_containers.metadata_container.get_operation_processor")
+    def test_extend_numpy_array(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            path = self._random_path()
+            var = FloatSeries(exp, path)
+            var.extend(np.arange(250), steps=np.arange(250) * 2)
+
+            operations = [
+                call_args[0][0]
+                for call_args in processor.enqueue_operation.call_args_list
+                if call_args[0][0].path == path
+            ]
+            self.assertEqual([100, 100, 50], [len(op.values) for op in operations])
+            self.assertTrue(all(isinstance(op.values, LogSeriesColumns) for op in operations))
+            self.assertEqual(
+                LogFloats(path, [LogFloats.ValueType(float(i), 2.0 * i, self._now()) for i in range(200, 250)]),
+                operations[2],
+            )
+
+    @patch("neptune.metadata_containers.metadata_container.get_operation_processor")
+    def test_extend_numpy_array_reused_by_caller(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # given
+            path = self._random_path()
+            var = FloatSeries(exp, path)
+            values, steps = np.arange(10.0), np.arange(10.0)
+
+            # when
+            var.extend(values, steps=steps)
+            values[:] = 99
+            steps[:] = -1
+
+            # then
+            processor.enqueue_operation.assert_called_with(
+                LogFloats(path, [LogFloats.ValueType(float(i), float(i), self._now()) for i in range(10)]), wait=False
+            )
+
     @patch("neptune.metadata_containers.metadata_container.get_operation_processor")
     def test_log_with_step(self, get_operation_processor):
         value_step_and_expected = [
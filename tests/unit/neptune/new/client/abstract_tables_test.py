@@ -48,6 +48,7 @@ from neptune.metadata_containers.metadata_containers_table import (
     new=lambda _, _uuid, _type: [Attribute(path="test", type=AttributeType.STRING)],
 )
 @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+@patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
 class AbstractTablesTestMixin:
     expected_container_type = None
 
@@ -131,6 +132,55 @@ class AbstractTablesTestMixin:
         with self.assertRaises(KeyError):
             self.assertTrue(df["image/series"])
 
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_as_pandas_keeps_entries_order(self, search_leaderboard_entries):
+        # given
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(str(uuid.uuid4()), [AttributeWithProperties("a", AttributeType.FLOAT, Mock(value=0))]),
+            LeaderboardEntry(str(uuid.uuid4()), [AttributeWithProperties("b", AttributeType.INT, Mock(value=1))]),
+            LeaderboardEntry(
+                str(uuid.uuid4()),
+                [
+                    AttributeWithProperties("b", AttributeType.INT, Mock(value=2)),
+                    AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value="ID-2")),
+                ],
+            ),
+        ]
+
+        # when
+        df = self.get_table().to_pandas()
+
+        # then
+        self.assertEqual(["sys/id", "a", "b"], list(df.columns))
+        self.assertEqual([0, 1, 2], list(df.index))
+        self.assertEqual(0.0, df["a"][0])
+        self.assertEqual([1.0, 2.0], list(df["b"][1:]))
+        self.assertEqual("ID-2", df["sys/id"][2])
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_table_entries_with_different_attributes(self, search_leaderboard_entries):
+        # given
+        def attributes(*paths):
+            return [AttributeWithProperties(path, AttributeType.STRING, Mock(value=path)) for path in paths]
+
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(str(uuid.uuid4()), attributes("a", "b", "c")),
+            LeaderboardEntry(str(uuid.uuid4()), attributes("c", "a")),
+            LeaderboardEntry(str(uuid.uuid4()), attributes("b", "a", "c")),
+        ]
+
+        # when
+        entries = self.get_table_entries(table=self.get_table())
+
+        # then
+        for entry in entries:
+            self.assertEqual("a", entry["a"].get())
+            self.assertEqual("c", entry["c"].get())
+        self.assertEqual("b", entries[0]["b"].get())
+        self.assertEqual("b", entries[2]["b"].get())
+        with self.assertRaises(ValueError):
+            entries[1]["b"].get()
+
     @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
     @patch.object(NeptuneBackendMock, "download_file")
     @patch.object(NeptuneBackendMock, "download_file_set")
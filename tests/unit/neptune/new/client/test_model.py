@@ -42,6 +42,7 @@ AN_API_MODEL = api_model()
 
 
 @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+@patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
 class TestClientModel(AbstractExperimentTestMixin, unittest.TestCase):
     @staticmethod
     def call_init(**kwargs):
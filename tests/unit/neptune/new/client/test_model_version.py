@@ -57,6 +57,7 @@ AN_API_MODEL_VERSION = api_model_version()
     else AN_API_MODEL_VERSION,
 )
 @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+@patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
 class TestClientModelVersion(AbstractExperimentTestMixin, unittest.TestCase):
     @staticmethod
     def call_init(**kwargs):
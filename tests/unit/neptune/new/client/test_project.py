@@ -16,7 +16,10 @@
 import os
 import unittest
 
-from mock import patch
+from mock import (
+    Mock,
+    patch,
+)
 
 from neptune import (
     ANONYMOUS_API_TOKEN,
@@ -31,7 +34,11 @@ from neptune.exceptions import NeptuneMissingProjectNameException
 from neptune.internal.backends.api_model import (
     Attribute,
     AttributeType,
+    AttributeWithProperties,
+    FloatPointValue,
+    FloatSeriesValues,
     IntAttribute,
+    LeaderboardEntry,
 )
 from neptune.internal.backends.neptune_backend_mock import NeptuneBackendMock
 from tests.unit.neptune.new.client.abstract_experiment_test_mixin import AbstractExperimentTestMixin
@@ -42,6 +49,7 @@ from tests.unit.neptune.new.client.abstract_experiment_test_mixin import Abstrac
     new=lambda _, _uuid, _type: [Attribute("test", AttributeType.STRING)],
 )
 @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+@patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
 class TestClientProject(AbstractExperimentTestMixin, unittest.TestCase):
     PROJECT_NAME = "organization/project"
 
@@ -99,3 +107,57 @@ class TestClientProject(AbstractExperimentTestMixin, unittest.TestCase):
 
             self.assertEqual(42, project["some/variable"].fetch())
             self.assertNotIn(str(project._id), os.listdir(".neptune"))
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    @patch.object(NeptuneBackendMock, "get_float_series_values")
+    def test_fetch_runs_values(self, get_float_series_values, search_leaderboard_entries):
+        # given
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(
+                f"uuid-{index}",
+                [
+                    AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value=f"RUN-{index}")),
+                    AttributeWithProperties("params/lr", AttributeType.FLOAT, Mock(value=0.1 * index)),
+                    AttributeWithProperties("train/loss", AttributeType.FLOAT_SERIES, Mock(last=1.0)),
+                    AttributeWithProperties("model/weights", AttributeType.FILE, Mock(name="weights", ext="pt")),
+                ],
+            )
+            for index in (1, 2)
+        ]
+        get_float_series_values.side_effect = lambda container_id, container_type, path, offset, limit: (
+            FloatSeriesValues(2, [FloatPointValue(0, step, float(step)) for step in range(2)][offset : offset + limit])
+        )
+
+        with init_project(project=self.PROJECT_NAME, mode="read-only") as project:
+            # when
+            df = project.fetch_runs_values(
+                ["RUN-1", "RUN-2", "RUN-3"],
+                ["params/lr", "train/loss", "model/weights", "missing"],
+                include_timestamp=False,
+            )
+
+        # then
+        self.assertEqual(["sys/id", "attribute", "step", "value"], list(df.columns))
+        self.assertEqual(
+            [
+                ("RUN-1", "params/lr", None, 0.1),
+                ("RUN-2", "params/lr", None, 0.2),
+                ("RUN-1", "train/loss", 0.0, 0.0),
+                ("RUN-1", "train/loss", 1.0, 1.0),
+                ("RUN-2", "train/loss", 0.0, 0.0),
+                ("RUN-2", "train/loss", 1.0, 1.0),
+            ],
+            [
+                (sys_id, attribute, None if step != step else step, value)
+                for sys_id, attribute, step, value in df.itertuples(index=False)
+            ],
+        )
+        self.assertEqual(1, search_leaderboard_entries.call_count)
+        self.assertEqual(
+            {"sys/id", "params/lr", "train/loss", "model/weights", "missing"},
+            search_leaderboard_entries.call_args[1]["columns"],
+        )
+        self.assertEqual(
+            {("uuid-1", ("train", "loss")), ("uuid-2", ("train", "loss"))},
+            {(call[0][0], tuple(call[0][2])) for call in get_float_series_values.call_args_list},
+        )
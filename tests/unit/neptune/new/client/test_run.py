@@ -43,6 +43,7 @@ AN_API_RUN = api_run()
 
 
 @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+@patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
 class TestClientRun(AbstractExperimentTestMixin, unittest.TestCase):
     @staticmethod
     def call_init(**kwargs):
@@ -252,3 +253,45 @@ class TestClientRun(AbstractExperimentTestMixin, unittest.TestCase):
     def test_track_uncommitted_changes_not_called_given_git_ref_disabled(self, mock_get_diff):
         with init_run(mode="debug", git_ref=GitRef.DISABLED):
             mock_get_diff.assert_not_called()
+
+    def test_sync_updates_only_changed_attributes(self):
+        with init_run(mode="sync") as run:
+            # given
+            run["unchanged"] = 1
+            run["retyped"] = 1
+            run["removed"] = 1
+            unchanged, retyped = run.get_attribute("unchanged"), run.get_attribute("retyped")
+            remote_attributes = [
+                Attribute("unchanged", AttributeType.INT),
+                Attribute("retyped", AttributeType.STRING),
+                Attribute("added/nested", AttributeType.FLOAT),
+            ]
+
+            # when
+            with patch.object(run._backend, "get_attributes", return_value=remote_attributes):
+                run.sync()
+
+            # then
+            self.assertIs(unchanged, run.get_attribute("unchanged"))
+            self.assertIsInstance(run.get_attribute("retyped"), String)
+            self.assertIsNot(retyped, run.get_attribute("retyped"))
+            self.assertFalse(run.exists("removed"))
+            self.assertTrue(run.exists("added/nested"))
+
+    def test_sync_keeps_attributes_changed_while_fetching(self):
+        with init_run(mode="sync") as run:
+            # given
+            run["removed_locally"] = 1
+
+            def get_attributes(*_):
+                run["added_locally"] = 1
+                del run["removed_locally"]
+                return [Attribute("removed_locally", AttributeType.INT)]
+
+            # when
+            with patch.object(run._backend, "get_attributes", side_effect=get_attributes):
+                run.sync(wait=False)
+
+            # then
+            self.assertTrue(run.exists("added_locally"))
+            self.assertFalse(run.exists("removed_locally"))
@@ -15,12 +15,21 @@
 #
 
 import unittest
+import uuid
 from typing import List
 
-from mock import patch
+from mock import (
+    Mock,
+    patch,
+)
 
 from neptune import init_project
 from neptune.exceptions import NeptuneException
+from neptune.internal.backends.api_model import (
+    AttributeType,
+    AttributeWithProperties,
+    LeaderboardEntry,
+)
 from neptune.internal.backends.neptune_backend_mock import NeptuneBackendMock
 from neptune.internal.container_type import ContainerType
 from neptune.metadata_containers.metadata_containers_table import (
@@ -40,6 +49,7 @@ class TestRunTables(AbstractTablesTestMixin, unittest.TestCase):
         return table.to_rows()
 
     @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
     def test_fetch_runs_table_is_case_insensitive(self):
         states = ["active", "inactive", "Active", "Inactive", "aCTive", "INacTiVe"]
         for state in states:
@@ -50,9 +60,31 @@ class TestRunTables(AbstractTablesTestMixin, unittest.TestCase):
                     self.fail(e)
 
     @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
     def test_fetch_runs_table_raises_correct_exception_for_incorrect_states(self):
         for incorrect_state in ["idle", "running", "some_arbitrary_state"]:
             with self.subTest(incorrect_state):
                 with self.assertRaises(NeptuneException) as context:
                     self.get_table(state=incorrect_state)
                 self.assertEquals(f"Can't map RunState to API: {incorrect_state}", str(context.exception))
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch("neptune.internal.backends.factory.ReadOnlyNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_iter_runs_table(self, search_leaderboard_entries):
+        # given
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(_id, [AttributeWithProperties("float", AttributeType.FLOAT, Mock(value=idx))])
+            for idx, _id in enumerate(ids)
+        ]
+        project = init_project(project="organization/project", mode="read-only")
+
+        # when
+        entries = project.iter_runs_table(tag="some-tag", columns=["float"])
+
+        # then
+        self.assertEqual(0, search_leaderboard_entries.call_count)
+        self.assertEqual([0, 1, 2], [entry["float"].get() for entry in entries])
+        self.assertEqual({"sys/id", "float"}, search_leaderboard_entries.call_args[1]["columns"])
+        self.assertEqual([ContainerType.RUN], search_leaderboard_entries.call_args[1]["types"])
@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 import hashlib
+import os
 import tempfile
 import time
 import unittest
@@ -26,6 +27,7 @@ from mock import (
 
 from neptune.internal.artifacts.file_hasher import FileHasher
 from neptune.internal.artifacts.types import ArtifactFileData
+from neptune.internal.artifacts.utils import sha1
 
 
 class TestFileHasher(unittest.TestCase):
@@ -105,3 +107,37 @@ class TestFileHasher(unittest.TestCase):
         self.assertEqual("d78f8bb992a56a597f6c7a1fb918bb78271367eb", hash1)
         self.assertEqual("12dada1fff4d4787ade3333147202c3b443e376f", hash2)
         self.assertEqual(2, hashlib.sha1.call_count)
+
+    @patch("pathlib.Path.home")
+    def test_local_file_hashes(self, home):
+        home.return_value = Path(self.temp.name)
+        for idx in range(5):
+            with open(f"{self.temp.name}/file{idx}", "wb") as handler:
+                handler.write(bytes([idx]) * 1000)
+        paths = [f"{self.temp.name}/file{idx}" for idx in range(5)] + [f"{self.temp.name}/test"]
+
+        with patch("neptune.internal.artifacts.file_hasher.sha1", wraps=sha1) as sha1_mock:
+            hashes1 = FileHasher.get_local_file_hashes(paths)
+            hashes2 = FileHasher.get_local_file_hashes(reversed(paths))
+
+        self.assertEqual([sha1(path) for path in paths], hashes1)
+        self.assertEqual(list(reversed(hashes1)), hashes2)
+        self.assertEqual("d78f8bb992a56a597f6c7a1fb918bb78271367eb", hashes1[-1])
+        self.assertEqual(6, sha1_mock.call_count)
+
+    @patch("pathlib.Path.home")
+    def test_local_file_rehashed_when_size_changes(self, home):
+        home.return_value = Path(self.temp.name)
+        path = f"{self.temp.name}/test"
+        modification_time = os.stat(path).st_mtime
+
+        hash1 = FileHasher.get_local_file_hash(path)
+        with open(path, "ab") as handler:
+            handler.write(b"\x00")
+        # keep the same modification date, as coarse file system timestamps would
+        os.utime(path, (modification_time, modification_time))
+        hash2 = FileHasher.get_local_file_hash(path)
+
+        self.assertEqual("d78f8bb992a56a597f6c7a1fb918bb78271367eb", hash1)
+        self.assertEqual(sha1(path), hash2)
+        self.assertNotEqual(hash1, hash2)
@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import sqlite3
+from pathlib import Path
+
+import pytest
+from mock import patch
+
+from neptune.internal.artifacts.local_file_hash_storage import LocalFileHashStorage
+
+LocalFileHash = LocalFileHashStorage.LocalFileHash
+
+
+@pytest.fixture
+def home(tmp_path):
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        yield tmp_path
+
+
+def _count_rows(home: Path) -> int:
+    with sqlite3.connect(str(home / ".neptune" / "files.db")) as session:
+        return session.execute("SELECT COUNT(*) FROM file_hashes").fetchone()[0]
+
+
+def test_migrates_legacy_table(home):
+    (home / ".neptune").mkdir()
+    with sqlite3.connect(str(home / ".neptune" / "files.db")) as session:
+        session.execute("CREATE TABLE local_file_hashes (file_path text, file_hash text, modification_date text)")
+        session.executemany(
+            "INSERT INTO local_file_hashes VALUES (?, ?, ?)",
+            [("/a", "hash1", "20230101"), ("/b", "hash2", "20230102"), ("/a", "hash3", "20230103")],
+        )
+
+    storage = LocalFileHashStorage()
+
+    assert storage.fetch_many([Path("/a"), Path("/b"), Path("/c")]) == {
+        "/a": LocalFileHash("/a", "hash1", "20230101"),
+        "/b": LocalFileHash("/b", "hash2", "20230102"),
+    }
+    assert storage.cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    storage.close()
+
+    # migration runs only once
+    LocalFileHashStorage().close()
+    assert _count_rows(home) == 2
+
+
+def test_entries_are_unique_per_path(home):
+    storage = LocalFileHashStorage()
+
+    storage.insert(Path("/a"), "hash1", "20230101", size=1, inode=10)
+    storage.insert(Path("/a"), "hash2", "20230102", size=2, inode=10)
+    storage.update(Path("/a"), "hash3", "20230103", size=3, inode=10)
+
+    assert storage.fetch_one(Path("/a")) == LocalFileHash("/a", "hash3", "20230103", 3, 10)
+    assert storage.fetch_one(Path("/b")) is None
+    storage.close()
+    assert _count_rows(home) == 1
+
+
+def test_evicts_least_recently_used_entries(home):
+    storage = LocalFileHashStorage()
+    storage.MAX_ENTRIES = 2
+    storage.EVICTION_INTERVAL = 1
+    day = storage.LAST_USED_RESOLUTION
+
+    with patch("time.time", return_value=1000.0):
+        storage.store_many([LocalFileHash("/a", "hash", "date"), LocalFileHash("/b", "hash", "date")])
+    with patch("time.time", return_value=1000.0 + day + 1):
+        storage.store_many([], used_entries=[storage.fetch_one(Path("/a"))])
+    with patch("time.time", return_value=1000.0 + day + 2):
+        storage.store_many([LocalFileHash("/c", "hash", "date")])
+
+    assert set(storage.fetch_many([Path("/a"), Path("/b"), Path("/c")])) == {"/a", "/c"}
+    storage.close()
+
+
+def test_checks_entry_limit_once_per_eviction_interval(home):
+    storage = LocalFileHashStorage()
+    storage.MAX_ENTRIES = 2
+    storage.EVICTION_INTERVAL = 4
+
+    storage.store_many([LocalFileHash(f"/{i}", "hash", "date") for i in range(3)])
+    assert _count_rows(home) == 3
+
+    storage.store_many([LocalFileHash("/3", "hash", "date")])
+    assert _count_rows(home) == 2
+    storage.close()
+
+
+def test_recently_used_entries_are_not_updated(home):
+    storage = LocalFileHashStorage()
+    with patch("time.time", return_value=1000.0):
+        storage.store_many([LocalFileHash("/a", "hash", "date")])
+
+    with patch("time.time", return_value=1000.0 + storage.LAST_USED_RESOLUTION - 1):
+        storage.store_many([], used_entries=[storage.fetch_one(Path("/a"))])
+    assert storage.fetch_one(Path("/a")).last_used == 1000.0
+
+    with patch("time.time", return_value=1000.0 + storage.LAST_USED_RESOLUTION + 1):
+        storage.store_many([], used_entries=[storage.fetch_one(Path("/a"))])
+    assert storage.fetch_one(Path("/a")).last_used == 1000.0 + storage.LAST_USED_RESOLUTION + 1
+    storage.close()
+
+
+def test_evicts_old_entries(home):
+    storage = LocalFileHashStorage()
+    storage.EVICTION_INTERVAL = 1
+
+    with patch("time.time", return_value=1000.0):
+        storage.store_many([LocalFileHash("/a", "hash", "date")])
+    with patch("time.time", return_value=1000.0 + storage.MAX_AGE + 1):
+        storage.store_many([LocalFileHash("/b", "hash", "date")])
+
+    assert set(storage.fetch_many([Path("/a"), Path("/b")])) == {"/b"}
+    storage.close()
@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import sqlite3
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mock import (
+    MagicMock,
+    patch,
+)
+
+from neptune.internal.backends.api_model import (
+    FloatPointValue,
+    FloatSeriesValues,
+)
+from neptune.internal.backends.fetch_cache import FetchCache
+
+
+class TestFetchCache(unittest.TestCase):
+    def setUp(self):
+        self._dir = TemporaryDirectory()
+        self.db_path = Path(self._dir.name) / "fetch_cache.db"
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_get_stored_value(self):
+        # given
+        cache = FetchCache(self.db_path)
+        values = FloatSeriesValues(2, [FloatPointValue(1000, 1, 0.5), FloatPointValue(2000, 2, 0.25)])
+
+        # when
+        cache.put("run-id", "float_series_values/a/0/1000", "v1", values)
+
+        # then
+        self.assertEqual((True, values), cache.get("run-id", "float_series_values/a/0/1000", "v1"))
+        self.assertEqual((False, None), cache.get("run-id", "float_series_values/b/0/1000", "v1"))
+        self.assertEqual((False, None), cache.get("other-id", "float_series_values/a/0/1000", "v1"))
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+    def test_entries_of_other_version_are_missed(self):
+        # given
+        cache = FetchCache(self.db_path)
+        cache.put("run-id", "attributes", "v1", ["old"])
+
+        # expect
+        self.assertEqual((False, None), cache.get("run-id", "attributes", "v2"))
+
+        # when
+        cache.put("run-id", "attributes", "v2", ["new"])
+
+        # then
+        self.assertEqual((True, ["new"]), cache.get("run-id", "attributes", "v2"))
+        self.assertEqual((False, None), cache.get("run-id", "attributes", "v1"))
+
+    def test_entries_are_shared_between_instances(self):
+        # given
+        FetchCache(self.db_path).put("run-id", "attributes", "v1", ["a", "b"])
+
+        # expect
+        self.assertEqual((True, ["a", "b"]), FetchCache(self.db_path).get("run-id", "attributes", "v1"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        # given
+        cache = FetchCache(self.db_path, max_size=3500)
+        for key in ("a", "b", "c"):
+            cache.put("run-id", key, "v1", b"x" * 900)
+        cache.get("run-id", "a", "v1")
+
+        # when
+        cache.put("run-id", "d", "v1", b"x" * 900)
+
+        # then
+        self.assertTrue(cache.get("run-id", "a", "v1")[0])
+        self.assertFalse(cache.get("run-id", "b", "v1")[0])
+        self.assertTrue(cache.get("run-id", "c", "v1")[0])
+        self.assertTrue(cache.get("run-id", "d", "v1")[0])
+
+    def test_values_larger_than_cache_are_not_stored(self):
+        # given
+        cache = FetchCache(self.db_path, max_size=100)
+
+        # when
+        cache.put("run-id", "a", "v1", b"x" * 200)
+
+        # then
+        self.assertFalse(cache.get("run-id", "a", "v1")[0])
+
+    def test_unreadable_entries_are_missed_and_deleted(self):
+        # given
+        cache = FetchCache(self.db_path)
+        cache.put("run-id", "attributes", "v1", ["a"])
+        with sqlite3.connect(str(self.db_path)) as session:
+            session.execute("UPDATE entries SET value = ?", (b"not a pickle",))
+
+        # expect
+        self.assertEqual((False, None), cache.get("run-id", "attributes", "v1"))
+        with sqlite3.connect(str(self.db_path)) as session:
+            self.assertEqual(0, session.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def test_database_errors_are_missed(self):
+        # given
+        cache = FetchCache(self.db_path)
+        cache.put("run-id", "attributes", "v1", ["a"])
+        cache._session = MagicMock()
+        cache._session.execute.side_effect = sqlite3.OperationalError("database is locked")
+
+        # expect
+        self.assertEqual((False, None), cache.get("run-id", "attributes", "v1"))
+        cache.put("run-id", "attributes", "v1", ["b"])
+
+    def test_entries_of_other_client_version_are_missed(self):
+        # given
+        with patch("neptune.internal.backends.fetch_cache.__version__", "1.0.0"):
+            FetchCache(self.db_path).put("run-id", "attributes", "v1", ["a"])
+
+        # expect
+        with patch("neptune.internal.backends.fetch_cache.__version__", "1.1.0"):
+            self.assertEqual((False, None), FetchCache(self.db_path).get("run-id", "attributes", "v1"))
+
+    def test_replaced_entries_do_not_count_twice(self):
+        # given
+        cache = FetchCache(self.db_path, max_size=1500)
+
+        # when
+        for _ in range(3):
+            cache.put("run-id", "a", "v1", b"x" * 900)
+
+        # then
+        self.assertTrue(cache.get("run-id", "a", "v1")[0])
+        self.assertLess(cache._size, 1000)
+
+    def test_hits_are_written_in_batches(self):
+        # given
+        cache = FetchCache(self.db_path)
+        cache.TOUCH_BATCH_SIZE = 2
+        cache.put("run-id", "a", "v1", ["a"])
+        cache.put("run-id", "b", "v1", ["b"])
+
+        def last_used():
+            with sqlite3.connect(str(self.db_path)) as session:
+                return dict(session.execute("SELECT key, last_used FROM entries"))
+
+        stored_at = last_used()
+
+        # when
+        with patch("time.time", return_value=1000.0):
+            cache.get("run-id", "a", "v1")
+
+        # then
+        self.assertEqual(stored_at, last_used())
+
+        # when
+        with patch("time.time", return_value=1000.0):
+            cache.get("run-id", "b", "v1")
+
+        # then
+        self.assertEqual({"a": 1000.0, "b": 1000.0}, last_used())
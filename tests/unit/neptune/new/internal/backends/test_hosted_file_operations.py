@@ -16,6 +16,8 @@
 import json
 import os
 import random
+import threading
+import time
 import unittest
 import uuid
 from collections import namedtuple
@@ -31,10 +33,14 @@ from mock import (
     patch,
 )
 
+from neptune.common.storage.datastream import FileChunk
 from neptune.common.utils import IS_WINDOWS
 from neptune.internal.backends.api_model import ClientConfig
 from neptune.internal.backends.hosted_file_operations import (
     _get_content_disposition_filename,
+    _host_connection_limit,
+    _store_response_as_file,
+    _upload_parts,
     download_file_attribute,
     download_file_set_attribute,
     upload_file_attribute,
@@ -141,6 +147,39 @@ class TestCommonHostedFileOperations(HostedFileOperationsHelper):
         )
         store_response_mock.assert_called_once_with(download_raw.return_value, None)
 
+    def test_store_response_as_file(self):
+        with TemporaryDirectory() as tmp_dir:
+            # given
+            target_file = os.path.join(tmp_dir, "sample.file")
+            response_mock = MagicMock()
+            response_mock.headers = {"Content-Length": "6"}
+            response_mock.iter_content.return_value = [b"abc", b"def"]
+
+            # when
+            _store_response_as_file(response_mock, target_file)
+
+            # then
+            with open(target_file, "rb") as f:
+                self.assertEqual(b"abcdef", f.read())
+            self.assertEqual(["sample.file"], os.listdir(tmp_dir))
+
+    def test_store_response_as_file_overwrites_existing_files(self):
+        with TemporaryDirectory() as tmp_dir:
+            # given
+            target_file = os.path.join(tmp_dir, "sample.file")
+            with open(target_file, "wb") as f:
+                f.write(b"abcdef")
+            response_mock = MagicMock()
+            response_mock.headers = {"Content-Length": "6"}
+            response_mock.iter_content.return_value = [b"ghijkl"]
+
+            # when
+            _store_response_as_file(response_mock, target_file)
+
+            # then
+            with open(target_file, "rb") as f:
+                self.assertEqual(b"ghijkl", f.read())
+
 
 class TestNewUploadFileOperations(HostedFileOperationsHelper, BackendTestMixin):
     def __init__(self, *args, **kwargs):
@@ -494,5 +533,63 @@ class TestNewUploadFileOperations(HostedFileOperationsHelper, BackendTestMixin):
         )
 
 
+class TestUploadParts(unittest.TestCase):
+    @staticmethod
+    def _chunks(count):
+        return [FileChunk(data=bytes([idx]), start=idx, end=idx + 1) for idx in range(count)]
+
+    @patch("neptune.internal.backends.hosted_file_operations.UPLOAD_MAX_WORKERS", 3)
+    def test_parts_are_uploaded_concurrently_with_bounded_concurrency(self):
+        # given
+        lock = threading.Lock()
+        in_flight, max_in_flight, uploaded = 0, 0, []
+
+        def upload_part(idx, chunk):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+                uploaded.append((idx, chunk.data))
+
+        # when
+        _upload_parts(self._chunks(20), upload_part)
+
+        # then
+        self.assertEqual(uploaded[0], (0, bytes([0])))
+        self.assertEqual(sorted(uploaded), [(idx, bytes([idx])) for idx in range(20)])
+        self.assertLessEqual(max_in_flight, 3)
+
+    @patch("neptune.internal.backends.hosted_file_operations.UPLOAD_MAX_WORKERS", 3)
+    def test_failed_part_stops_upload(self):
+        # given
+        uploaded = []
+
+        def upload_part(idx, chunk):
+            if idx == 2:
+                raise ValueError("failed part")
+            uploaded.append(idx)
+
+        # when
+        with self.assertRaises(ValueError):
+            _upload_parts(iter(self._chunks(100)), upload_part)
+
+        # then
+        self.assertLess(len(uploaded), 99)
+
+    def test_host_connection_limit(self):
+        # expect
+        self.assertIs(
+            _host_connection_limit("https://ui.neptune.ai/upload?a=1"),
+            _host_connection_limit("https://ui.neptune.ai/upload/part"),
+        )
+        self.assertIsNot(
+            _host_connection_limit("https://ui.neptune.ai/upload"),
+            _host_connection_limit("https://storage.neptune.ai/upload"),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
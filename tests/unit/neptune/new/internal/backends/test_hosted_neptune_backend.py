@@ -14,8 +14,16 @@
 # limitations under the License.
 #
 import socket
+import time
 import unittest
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from types import SimpleNamespace
 from unittest.mock import call
 
 from bravado.exception import (
@@ -45,7 +53,16 @@ from neptune.internal.backends.hosted_client import (
     create_leaderboard_client,
     get_client_config,
 )
-from neptune.internal.backends.hosted_neptune_backend import HostedNeptuneBackend
+from neptune.internal.backends.hosted_neptune_backend import (
+    LEADERBOARD_SORT_KEY,
+    HostedNeptuneBackend,
+    _get_leaderboard_sort_key,
+)
+from neptune.internal.backends.nql import (
+    NQLAttributeOperator,
+    NQLQueryAggregate,
+    NQLQueryAttribute,
+)
 from neptune.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
 from neptune.internal.backends.utils import verify_host_resolution
 from neptune.internal.container_type import ContainerType
@@ -70,6 +87,66 @@ API_TOKEN = (
 credentials = Credentials.from_token(API_TOKEN)
 
 
+class TestIterAllItems(unittest.TestCase):
+    @staticmethod
+    def _item(idx: int, created: datetime):
+        attribute = SimpleNamespace(name=LEADERBOARD_SORT_KEY, datetimeProperties=SimpleNamespace(value=created))
+        return SimpleNamespace(experimentId=f"id-{idx}", attributes=[attribute])
+
+    @staticmethod
+    def _server(items):
+        """Pages items in reverse order, or sorted ones if asked to; the key condition is the last one of the query."""
+        queries = []
+
+        def get_portion(query, limit, offset, sort):
+            queries.append((query, sort))
+            if isinstance(query, NQLQueryAggregate):
+                query = list(query.items)[-1]
+            selected = items if sort else items[::-1]
+            if isinstance(query, NQLQueryAttribute) and query.operator == NQLAttributeOperator.GREATER_THAN_OR_EQUAL:
+                selected = [item for item in selected if _get_leaderboard_sort_key(item) >= query.value]
+            return selected[offset : offset + limit]
+
+        return get_portion, queries
+
+    def test_iterates_past_max_offset(self):
+        # given
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        # groups of three entries share a creation time, some of them on window boundaries
+        items = [self._item(idx, start + timedelta(milliseconds=idx // 3)) for idx in range(250)]
+        get_portion, queries = self._server(items)
+
+        # when
+        result = list(
+            HostedNeptuneBackend._iter_all_items(
+                get_portion, query=None, step=10, max_server_offset=100, pages_in_flight=3
+            )
+        )
+
+        # then
+        # the first window is in the order of the server, and the remaining entries are sorted
+        expected = [item.experimentId for item in items[::-1][:100]] + [item.experimentId for item in items[:150]]
+        self.assertEqual(expected, [item.experimentId for item in result])
+        self.assertEqual((None, False), queries[0])
+        self.assertIn((None, True), queries)
+        self.assertIn(
+            '(`sys/creation_time`:datetime >= "2023-01-01T00:00:00.033Z")', [str(q) for q, sort in queries if sort]
+        )
+
+    def test_stops_at_short_page(self):
+        # given
+        items = [self._item(idx, datetime(2023, 1, 1)) for idx in range(25)]
+        get_portion, queries = self._server(items)
+
+        # when
+        result = list(HostedNeptuneBackend._iter_all_items(get_portion, query=None, step=10, max_server_offset=100))
+
+        # then
+        self.assertEqual([item.experimentId for item in items[::-1]], [item.experimentId for item in result])
+        self.assertLessEqual(len(queries), 6)
+        self.assertEqual([False] * len(queries), [sort for _, sort in queries])
+
+
 @patch("neptune.internal.backends.hosted_client.RequestsClient", new=MagicMock())
 @patch("neptune.internal.backends.hosted_client.NeptuneAuthenticator", new=MagicMock())
 @patch("bravado.client.SwaggerClient.from_url")
@@ -287,6 +364,41 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                     any_order=True,
                 )
 
+    @patch("neptune.internal.backends.hosted_neptune_backend.upload_file_attribute")
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_upload_errors_keep_operation_order(self, upload_mock, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        uploaded = []
+
+        def upload(attribute, source, **kwargs):
+            uploaded.append((attribute, source))
+            return [FileUploadError(source, attribute)]
+
+        upload_mock.side_effect = upload
+
+        # when
+        _, errors = backend.execute_operations(
+            container_id=container_uuid,
+            container_type=ContainerType.RUN,
+            operations=[
+                UploadFile(path=["a"], ext="", file_path="/a1"),
+                UploadFile(path=["b"], ext="", file_path="/b1"),
+                UploadFile(path=["c"], ext="", file_path="/c1"),
+                UploadFile(path=["a"], ext="", file_path="/a2"),
+            ],
+            operation_storage=self.dummy_operation_storage,
+        )
+
+        # then
+        self.assertEqual(
+            [FileUploadError("/a2", "a"), FileUploadError("/b1", "b"), FileUploadError("/c1", "c")],
+            errors,
+        )
+        self.assertEqual(3, len(uploaded))
+
     @patch("neptune.internal.backends.hosted_neptune_backend.track_to_new_artifact")
     @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
     def test_track_to_new_artifact(self, track_to_new_artifact_mock, swagger_client_factory):
@@ -471,6 +583,48 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                     any_order=True,
                 )
 
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_api_clients_are_created_on_first_use(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+
+        # when
+        backend = HostedNeptuneBackend(credentials)
+
+        # then only the token clients, which are needed to authenticate, are created
+        spec_urls = [call_args[0][0] for call_args in swagger_client_factory.call_args_list]
+        self.assertTrue(all(url.endswith("/api/backend/swagger.json") for url in spec_urls))
+
+        # when
+        swagger_client_factory.reset_mock()
+        leaderboard_client = backend.leaderboard_client
+
+        # then
+        self.assertIs(leaderboard_client, backend.leaderboard_client)
+        swagger_client_factory.assert_called_once()
+        self.assertEqual("https://ui.neptune.ai/api/leaderboard/swagger.json", swagger_client_factory.call_args[0][0])
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_api_client_is_created_once_on_concurrent_first_use(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+
+        def create_client(*_):
+            time.sleep(0.05)
+            return MagicMock()
+
+        # when
+        with patch(
+            "neptune.internal.backends.hosted_neptune_backend.create_leaderboard_client", side_effect=create_client
+        ) as create_leaderboard_client:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(executor.map(lambda _: backend.leaderboard_client, range(8)))
+
+        # then
+        create_leaderboard_client.assert_called_once()
+        self.assertTrue(all(client is clients[0] for client in clients))
+
     @patch(
         "neptune.internal.backends.hosted_client.neptune_client_version",
         Version("0.5.13"),
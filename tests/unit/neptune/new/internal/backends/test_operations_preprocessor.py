@@ -29,6 +29,7 @@ from neptune.internal.operation import (
     DeleteAttribute,
     LogFloats,
     LogImages,
+    LogSeriesColumns,
     LogStrings,
     RemoveStrings,
     TrackFilesToArtifact,
@@ -201,6 +202,55 @@ class TestOperationsPreprocessor(TestAttributeBase):
         )
         self.assertEqual(processor.processed_ops_count, len(operations))
 
+    def test_series_operations_are_not_modified(self):
+        # given
+        operations = [
+            LogFloats(["a"], [FLog(1, 2, 3)]),
+            LogFloats(["a"], [FLog(10, 20, 30)]),
+            ClearFloatLog(["a"]),
+            LogFloats(["a"], [FLog(100, 200, 300)]),
+            LogFloats(["a"], [FLog(1000, 2000, 3000)]),
+        ]
+
+        # when
+        results = []
+        for _ in range(2):
+            processor = OperationsPreprocessor()
+            processor.process(operations)
+            results.append(processor.get_operations().other_operations)
+
+        # then
+        self.assertEqual(
+            results[0],
+            [
+                ClearFloatLog(["a"]),
+                LogFloats(["a"], [FLog(100, 200, 300), FLog(1000, 2000, 3000)]),
+            ],
+        )
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(operations[0], LogFloats(["a"], [FLog(1, 2, 3)]))
+        self.assertEqual(operations[3], LogFloats(["a"], [FLog(100, 200, 300)]))
+
+    def test_series_columns_are_merged(self):
+        # given
+        operations = [
+            LogFloats(["a"], LogSeriesColumns([1.0, 2.0], None, [3.0, 3.0])),
+            LogFloats(["a"], [FLog(10, 20, 30)]),
+            LogFloats(["a"], LogSeriesColumns([100.0], [200.0], [300.0])),
+        ]
+        processor = OperationsPreprocessor()
+
+        # when
+        processor.process(operations)
+
+        # then
+        result = processor.get_operations().other_operations
+        self.assertEqual(
+            [LogFloats(["a"], [FLog(1, None, 3), FLog(2, None, 3), FLog(10, 20, 30), FLog(100, 200, 300)])], result
+        )
+        self.assertIsInstance(result[0].values, LogSeriesColumns)
+        self.assertEqual(LogFloats(["a"], LogSeriesColumns([1.0, 2.0], None, [3.0, 3.0])), operations[0])
+
     def test_sets(self):
         # given
         processor = OperationsPreprocessor()
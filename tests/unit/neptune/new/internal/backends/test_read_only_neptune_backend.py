@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+from mock import (
+    MagicMock,
+    patch,
+)
+
+from neptune.internal.backends.fetch_cache import FetchCache
+from neptune.internal.backends.hosted_client import (
+    _get_token_client,
+    create_artifacts_client,
+    create_backend_client,
+    create_http_client_with_auth,
+    create_leaderboard_client,
+    get_client_config,
+)
+from neptune.internal.backends.read_only_neptune_backend import ReadOnlyNeptuneBackend
+from neptune.internal.backends.utils import verify_host_resolution
+from neptune.internal.container_type import ContainerType
+from neptune.internal.credentials import Credentials
+from tests.unit.neptune.backend_test_mixin import BackendTestMixin
+
+API_TOKEN = (
+    "eyJhcGlfYWRkcmVzcyI6Imh0dHBzOi8vYXBwLnN0YWdlLm5lcHR1bmUuYWkiLCJ"
+    "hcGlfa2V5IjoiOTJhNzhiOWQtZTc3Ni00ODlhLWI5YzEtNzRkYmI1ZGVkMzAyIn0="
+)
+
+credentials = Credentials.from_token(API_TOKEN)
+
+
+@patch("neptune.internal.backends.hosted_client.RequestsClient", new=MagicMock())
+@patch("neptune.internal.backends.hosted_client.NeptuneAuthenticator", new=MagicMock())
+@patch("bravado.client.SwaggerClient.from_url")
+@patch("platform.platform", new=lambda: "testPlatform")
+@patch("platform.python_version", new=lambda: "3.9.test")
+@patch("socket.gethostbyname", new=MagicMock(return_value="1.1.1.1"))
+class TestReadOnlyNeptuneBackend(unittest.TestCase, BackendTestMixin):
+    def setUp(self):
+        # Clear all LRU storage
+        verify_host_resolution.cache_clear()
+        _get_token_client.cache_clear()
+        get_client_config.cache_clear()
+        create_http_client_with_auth.cache_clear()
+        create_backend_client.cache_clear()
+        create_leaderboard_client.cache_clear()
+        create_artifacts_client.cache_clear()
+
+        self._dir = TemporaryDirectory()
+        self.fetch_cache = FetchCache(Path(self._dir.name) / "fetch_cache.db")
+
+    def tearDown(self):
+        self.fetch_cache.close()
+        self._dir.cleanup()
+
+    @staticmethod
+    def _set_modification_time(swagger_client, modification_time: datetime):
+        swagger_client.api.getDatetimeAttribute.return_value.response.return_value.result = SimpleNamespace(
+            value=modification_time
+        )
+
+    def test_series_values_are_fetched_once_per_container_version(self, swagger_client_factory):
+        # given
+        swagger_client = self._get_swagger_client_mock(swagger_client_factory)
+        self._set_modification_time(swagger_client, datetime(2023, 1, 1))
+        swagger_client.api.getFloatSeriesValues.return_value.response.return_value.result = SimpleNamespace(
+            totalItemCount=1, values=[SimpleNamespace(timestampMillis=1000, step=1, value=0.5)]
+        )
+        backend = ReadOnlyNeptuneBackend(credentials, fetch_cache=self.fetch_cache)
+
+        # when
+        first = backend.get_float_series_values("run-id", ContainerType.RUN, ["metrics", "loss"], 0, 1000)
+        second = backend.get_float_series_values("run-id", ContainerType.RUN, ["metrics", "loss"], 0, 1000)
+
+        # then
+        self.assertEqual(first, second)
+        self.assertEqual(1, swagger_client.api.getFloatSeriesValues.call_count)
+        self.assertEqual((1, 1), (self.fetch_cache.hits, self.fetch_cache.misses))
+
+        # when
+        self._set_modification_time(swagger_client, datetime(2023, 1, 2))
+        swagger_client.api.getExperimentAttributes.return_value.response.return_value.result = SimpleNamespace(
+            attributes=[]
+        )
+        backend.get_attributes("run-id", ContainerType.RUN)
+        backend.get_float_series_values("run-id", ContainerType.RUN, ["metrics", "loss"], 0, 1000)
+
+        # then
+        self.assertEqual(2, swagger_client.api.getFloatSeriesValues.call_count)
+
+    def test_cache_is_shared_between_backends(self, swagger_client_factory):
+        # given
+        swagger_client = self._get_swagger_client_mock(swagger_client_factory)
+        self._set_modification_time(swagger_client, datetime(2023, 1, 1))
+        swagger_client.api.getExperimentAttributes.return_value.response.return_value.result = SimpleNamespace(
+            attributes=[SimpleNamespace(name="params/lr", type="float")]
+        )
+
+        # when
+        for _ in range(3):
+            attributes = ReadOnlyNeptuneBackend(credentials, fetch_cache=self.fetch_cache).get_attributes(
+                "run-id", ContainerType.RUN
+            )
+
+        # then
+        self.assertEqual(["params/lr"], [attribute.path for attribute in attributes])
+        self.assertEqual(1, swagger_client.api.getExperimentAttributes.call_count)
+        self.assertEqual(3, swagger_client.api.getDatetimeAttribute.call_count)
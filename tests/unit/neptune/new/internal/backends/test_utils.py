@@ -15,7 +15,13 @@
 #
 import unittest
 import uuid
-from unittest.mock import Mock
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import (
+    MagicMock,
+    Mock,
+    patch,
+)
 
 from neptune.attributes import (
     Integer,
@@ -27,6 +33,7 @@ from neptune.internal.backends.neptune_backend import NeptuneBackend
 from neptune.internal.backends.utils import (
     ExecuteOperationsBatchingManager,
     build_operation_url,
+    create_swagger_client,
 )
 from neptune.internal.container_type import ContainerType
 
@@ -154,3 +161,56 @@ class TestExecuteOperationsBatchingManager(unittest.TestCase):
         self.assertEqual(operations[1:], batch.operations)
         self.assertEqual([backend.get_int_attribute.side_effect], batch.errors)
         self.assertEqual(1, batch.dropped_operations_count)
+
+
+class TestCreateSwaggerClient(unittest.TestCase):
+    SPEC = {"swagger": "2.0", "info": {"title": "test", "version": "1.0"}, "paths": {}}
+
+    def setUp(self):
+        self._dir = TemporaryDirectory()
+        patcher = patch(
+            "neptune.internal.backends.swagger_spec_cache._get_spec_path",
+            new=lambda url: Path(self._dir.name) / (str(uuid.uuid5(uuid.NAMESPACE_URL, url)) + ".json"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._dir.cleanup)
+
+    @patch("bravado.client.SwaggerClient.from_spec")
+    @patch("bravado.client.SwaggerClient.from_url")
+    def test_spec_is_downloaded_once_per_server_version(self, from_url, from_spec):
+        # given
+        from_url.return_value.swagger_spec.spec_dict = self.SPEC
+        http_client = MagicMock()
+
+        # when
+        create_swagger_client("https://neptune.test/api/backend/swagger.json", http_client, server_version="1")
+        client = create_swagger_client("https://neptune.test/api/backend/swagger.json", http_client, server_version="1")
+
+        # then
+        self.assertEqual(1, from_url.call_count)
+        self.assertEqual(from_spec.return_value, client)
+        self.assertEqual(self.SPEC, from_spec.call_args[0][0])
+        self.assertEqual("https://neptune.test/api/backend/swagger.json", from_spec.call_args[1]["origin_url"])
+
+        # when
+        create_swagger_client("https://neptune.test/api/backend/swagger.json", http_client, server_version="2")
+        create_swagger_client("https://neptune.test/api/leaderboard/swagger.json", http_client, server_version="2")
+
+        # then
+        self.assertEqual(3, from_url.call_count)
+
+    @patch("bravado.client.SwaggerClient.from_spec")
+    @patch("bravado.client.SwaggerClient.from_url")
+    def test_spec_is_not_cached_if_disabled(self, from_url, from_spec):
+        # given
+        from_url.return_value.swagger_spec.spec_dict = self.SPEC
+
+        # when
+        create_swagger_client("https://neptune.test/api/backend/swagger.json", MagicMock())
+        with patch("neptune.internal.backends.swagger_spec_cache.SWAGGER_SPEC_CACHE_TTL", new=-1):
+            create_swagger_client("https://neptune.test/api/backend/swagger.json", MagicMock())
+
+        # then
+        self.assertEqual(2, from_url.call_count)
+        from_spec.assert_not_called()
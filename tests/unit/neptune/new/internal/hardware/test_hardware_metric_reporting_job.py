@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+
+from mock import (
+    MagicMock,
+    patch,
+)
+
+from neptune import init_run
+from neptune.common.hardware.metrics.reports.metric_report import (
+    MetricReport,
+    MetricValue,
+)
+from neptune.internal.hardware.hardware_metric_reporting_job import HardwareMetricReportingJob
+from neptune.types import FloatSeries
+
+
+class TestHardwareMetricReportingJob(unittest.TestCase):
+    def test_reports_all_gauges_with_single_enqueue(self):
+        with init_run(mode="debug", capture_hardware_metrics=False) as run:
+            # given
+            job = HardwareMetricReportingJob(attribute_namespace="monitoring")
+            job._gauges_in_resource = {"cpu": 1, "gpu": 2}
+            paths = dict()
+            for resource_type, gauge_name in [("cpu", "cpu"), ("gpu", "0"), ("gpu", "1")]:
+                path = job.get_attribute_name(resource_type, gauge_name)
+                run[path] = FloatSeries([])
+                paths[(resource_type, gauge_name)] = path
+
+            reporter = MagicMock()
+            reporter.report.return_value = [
+                MetricReport(metric=MagicMock(resource_type="cpu"), values=[MetricValue(1.0, 0, "cpu", 50.0)]),
+                MetricReport(
+                    metric=MagicMock(resource_type="gpu"),
+                    values=[MetricValue(1.0, 0, "0", 10.0), MetricValue(1.0, 0, "1", 20.0)],
+                ),
+            ]
+            thread = HardwareMetricReportingJob.ReportingThread(10, run, reporter, paths)
+
+            # when
+            with patch.object(
+                run._op_processor, "enqueue_operations", wraps=run._op_processor.enqueue_operations
+            ) as enqueue_operations, patch.object(run._op_processor, "enqueue_operation") as enqueue_operation:
+                thread.work()
+
+            # then
+            enqueue_operations.assert_called_once()
+            enqueue_operation.assert_not_called()
+            self.assertEqual([50.0], list(run["monitoring/cpu"].fetch_values()["value"]))
+            self.assertEqual([10.0], list(run["monitoring/gpu_0"].fetch_values()["value"]))
+            self.assertEqual([20.0], list(run["monitoring/gpu_1"].fetch_values()["value"]))
+
+    def test_reports_to_fields_deleted_or_retyped_while_running(self):
+        with init_run(mode="debug", capture_hardware_metrics=False) as run:
+            # given
+            run["monitoring/cpu"] = FloatSeries([])
+            run["monitoring/memory"] = FloatSeries([])
+            reporter = MagicMock()
+            reporter.report.return_value = [
+                MetricReport(metric=MagicMock(resource_type="cpu"), values=[MetricValue(1.0, 0, "cpu", 50.0)]),
+                MetricReport(metric=MagicMock(resource_type="memory"), values=[MetricValue(1.0, 0, "ram", 2.0)]),
+            ]
+            paths = {("cpu", "cpu"): "monitoring/cpu", ("memory", "ram"): "monitoring/memory"}
+            thread = HardwareMetricReportingJob.ReportingThread(10, run, reporter, paths)
+
+            # when
+            del run["monitoring/cpu"]
+            del run["monitoring/memory"]
+            run["monitoring/memory"] = "retyped"
+            thread.work()
+
+            # then
+            self.assertEqual([50.0], list(run["monitoring/cpu"].fetch_values()["value"]))
+            self.assertEqual("retyped", run["monitoring/memory"].fetch())
@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from neptune.internal.container_type import ContainerType
+from neptune.internal.operation import AssignFloat
+from neptune.internal.operation_processors.async_operation_processor import AsyncOperationProcessor
+
+
+@pytest.fixture(name="backend")
+def backend_fixture():
+    backend = MagicMock()
+    backend.execute_operations.side_effect = lambda operations, **kwargs: (len(operations), [])
+    return backend
+
+
+@pytest.fixture(name="processor_factory")
+def processor_factory_fixture(tmp_path, monkeypatch, backend):
+    monkeypatch.chdir(tmp_path)
+
+    def factory(**kwargs) -> AsyncOperationProcessor:
+        return AsyncOperationProcessor(
+            container_id=str(uuid.uuid4()),
+            container_type=ContainerType.RUN,
+            backend=backend,
+            lock=threading.RLock(),
+            **kwargs,
+        )
+
+    return factory
+
+
+def test_flush_drains_ring_buffer(processor_factory):
+    # given
+    processor = processor_factory(ring_buffer_size=100)
+    operations = [AssignFloat(["x"], float(i)) for i in range(10)]
+
+    # when
+    for op in operations:
+        processor.enqueue_operation(op, wait=False)
+
+    # then
+    assert processor._queue.size() == 0
+
+    # when
+    processor.flush()
+
+    # then
+    assert [element.obj for element in processor._queue.get_batch(100)] == operations
+    processor.close()
+
+
+def test_caller_writes_to_disk_when_ring_buffer_is_full(processor_factory):
+    # given
+    processor = processor_factory(ring_buffer_size=3)
+
+    # when
+    for i in range(5):
+        processor.enqueue_operation(AssignFloat(["x"], float(i)), wait=False)
+
+    # then
+    assert processor._queue.size() == 3
+    assert len(processor._ring) == 2
+    processor.close()
+
+
+def test_wait_for_operations_from_ring_buffer(processor_factory, backend):
+    # given
+    processor = processor_factory()
+    processor.start()
+    operations = [AssignFloat(["x"], float(i)) for i in range(10)]
+
+    # when
+    for op in operations[:-1]:
+        processor.enqueue_operation(op, wait=False)
+    processor.enqueue_operation(operations[-1], wait=True)
+
+    # then
+    sent = [op for call in backend.execute_operations.call_args_list for op in call.kwargs["operations"]]
+    assert sent == operations
+    processor.stop()
+
+
+def test_enqueue_operations(processor_factory, backend):
+    # given
+    processor = processor_factory(ring_buffer_size=100)
+    processor.start()
+    operations = [AssignFloat(["x"], float(i)) for i in range(10)]
+
+    # when
+    processor.enqueue_operations(operations[:5], wait=False)
+    processor.enqueue_operations(operations[5:], wait=True)
+
+    # then
+    sent = [op for call in backend.execute_operations.call_args_list for op in call.kwargs["operations"]]
+    assert sent == operations
+    processor.stop()
+
+
+def test_wait_does_not_wait_for_next_cycle_after_idle_one(processor_factory, backend):
+    # given
+    processor = processor_factory(sleep_time=5, prefetch_depth=1)
+    processor.start()
+    time.sleep(0.2)
+
+    # when
+    start = time.monotonic()
+    processor.enqueue_operation(AssignFloat(["x"], 1.0), wait=True)
+
+    # then
+    assert time.monotonic() - start < 1
+    backend.execute_operations.assert_called_once()
+    processor.stop()
+
+
+def test_disk_write_error_is_raised_and_operations_are_kept_for_retry(processor_factory):
+    # given
+    processor = processor_factory(ring_buffer_size=100)
+    operations = [AssignFloat(["x"], float(i)) for i in range(3)]
+    for op in operations:
+        processor.enqueue_operation(op, wait=False)
+    put = processor._queue.put
+    processor._queue.put = MagicMock(side_effect=[put(operations[0]), OSError("No space left on device")])
+
+    # when
+    with pytest.raises(OSError):
+        processor.flush()
+
+    # then
+    assert list(processor._ring) == operations[1:]
+
+    # when
+    processor._queue.put = put
+    processor.flush()
+
+    # then
+    assert [element.obj for element in processor._queue.get_batch(100)] == operations
+    processor.close()
+
+
+def test_disk_write_error_in_writer_thread_is_raised_to_next_caller(processor_factory):
+    # given
+    processor = processor_factory(ring_buffer_size=100)
+    processor.enqueue_operation(AssignFloat(["x"], 1.0), wait=False)
+    put = processor._queue.put
+    processor._queue.put = MagicMock(side_effect=OSError("No space left on device"))
+
+    # when
+    processor._writer.work()
+
+    # then
+    with pytest.raises(OSError):
+        processor.enqueue_operation(AssignFloat(["x"], 2.0), wait=False)
+    processor._queue.put = put
+    processor.close()
@@ -87,6 +87,15 @@ class TestRunStructure(unittest.TestCase):
         with self.assertRaises(MetadataInconsistency):
             exp.pop(["some", "path"])
 
+    def test_iterate_attributes(self):
+        exp = ContainerStructure[int, dict]()
+        exp.set(["some", "path", "val"], 1)
+        exp.set(["some", "val"], 2)
+        exp.set(["val"], 3)
+        self.assertEqual(
+            sorted(exp.iterate_attributes()), [(["some", "path", "val"], 1), (["some", "val"], 2), (["val"], 3)]
+        )
+
 
 class TestIterateSubpaths(unittest.TestCase):
     project_uuid = str(uuid.uuid4())
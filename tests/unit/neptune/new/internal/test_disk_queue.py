@@ -20,11 +20,17 @@ import unittest
 from glob import glob
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import List
+
+from mock import patch
 
 from neptune.internal.disk_queue import (
     DiskQueue,
+    Durability,
     QueueElement,
+    SegmentFormat,
 )
+from neptune.internal.utils.sync_offset_file import SyncOffsetFile
 
 
 class TestDiskQueue(unittest.TestCase):
@@ -176,6 +182,121 @@ class TestDiskQueue(unittest.TestCase):
 
             queue.close()
 
+    def test_binary_format(self):
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+                max_file_size=300,
+                segment_format=SegmentFormat.BINARY,
+            )
+            for i in range(1, 101):
+                obj = TestDiskQueue.Obj(i, str(i))
+                queue.put(obj)
+            queue.flush()
+            batch = queue.get_batch(100)
+            self.assertEqual([element.obj for element in batch], [TestDiskQueue.Obj(i, str(i)) for i in range(1, 101)])
+            self.assertEqual([element.ver for element in batch], list(range(1, 101)))
+            queue.close()
+            self.assertTrue(len(glob(dirpath + "/data-*.log")) > 10)
+
+    def test_resuming_queue_in_different_format(self):
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+                segment_format=SegmentFormat.JSON,
+            )
+            for i in range(1, 11):
+                queue.put(TestDiskQueue.Obj(i, str(i)))
+            queue.flush()
+            queue.close()
+
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+                segment_format=SegmentFormat.BINARY,
+            )
+            for i in range(11, 21):
+                queue.put(TestDiskQueue.Obj(i, str(i)))
+            queue.flush()
+            self.assertEqual(len(glob(dirpath + "/data-*.log")), 2)
+            for i in range(1, 21):
+                self.assertEqual(queue.get().obj, TestDiskQueue.Obj(i, str(i)))
+            self.assertIsNone(queue.get())
+            queue.close()
+
+    def test_strict_durability(self):
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+                durability=Durability.STRICT,
+            )
+            with patch("neptune.internal.disk_queue.os.fsync") as fsync:
+                queue.put(TestDiskQueue.Obj(1, "1"))
+                self.assertTrue(fsync.called)
+
+            self.assertEqual(SyncOffsetFile(Path(dirpath) / "last_put_version", default=0).read(), 1)
+            self.assertEqual(self._read_versions(dirpath), [1])
+            queue.close()
+
+    def test_group_commit_durability(self):
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+                durability=Durability.GROUP_COMMIT,
+                group_commit_interval=3600,
+                group_commit_ops=10,
+            )
+            for i in range(1, 10):
+                queue.put(TestDiskQueue.Obj(i, str(i)))
+            self.assertEqual(SyncOffsetFile(Path(dirpath) / "last_put_version", default=0).read(), 0)
+            self.assertEqual(self._read_versions(dirpath), [])
+
+            queue.put(TestDiskQueue.Obj(10, "10"))
+            self.assertEqual(SyncOffsetFile(Path(dirpath) / "last_put_version", default=0).read(), 10)
+            self.assertEqual(self._read_versions(dirpath), list(range(1, 11)))
+
+            queue.put(TestDiskQueue.Obj(11, "11"))
+            queue.flush()
+            self.assertEqual(SyncOffsetFile(Path(dirpath) / "last_put_version", default=0).read(), 11)
+            self.assertEqual(self._read_versions(dirpath), list(range(1, 12)))
+            queue.close()
+
+    def test_dropped_queue_writes_buffered_records(self):
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+            )
+            for i in range(1, 4):
+                queue.put(TestDiskQueue.Obj(i, str(i)))
+            self.assertEqual(self._read_versions(dirpath), [])
+
+            del queue
+
+            self.assertEqual(SyncOffsetFile(Path(dirpath) / "last_put_version", default=0).read(), 3)
+            self.assertEqual(self._read_versions(dirpath), [1, 2, 3])
+
+    @staticmethod
+    def _read_versions(dirpath: str) -> List[int]:
+        with open(dirpath + "/data-1.log") as file:
+            return [json.loads(line)["version"] for line in file]
+
     @staticmethod
     def _serializer(obj: "TestDiskQueue.Obj") -> dict:
         return obj.__dict__
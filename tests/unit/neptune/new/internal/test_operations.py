@@ -18,7 +18,10 @@ import json
 import unittest
 import uuid
 
+import numpy as np
+
 from neptune.attributes import Integer
+from neptune.internal.backends.operation_api_object_converter import OperationApiObjectConverter
 from neptune.internal.operation import (
     AddStrings,
     AssignArtifact,
@@ -40,6 +43,7 @@ from neptune.internal.operation import (
     ImageValue,
     LogFloats,
     LogImages,
+    LogSeriesColumns,
     LogStrings,
     Operation,
     RemoveStrings,
@@ -65,11 +69,26 @@ class TestOperations(unittest.TestCase):
             if obj.__class__ in classes:
                 classes.remove(obj.__class__)
             deserialized_obj = Operation.from_dict(json.loads(json.dumps(obj.to_dict())))
-            self.assertEqual(obj.__dict__, deserialized_obj.__dict__)
+            self.assertEqual(obj, deserialized_obj)
 
         # expect no Operation subclass left
         self.assertEqual(classes, set())
 
+    def test_log_series_columns(self):
+        # given
+        columns = LogFloats(["a"], LogSeriesColumns(np.array([1.5, 2.5]), None, np.array([1.0, 2.0])))
+        expanded = LogFloats(["a"], [LogFloats.ValueType(1.5, None, 1.0), LogFloats.ValueType(2.5, None, 2.0)])
+
+        # when
+        data = json.loads(json.dumps(columns.to_dict()))
+
+        # then
+        self.assertEqual({"value": [1.5, 2.5], "step": None, "ts": [1.0, 2.0]}, data["columns"])
+        self.assertEqual(expanded, Operation.from_dict(data))
+        self.assertEqual(
+            OperationApiObjectConverter().convert(expanded), OperationApiObjectConverter().convert(columns)
+        )
+
     @staticmethod
     def _list_objects():
         now = datetime.now()
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import itertools
+import threading
+
+import pytest
+
+from neptune.internal.threading.prefetcher import Prefetcher
+
+
+@pytest.mark.parametrize("depth", [0, 1, 3])
+def test_results_are_returned_in_order(depth):
+    # given
+    counter = itertools.count()
+    prefetcher = Prefetcher(lambda: next(counter), depth=depth, name="test")
+
+    # expect
+    assert [prefetcher.get() for _ in range(10)] == list(range(10))
+    prefetcher.close()
+
+
+def test_fetches_ahead_in_background():
+    # given
+    fetched = []
+    release = threading.Event()
+
+    def fetch():
+        fetched.append(threading.current_thread().name)
+        if len(fetched) > 1:
+            release.wait(timeout=5)
+        return len(fetched)
+
+    prefetcher = Prefetcher(fetch, depth=1, name="test")
+
+    # when
+    first = prefetcher.get()
+
+    # then
+    assert first == 1
+    assert all(name.startswith("test") for name in fetched)
+
+    # cleanup
+    release.set()
+    assert prefetcher.get() == 2
+    prefetcher.close()
+
+
+def test_exceptions_are_propagated():
+    # given
+    def fetch():
+        raise ValueError("broken")
+
+    prefetcher = Prefetcher(fetch, depth=2, name="test")
+
+    # expect
+    with pytest.raises(ValueError):
+        prefetcher.get()
+    prefetcher.close()
+
+
+def test_empty_results_are_fetched_again():
+    # given
+    items = []
+    prefetcher = Prefetcher(lambda: [items.pop(0)] if items else [], depth=1, name="test")
+    assert prefetcher.get() == []
+
+    # when
+    items.append(1)
+
+    # then
+    assert prefetcher.get() == [1]
+
+    # when
+    items.append(2)
+
+    # then
+    assert prefetcher.get() == [2]
+    prefetcher.close()
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from neptune.internal.utils.binary_file_splitter import (
+    BINARY_SEGMENT_MAGIC,
+    BinaryFileSplitter,
+    encode_binary_record,
+    is_binary_segment,
+)
+
+
+class TestBinaryFileSplitter(unittest.TestCase):
+    def test_simple_file(self):
+        with TemporaryDirectory() as dirpath:
+            filename = os.path.join(dirpath, "data-1.log")
+            with open(filename, "wb") as fp:
+                fp.write(BINARY_SEGMENT_MAGIC)
+                fp.write(encode_binary_record({"a": 5, "b": "text"}))
+                fp.write(encode_binary_record({"a": [1.5, None]}))
+
+            splitter = BinaryFileSplitter(filename)
+            self.assertEqual(splitter.get(), {"a": 5, "b": "text"})
+            self.assertEqual(splitter.get(), {"a": [1.5, None]})
+            self.assertEqual(splitter.get(), None)
+            splitter.close()
+
+    def test_append_cut_record(self):
+        record = encode_binary_record({"q": 555, "r": "something"})
+        with TemporaryDirectory() as dirpath:
+            filename = os.path.join(dirpath, "data-1.log")
+            with open(filename, "wb") as fp:
+                fp.write(BINARY_SEGMENT_MAGIC)
+                fp.write(encode_binary_record({"a": 13}))
+                fp.write(record[:3])
+                fp.flush()
+
+                splitter = BinaryFileSplitter(filename)
+                self.assertEqual(splitter.get_with_size(), ({"a": 13}, len(encode_binary_record({"a": 13}))))
+                self.assertEqual(splitter.get(), None)
+
+                fp.write(record[3:-2])
+                fp.flush()
+                self.assertEqual(splitter.get(), None)
+
+                fp.write(record[-2:])
+                fp.flush()
+                self.assertEqual(splitter.get(), {"q": 555, "r": "something"})
+                self.assertEqual(splitter.get(), None)
+                splitter.close()
+
+    def test_format_detection(self):
+        with TemporaryDirectory() as dirpath:
+            filename = os.path.join(dirpath, "data-1.log")
+            with open(filename, "wb") as fp:
+                fp.flush()
+                self.assertIsNone(is_binary_segment(filename))
+                fp.write(BINARY_SEGMENT_MAGIC[:2])
+                fp.flush()
+                self.assertIsNone(is_binary_segment(filename))
+                fp.write(BINARY_SEGMENT_MAGIC[2:])
+                fp.flush()
+                self.assertTrue(is_binary_segment(filename))
+
+            with open(filename, "w") as fp:
+                fp.write('{"obj": {}, "version": 1}\n')
+            self.assertFalse(is_binary_segment(filename))
@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import unittest
+
+from neptune.internal.utils.download_manager import DownloadManager
+
+
+class TestDownloadManager(unittest.TestCase):
+    def test_runs_all_downloads_with_bounded_concurrency(self):
+        # given
+        lock = threading.Lock()
+        running, max_running, downloaded = [0], [0], []
+
+        def download(index):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+                downloaded.append(index)
+
+        # when
+        with DownloadManager(total=50, max_workers=4) as downloads:
+            for index in range(50):
+                downloads.submit(download, index)
+
+        # then
+        self.assertEqual(list(range(50)), sorted(downloaded))
+        self.assertLessEqual(max_running[0], 4)
+        self.assertGreater(max_running[0], 1)
+
+    def test_raises_error_and_cancels_remaining_downloads(self):
+        # given
+        downloaded = []
+
+        def download(index):
+            if index == 3:
+                raise ValueError("Download failed")
+            time.sleep(0.005)
+            downloaded.append(index)
+
+        # expect
+        with self.assertRaises(ValueError):
+            with DownloadManager(max_workers=2) as downloads:
+                for index in range(100):
+                    downloads.submit(download, index)
+
+        # and
+        self.assertLess(len(downloaded), 99)
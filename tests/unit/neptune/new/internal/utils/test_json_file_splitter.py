@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import json
+import mmap
 import unittest
 
+from mock import patch
+
 from neptune.internal.utils.json_file_splitter import JsonFileSplitter
 from tests.unit.neptune.new.utils.file_helpers import create_file
 
@@ -104,6 +108,7 @@ class TestJsonFileSplitter(unittest.TestCase):
             self.assertEqual(splitter.get(), None)
             splitter.close()
 
+    @patch.object(JsonFileSplitter, "WINDOW_SIZE", 16 * 1024)
     def test_big_json(self):
         content = """
 {
@@ -116,8 +121,8 @@ class TestJsonFileSplitter(unittest.TestCase):
 }
 {}
 """.lstrip() % (
-            "x" * JsonFileSplitter.BUFFER_SIZE * 2,
-            "y" * JsonFileSplitter.BUFFER_SIZE * 2,
+            "x" * JsonFileSplitter.WINDOW_SIZE * 2,
+            "y" * JsonFileSplitter.WINDOW_SIZE * 2,
         )
 
         with create_file(content) as filename:
@@ -126,14 +131,27 @@ class TestJsonFileSplitter(unittest.TestCase):
             self.assertEqual(
                 splitter.get(),
                 {
-                    "a": "x" * JsonFileSplitter.BUFFER_SIZE * 2,
-                    "b": "y" * JsonFileSplitter.BUFFER_SIZE * 2,
+                    "a": "x" * JsonFileSplitter.WINDOW_SIZE * 2,
+                    "b": "y" * JsonFileSplitter.WINDOW_SIZE * 2,
                 },
             )
             self.assertEqual(splitter.get(), {})
             self.assertEqual(splitter.get(), None)
             splitter.close()
 
+    @patch.object(JsonFileSplitter, "WINDOW_SIZE", 1024)
+    def test_many_windows(self):
+        objects = [{"num": i, "txt": "ąę" * (i % 7)} for i in range(1000)]
+        content = "".join(json.dumps(obj, ensure_ascii=False) + "\n" for obj in objects)
+
+        with create_file(content) as filename:
+            splitter = JsonFileSplitter(filename)
+            for obj in objects:
+                self.assertEqual(splitter.get(), obj)
+                self.assertLessEqual(len(splitter._map), 2 * JsonFileSplitter.WINDOW_SIZE + mmap.ALLOCATIONGRANULARITY)
+            self.assertEqual(splitter.get(), None)
+            splitter.close()
+
     def test_data_size(self):
         object1 = """{
                 "a": 5,
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import subprocess
+import sys
+import unittest
+
+
+def _imported_modules(statement: str) -> set:
+    """Returns names of the modules imported by `statement`, as reported by `python -X importtime`."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+    return {line.split("|")[-1].strip() for line in stderr.splitlines() if line.startswith("import time:")}
+
+
+class TestImportTime(unittest.TestCase):
+    HEAVY_MODULES = ["bravado", "bravado_core", "jsonschema", "pandas", "PIL", "boto3", "git", "psutil"]
+
+    def test_import_neptune_does_not_import_heavy_modules(self):
+        # when
+        modules = _imported_modules("import neptune")
+
+        # then
+        self.assertIn("neptune", modules)
+        self.assertEqual([], [module for module in self.HEAVY_MODULES if module in modules])
+        self.assertNotIn("neptune.metadata_containers", modules)
+
+    def test_metadata_containers_do_not_import_optional_modules(self):
+        # when
+        modules = _imported_modules("from neptune import ModelVersion")
+
+        # then
+        self.assertIn("neptune.metadata_containers", modules)
+        self.assertEqual([], [module for module in ["pandas", "PIL", "boto3", "git"] if module in modules])
+
+    def test_metadata_containers_are_imported_on_first_use(self):
+        # expect
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import neptune; from neptune.metadata_containers import Run;"
+                " assert neptune.init_run is neptune.Run is Run;"
+                " from neptune import *;"
+                " assert init_model_version is ModelVersion",
+            ],
+            check=True,
+        )
+
+    def test_subpackages_are_available_after_import_neptune(self):
+        # expect
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import neptune;"
+                " neptune.types.File; neptune.utils.stringify_unsupported; neptune.handler.Handler;"
+                " neptune.exceptions.NeptuneException; neptune.management.get_project_list;"
+                " assert not hasattr(neptune, 'no_such_module')",
+            ],
+            check=True,
+        )
+
+    def test_modules_can_be_imported_first(self):
+        for module in [
+            "neptune.handler",
+            "neptune.logging",
+            "neptune.internal.backends.neptune_backend",
+            "neptune.internal.streams.std_stream_capture_logger",
+        ]:
+            with self.subTest(module=module):
+                subprocess.run([sys.executable, "-c", f"import {module}"], check=True)